@@ -1,5 +1,11 @@
 from typing import Optional
+from aos8_api.cache import ReadCache
+from aos8_api.concurrency import ConcurrencyLimiter
+from aos8_api.ratelimit import RateLimiter
+from aos8_api.resilience import CircuitBreaker, RetryPolicy
+from aos8_api.session import SessionStore
 from aos8_api.ApiClient import AosApiClient
+from aos8_api.AsyncApiClient import AsyncAosApiClient
 
 class AosApiClientBuilder:
     """
@@ -15,6 +21,15 @@ class AosApiClientBuilder:
         self._base_url: Optional[str] = None
         self._verify_ssl: bool = False
         self._debug: bool = False
+        self._session_store: Optional[SessionStore] = None
+        self._lazy: bool = False
+        self._retry_policy: Optional[RetryPolicy] = None
+        self._circuit_breaker: Optional[CircuitBreaker] = None
+        self._rate_limiter: Optional[RateLimiter] = None
+        self._concurrency: Optional[ConcurrencyLimiter] = None
+        self._cache: Optional[ReadCache] = None
+        self._refresh: str = "full"
+        self._show_concurrency: int = 8
 
     def setUsername(self, username: str) -> 'AosApiClientBuilder':
         """
@@ -81,6 +96,133 @@ class AosApiClientBuilder:
         self._debug = debug
         return self
 
+    def setSessionStore(self, store: SessionStore) -> 'AosApiClientBuilder':
+        """
+        Reuse session cookies across runs through a persistent store.
+
+        Args:
+            store: A session store, e.g. `FileSessionStore` or `SqliteSessionStore`.
+
+        Returns:
+            The builder instance.
+        """
+        self._session_store = store
+        return self
+
+    def setLazy(self, lazy: bool) -> 'AosApiClientBuilder':
+        """
+        Enable or disable lazy mode.
+
+        In lazy mode `build()` returns immediately: the connection pool is created
+        and the login performed on the first request instead.
+
+        Args:
+            lazy: Whether to defer login until the first request.
+
+        Returns:
+            The builder instance.
+        """
+        self._lazy = lazy
+        return self
+
+    def setRetryPolicy(self, policy: RetryPolicy) -> 'AosApiClientBuilder':
+        """
+        Set the policy used to retry failed requests.
+
+        Args:
+            policy: A `RetryPolicy`, e.g. ``RetryPolicy(attempts=1)`` to disable retries.
+
+        Returns:
+            The builder instance.
+        """
+        self._retry_policy = policy
+        return self
+
+    def setCircuitBreaker(self, breaker: CircuitBreaker) -> 'AosApiClientBuilder':
+        """
+        Set the circuit breaker guarding the switch.
+
+        Clients built from the same builder share the breaker.
+
+        Args:
+            breaker: A `CircuitBreaker`.
+
+        Returns:
+            The builder instance.
+        """
+        self._circuit_breaker = breaker
+        return self
+
+    def setRateLimiter(self, limiter: RateLimiter) -> 'AosApiClientBuilder':
+        """
+        Limit the request rate and concurrency towards the switch.
+
+        Clients built from the same builder share the limiter's token buckets.
+
+        Args:
+            limiter: A `RateLimiter` with budgets for MIB and CLI requests.
+
+        Returns:
+            The builder instance.
+        """
+        self._rate_limiter = limiter
+        return self
+
+    def setConcurrencyLimiter(self, limiter: ConcurrencyLimiter) -> 'AosApiClientBuilder':
+        """
+        Limit the number of concurrent requests to the switch.
+
+        Args:
+            limiter: A `ConcurrencyLimiter`, e.g. `AdaptiveConcurrency` to learn the
+                window from observed latency and errors.
+
+        Returns:
+            The builder instance.
+        """
+        self._concurrency = limiter
+        return self
+
+    def setReadCache(self, cache: ReadCache) -> 'AosApiClientBuilder':
+        """
+        Cache MIB reads for a per-table time to live.
+
+        Args:
+            cache: A `ReadCache`.
+
+        Returns:
+            The builder instance.
+        """
+        self._cache = cache
+        return self
+
+    def setRefresh(self, mode: str) -> 'AosApiClientBuilder':
+        """
+        Set what write methods read back after a successful write, unless a call overrides it.
+
+        Args:
+            mode: "full" re-reads the whole table (the default), "row" reads only
+                the changed row, "none" returns the write result without a read.
+
+        Returns:
+            The builder instance.
+        """
+        self._refresh = mode
+        return self
+
+    def setShowConcurrency(self, limit: int) -> 'AosApiClientBuilder':
+        """
+        Set how many show commands may run at the same time when the ports of a
+        multi-port change are read back.
+
+        Args:
+            limit: Maximum number of concurrent show commands (default 8).
+
+        Returns:
+            The builder instance.
+        """
+        self._show_concurrency = limit
+        return self
+
     def build(self) -> AosApiClient:
         """
         Finalize the builder and return an instance of `AosApiClient`.
@@ -99,5 +241,46 @@ class AosApiClientBuilder:
             password=self._password,
             base_url=self._base_url,
             verify_ssl=self._verify_ssl,
-            debug=self._debug
+            debug=self._debug,
+            session_store=self._session_store,
+            lazy=self._lazy,
+            retry_policy=self._retry_policy,
+            circuit_breaker=self._circuit_breaker,
+            rate_limiter=self._rate_limiter,
+            concurrency=self._concurrency,
+            cache=self._cache,
+            refresh=self._refresh,
+            show_concurrency=self._show_concurrency
+        )
+
+    def buildAsync(self) -> AsyncAosApiClient:
+        """
+        Finalize the builder and return an instance of `AsyncAosApiClient`.
+
+        The async client logs in on its first request rather than here.
+
+        Returns:
+            A configured `AsyncAosApiClient` instance.
+
+        Raises:
+            ValueError: If any required fields are missing.
+        """
+        if not all([self._username, self._password, self._base_url]):
+            raise ValueError("Username, password, and base URL must all be set")
+
+        return AsyncAosApiClient(
+            username=self._username,
+            password=self._password,
+            base_url=self._base_url,
+            verify_ssl=self._verify_ssl,
+            debug=self._debug,
+            session_store=self._session_store,
+            lazy=self._lazy,
+            retry_policy=self._retry_policy,
+            circuit_breaker=self._circuit_breaker,
+            rate_limiter=self._rate_limiter,
+            concurrency=self._concurrency,
+            cache=self._cache,
+            refresh=self._refresh,
+            show_concurrency=self._show_concurrency
         )
@@ -1,5 +1,16 @@
+import threading
+import time
 import httpx
+from typing import Callable, Dict, Hashable, List, Optional
 from aos8_api.models import ApiResult
+from aos8_api.query import MibQuery
+from aos8_api.batch import batch_read
+from aos8_api.cache import ReadCache
+from aos8_api.concurrency import ConcurrencyLimiter
+from aos8_api.ratelimit import RateLimiter
+from aos8_api.resilience import CircuitBreaker, RetryPolicy
+from aos8_api.session import SessionStore, SessionTracker
+from aos8_api.endpoints.base import REFRESH_MODES, LazyEndpoint
 from aos8_api.endpoints.cli import CLIEndpoint
 from aos8_api.endpoints.vlan import VlanEndpoint
 from aos8_api.endpoints.vpa import VlanPortAssociation
@@ -8,6 +19,17 @@ from aos8_api.endpoints.system import SystemEndpoint
 from aos8_api.endpoints.interface import InterfaceEndpoint
 from aos8_api.endpoints.mvrp import MvrpEndpoint
 from aos8_api.endpoints.mac import MacLearningEndpoint
+from aos8_api.endpoints.chassis import ChassisEndpoint
+from aos8_api.endpoints.lacp import LACPEndpoint
+
+class _Flight:
+    """A GET request in flight whose result is shared by identical concurrent GETs."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Optional[ApiResult] = None
+        self.error: Optional[BaseException] = None
+
 
 class AosApiClient:
     """
@@ -17,40 +39,120 @@ class AosApiClient:
     GET, POST, PUT, and DELETE requests to various AOS8 API endpoints.
     """
 
-    def __init__(self, username: str, password: str, base_url: str, verify_ssl: bool = False, debug: bool = False):
+    cli = LazyEndpoint(CLIEndpoint)
+    vlan = LazyEndpoint(VlanEndpoint)
+    vpa = LazyEndpoint(VlanPortAssociation)
+    ip = LazyEndpoint(IPInterfaceEndpoint)
+    system = LazyEndpoint(SystemEndpoint)
+    interface = LazyEndpoint(InterfaceEndpoint)
+    mvrp = LazyEndpoint(MvrpEndpoint)
+    mac = LazyEndpoint(MacLearningEndpoint)
+    chassis = LazyEndpoint(ChassisEndpoint)
+    lacp = LazyEndpoint(LACPEndpoint)
+
+    def __init__(self, username: str, password: str, base_url: str, verify_ssl: bool = False, debug: bool = False,
+                 session_store: Optional[SessionStore] = None, lazy: bool = False,
+                 retry_policy: Optional[RetryPolicy] = None, circuit_breaker: Optional[CircuitBreaker] = None,
+                 rate_limiter: Optional[RateLimiter] = None, concurrency: Optional[ConcurrencyLimiter] = None,
+                 cache: Optional[ReadCache] = None, refresh: str = "full",
+                 show_concurrency: int = 8):
         """
         Initialize the AOS API client and log in.
 
+        When a session store holds a still-valid cookie for this switch and user,
+        it is reused and no login request is sent. In lazy mode nothing is sent
+        until the first request.
+
         Args:
             username: AOS API username.
             password: AOS API password.
             base_url: Base URL of the AOS device.
             verify_ssl: Whether to verify SSL certificates.
             debug: Enable debug logging.
+            session_store: Optional store used to reuse the session cookie across runs.
+            lazy: Defer creating the connection pool and logging in until the first request.
+            retry_policy: Retry policy for failed requests; by default GETs other than
+                configuration CLI commands are retried up to 3 times.
+            circuit_breaker: Circuit breaker for this switch; a new one is created by default.
+            rate_limiter: Limits on request rate and concurrency for this switch; unlimited by default.
+            concurrency: Concurrency limiter for this switch, e.g. `AdaptiveConcurrency`; unlimited by default.
+            cache: Optional cache for MIB reads.
+            refresh: What write methods read back after a successful write by default:
+                "full" (the whole table), "row" (only the changed row) or "none".
+            show_concurrency: Maximum number of show commands sent at the same time
+                when the ports of a multi-port change are read back.
         """
         self.username = username
         self.password = password
         self.base_url = base_url.rstrip('/')
         self.debug = debug
-        self._client = httpx.Client(
-            base_url=self.base_url,
-            verify=verify_ssl,
-            timeout=httpx.Timeout(10.0),
-            headers={
-                "Accept": "application/vnd.alcatellucentaos+json",
-                "User-Agent": "AOSApiClient/1.0"
-            }
-        )
-        self._login()
+        self._session = SessionTracker(self.base_url, username, session_store)
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.concurrency = concurrency or ConcurrencyLimiter()
+        self.cache = cache
+        if refresh not in REFRESH_MODES:
+            raise ValueError(f"refresh must be one of {', '.join(REFRESH_MODES)}")
+        self.refresh = refresh
+        if show_concurrency < 1:
+            raise ValueError("show_concurrency must be at least 1")
+        self.show_concurrency = show_concurrency
+        self._verify_ssl = verify_ssl
+        self._http: Optional[httpx.Client] = None
+        self._auth_lock = threading.Lock()
+        self._auth_generation = 0
+        self._inflight: Dict[Hashable, _Flight] = {}
+        self._inflight_lock = threading.Lock()
+        if not lazy:
+            self._authenticate()
+
+    @property
+    def _client(self) -> httpx.Client:
+        """
+        The HTTP connection pool, created on first use.
+        """
+        if self._http is None:
+            self._http = httpx.Client(
+                base_url=self.base_url,
+                verify=self._verify_ssl,
+                timeout=httpx.Timeout(10.0),
+                headers={
+                    "Accept": "application/vnd.alcatellucentaos+json",
+                    "User-Agent": "AOSApiClient/1.0"
+                }
+            )
+        return self._http
+
+    def _authenticate(self):
+        """
+        Reuse a cached session from the session store, or log in.
 
-        self.cli = CLIEndpoint(self)
-        self.vlan = VlanEndpoint(self)
-        self.vpa = VlanPortAssociation(self)
-        self.ip = IPInterfaceEndpoint(self)
-        self.system = SystemEndpoint(self)
-        self.interface = InterfaceEndpoint(self)
-        self.mvrp = MvrpEndpoint(self)
-        self.mac = MacLearningEndpoint(self)
+        Concurrent callers are serialized so only the first one authenticates.
+        """
+        with self._auth_lock:
+            if "wv_sess" in self._client.cookies:
+                return
+            if not self._session.restore(self._client.cookies):
+                self._login()
+
+    def _reauthenticate(self, generation: int):
+        """
+        Log in again after a 401, once per expired session.
+
+        The first caller holding a rejected session logs in; callers that were
+        rejected with the same session wait for it and then reuse the new cookie.
+
+        Args:
+            generation: Value of `_auth_generation` when the rejected request was sent.
+        """
+        with self._auth_lock:
+            if self._auth_generation != generation:
+                return
+            self._session.expired()
+            # Drop the rejected cookie so the fresh one cannot clash with it.
+            self._client.cookies.delete("wv_sess")
+            self._login()
 
     def _login(self):
         """
@@ -71,10 +173,16 @@ class AosApiClient:
             raise Exception("Login failed")
         if "wv_sess" not in self._client.cookies:
             raise Exception("Login succeeded but 'wv_sess' cookie not found")
+        self._auth_generation += 1
+        self._session.logged_in(self._client.cookies)
 
     def _request(self, method: str, path: str, **kwargs) -> httpx.Response:
         """
-        Send an HTTP request and handle re-authentication if necessary.
+        Send an HTTP request, retrying and re-authenticating as necessary.
+
+        Failed attempts are retried according to the client's retry policy. While
+        the switch's circuit breaker is open no request is sent at all. Each
+        attempt waits for the client's rate limiter and concurrency limiter.
 
         Args:
             method: HTTP method (GET, POST, etc.)
@@ -83,7 +191,17 @@ class AosApiClient:
 
         Returns:
             Response object.
+
+        Raises:
+            CircuitOpenError: If the switch is known to be down.
+            httpx.TransportError: If the last attempt could not reach the switch.
         """
+        params = kwargs.get("params")
+        if isinstance(params, MibQuery):
+            # Send the query string encoded when the query was built.
+            path = params.url(path)
+            kwargs = {key: value for key, value in kwargs.items() if key != "params"}
+
         if self.debug:
             print(f"➡️ {method} {path}")
             if "params" in kwargs:
@@ -93,17 +211,54 @@ class AosApiClient:
             if "json" in kwargs:
                 print("JSON:", kwargs["json"])
 
+        attempt = 0
+        while True:
+            attempt += 1
+            self.circuit_breaker.check(self.base_url)
+            try:
+                with self.rate_limiter.limit(path), self.concurrency.acquire(path) as sample:
+                    response = self._send(method, path, **kwargs)
+                    sample.status = response.status_code
+            except httpx.TransportError:
+                self.circuit_breaker.record_failure()
+                if self.circuit_breaker.state == CircuitBreaker.OPEN or not self.retry_policy.should_retry(method, attempt, None, path, kwargs.get("params")):
+                    raise
+            except BaseException:
+                self.circuit_breaker.record_abandoned()
+                raise
+            else:
+                self.circuit_breaker.record_success()
+                if not self.retry_policy.should_retry(method, attempt, response.status_code, path, kwargs.get("params")):
+                    break
+            delay = self.retry_policy.delay(attempt)
+            if self.debug:
+                print(f"🔁 Retrying {method} {path} in {delay:.2f}s")
+            time.sleep(delay)
+
+        if self.debug:
+            print("⬅️ Response:", response.status_code, response.text)
+
+        return self._handle_response(response)
+
+    def _send(self, method: str, path: str, **kwargs) -> httpx.Response:
+        """
+        Send a single attempt of a request, logging in first or again after a 401.
+        """
+        if "wv_sess" not in self._client.cookies:
+            self._authenticate()
+
+        generation = self._auth_generation
         response = self._client.request(method, path, **kwargs)
 
         if response.status_code == 401:
             print("🔁 401 Unauthorized. Re-authenticating...")
-            self._login()
+            self._reauthenticate(generation)
             response = self._client.request(method, path, **kwargs)
 
-        if self.debug:
-            print("⬅️ Response:", response.status_code, response.text)
+        if response.status_code != 401:
+            self._session.used(self._client.cookies)
 
-        return self._handle_response(response)
+        return response
 
     def _handle_response(self, response: httpx.Response) -> ApiResult:
         """
@@ -136,6 +291,11 @@ class AosApiClient:
         """
         Send a GET request.
 
+        With a read cache configured, cached MIB reads are returned without a
+        request; stale ones are refreshed in the background. Identical MIB reads (same path and query parameters) issued
+        while one is in flight wait for it and get a copy of its ApiResult instead
+        of sending another request.
+
         Args:
             path: API endpoint path.
             **kwargs: Additional parameters for the request.
@@ -143,7 +303,105 @@ class AosApiClient:
         Returns:
             Response object.
         """
-        return self._request("GET", path, **kwargs)
+        if self.cache is None:
+            return self._get_shared(path, **kwargs)
+
+        key = self.cache.key(path, kwargs, self.base_url)
+        if key is None:
+            try:
+                return self._get_shared(path, **kwargs)
+            finally:
+                self.cache.invalidate_for("GET", path, kwargs.get("params"), self.base_url)
+
+        result = self.cache.get(key)
+        if result is None:
+            generation = self.cache.generation
+            result = self._get_shared(path, **kwargs)
+            self.cache.put(key, result, generation)
+        elif self.cache.claim_refresh(key, result):
+            threading.Thread(target=self._refresh, args=(key, path), kwargs=kwargs, daemon=True).start()
+        return result
+
+    def _refresh(self, key, path: str, **kwargs):
+        """
+        Re-read a stale cache entry in the background.
+        """
+        try:
+            generation = self.cache.generation
+            self.cache.put(key, self._get_shared(path, **kwargs), generation)
+        except Exception as exc:
+            if self.debug:
+                print(f"⚠️ Background refresh of {path} failed: {exc}")
+        finally:
+            self.cache.refresh_done(key)
+
+    def _get_shared(self, path: str, **kwargs) -> httpx.Response:
+        """
+        Send a GET request, sharing it with identical GETs already in flight.
+        """
+        key = self._coalesce_key(path, kwargs)
+        if key is None:
+            return self._request("GET", path, **kwargs)
+
+        with self._inflight_lock:
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[key] = _Flight()
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            # Each caller gets its own data, so one caller's edits cannot leak into another's result.
+            return flight.result.copy()
+
+        try:
+            flight.result = self._request("GET", path, **kwargs)
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._inflight_lock:
+                if self._inflight.get(key) is flight:
+                    del self._inflight[key]
+            flight.done.set()
+        return flight.result
+
+    @staticmethod
+    def _coalesce_key(path: str, kwargs: dict) -> Optional[Hashable]:
+        """
+        Return the key identifying identical GET requests, or None if the request cannot be shared.
+
+        CLI commands are never shared: they are sent with GET but may change the configuration.
+        """
+        if path.startswith("/cli/") or set(kwargs) - {"params"}:
+            return None
+        params = kwargs.get("params")
+        if isinstance(params, MibQuery):
+            return path, params.key
+        return path, tuple(sorted(httpx.QueryParams(params).multi_items()))
+
+    def _forget_inflight(self):
+        """
+        Stop sharing the GETs in flight with later callers.
+
+        Called around writes: a read that started before a write may not reflect it.
+        """
+        with self._inflight_lock:
+            self._inflight.clear()
+
+    def _write(self, method: str, path: str, **kwargs) -> httpx.Response:
+        """
+        Send a request that changes the switch configuration.
+        """
+        self._forget_inflight()
+        try:
+            return self._request(method, path, **kwargs)
+        finally:
+            if self.cache is not None:
+                self.cache.invalidate_for(method, path, kwargs.get("params"), self.base_url)
+            self._forget_inflight()
 
     def post(self, path: str, data: dict = None, **kwargs) -> httpx.Response:
         """
@@ -158,7 +416,7 @@ class AosApiClient:
             Response object.
         """
         kwargs.setdefault("data", data)
-        return self._request("POST", path, **kwargs)
+        return self._write("POST", path, **kwargs)
 
     def put(self, path: str, data: dict = None, **kwargs) -> httpx.Response:
         """
@@ -173,7 +431,7 @@ class AosApiClient:
             Response object.
         """
         kwargs.setdefault("data", data)
-        return self._request("PUT", path, **kwargs)
+        return self._write("PUT", path, **kwargs)
 
     def delete(self, path: str, **kwargs) -> httpx.Response:
         """
@@ -186,10 +444,37 @@ class AosApiClient:
         Returns:
             Response object.
         """
-        return self._request("DELETE", path, **kwargs)
+        return self._write("DELETE", path, **kwargs)
+
+    def batch(self, *calls: Callable, max_urns: int = 8) -> List[ApiResult]:
+        """
+        Run several endpoint reads in as few round trips as possible.
+
+        Single-table MIB reads without filters are merged into multi-urn requests
+        (``urn=tableA|tableB``) and their responses split back per call.
+
+        Example:
+            temperature, fans = client.batch(
+                lambda c: c.chassis.temperature(),
+                lambda c: c.chassis.fanStatus(),
+            )
+
+        Args:
+            *calls: Functions taking a client and performing one endpoint read.
+            max_urns: Maximum number of tables per merged request.
+
+        Returns:
+            One ApiResult per call, in order.
+        """
+        return batch_read(self, calls, max_urns)
 
     def close(self):
         """
         Close the underlying HTTP connection pool.
+
+        The session cookie is saved first when a session store is configured.
         """
-        self._client.close()
+        if self._http is None:
+            return
+        self._session.save(self._http.cookies)
+        self._http.close()
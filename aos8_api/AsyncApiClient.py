@@ -0,0 +1,443 @@
+import asyncio
+import httpx
+from typing import Callable, Dict, Hashable, List, Optional, Set
+from aos8_api.models import ApiResult
+from aos8_api.query import MibQuery
+from aos8_api.batch import abatch_read
+from aos8_api.cache import ReadCache
+from aos8_api.concurrency import ConcurrencyLimiter
+from aos8_api.ratelimit import RateLimiter
+from aos8_api.resilience import CircuitBreaker, RetryPolicy
+from aos8_api.session import SessionStore, SessionTracker
+from aos8_api.ApiClient import AosApiClient
+from aos8_api.endpoints.base import REFRESH_MODES, LazyEndpoint
+from aos8_api.endpoints.cli import AsyncCLIEndpoint
+from aos8_api.endpoints.vlan import AsyncVlanEndpoint
+from aos8_api.endpoints.vpa import AsyncVlanPortAssociation
+from aos8_api.endpoints.ip import AsyncIPInterfaceEndpoint
+from aos8_api.endpoints.system import AsyncSystemEndpoint
+from aos8_api.endpoints.interface import AsyncInterfaceEndpoint
+from aos8_api.endpoints.mvrp import AsyncMvrpEndpoint
+from aos8_api.endpoints.mac import AsyncMacLearningEndpoint
+from aos8_api.endpoints.chassis import AsyncChassisEndpoint
+from aos8_api.endpoints.lacp import AsyncLACPEndpoint
+
+class AsyncAosApiClient:
+    """
+    Asyncio API client for interacting with Alcatel-Lucent OmniSwitch AOS8 HTTP API.
+
+    Mirrors `AosApiClient` on top of `httpx.AsyncClient`: the same endpoints are
+    available, every endpoint method is a coroutine and returns the same `ApiResult`.
+    Many clients can share one event loop, so a fleet can be polled without a
+    thread per in-flight request.
+
+    The client logs in on its first request (or when entering ``async with``)
+    unless a session store provides a cached cookie, and re-authenticates once
+    on a 401 response.
+
+    Example:
+        async with AsyncAosApiClient("admin", "switch", "https://192.168.70.1") as client:
+            result = await client.vlan.list()
+    """
+
+    cli = LazyEndpoint(AsyncCLIEndpoint)
+    vlan = LazyEndpoint(AsyncVlanEndpoint)
+    vpa = LazyEndpoint(AsyncVlanPortAssociation)
+    ip = LazyEndpoint(AsyncIPInterfaceEndpoint)
+    system = LazyEndpoint(AsyncSystemEndpoint)
+    interface = LazyEndpoint(AsyncInterfaceEndpoint)
+    mvrp = LazyEndpoint(AsyncMvrpEndpoint)
+    mac = LazyEndpoint(AsyncMacLearningEndpoint)
+    chassis = LazyEndpoint(AsyncChassisEndpoint)
+    lacp = LazyEndpoint(AsyncLACPEndpoint)
+
+    def __init__(self, username: str, password: str, base_url: str, verify_ssl: bool = False, debug: bool = False,
+                 session_store: Optional[SessionStore] = None, lazy: bool = False,
+                 retry_policy: Optional[RetryPolicy] = None, circuit_breaker: Optional[CircuitBreaker] = None,
+                 rate_limiter: Optional[RateLimiter] = None, concurrency: Optional[ConcurrencyLimiter] = None,
+                 cache: Optional[ReadCache] = None, refresh: str = "full",
+                 show_concurrency: int = 8):
+        """
+        Initialize the asynchronous AOS API client.
+
+        Args:
+            username: AOS API username.
+            password: AOS API password.
+            base_url: Base URL of the AOS device.
+            verify_ssl: Whether to verify SSL certificates.
+            debug: Enable debug logging.
+            session_store: Optional store used to reuse the session cookie across runs.
+            lazy: Defer creating the connection pool and logging in until the first request.
+            retry_policy: Retry policy for failed requests; by default GETs other than
+                configuration CLI commands are retried up to 3 times.
+            circuit_breaker: Circuit breaker for this switch; a new one is created by default.
+            rate_limiter: Limits on request rate and concurrency for this switch; unlimited by default.
+            concurrency: Concurrency limiter for this switch, e.g. `AdaptiveConcurrency`; unlimited by default.
+            cache: Optional cache for MIB reads.
+            refresh: What write methods read back after a successful write by default:
+                "full" (the whole table), "row" (only the changed row) or "none".
+            show_concurrency: Maximum number of show commands sent at the same time
+                when the ports of a multi-port change are read back.
+        """
+        self.username = username
+        self.password = password
+        self.base_url = base_url.rstrip('/')
+        self.debug = debug
+        self._session = SessionTracker(self.base_url, username, session_store)
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.concurrency = concurrency or ConcurrencyLimiter()
+        self.cache = cache
+        if refresh not in REFRESH_MODES:
+            raise ValueError(f"refresh must be one of {', '.join(REFRESH_MODES)}")
+        self.refresh = refresh
+        if show_concurrency < 1:
+            raise ValueError("show_concurrency must be at least 1")
+        self.show_concurrency = show_concurrency
+        self._verify_ssl = verify_ssl
+        self._http: Optional[httpx.AsyncClient] = None
+        self._auth_lock: Optional[asyncio.Lock] = None
+        self._auth_generation = 0
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self._background: Set[asyncio.Task] = set()
+        if not lazy:
+            self._session.restore(self._client.cookies)
+
+    async def __aenter__(self) -> 'AsyncAosApiClient':
+        if "wv_sess" not in self._client.cookies:
+            await self._authenticate()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    @property
+    def _client(self) -> httpx.AsyncClient:
+        """
+        The HTTP connection pool, created on first use.
+        """
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                base_url=self.base_url,
+                verify=self._verify_ssl,
+                timeout=httpx.Timeout(10.0),
+                headers={
+                    "Accept": "application/vnd.alcatellucentaos+json",
+                    "User-Agent": "AOSApiClient/1.0"
+                }
+            )
+        return self._http
+
+    async def _authenticate(self):
+        """
+        Reuse a cached session from the session store, or log in.
+
+        Concurrent callers are serialized so only the first one authenticates.
+        """
+        if self._auth_lock is None:
+            self._auth_lock = asyncio.Lock()
+        async with self._auth_lock:
+            if "wv_sess" in self._client.cookies:
+                return
+            if not self._session.restore(self._client.cookies):
+                await self._login()
+
+    async def _reauthenticate(self, generation: int):
+        """
+        Log in again after a 401, once per expired session.
+
+        The first caller holding a rejected session logs in; callers that were
+        rejected with the same session wait for it and then reuse the new cookie.
+
+        Args:
+            generation: Value of `_auth_generation` when the rejected request was sent.
+        """
+        if self._auth_lock is None:
+            self._auth_lock = asyncio.Lock()
+        async with self._auth_lock:
+            if self._auth_generation != generation:
+                return
+            self._session.expired()
+            # Drop the rejected cookie so the fresh one cannot clash with it.
+            self._client.cookies.delete("wv_sess")
+            await self._login()
+
+    async def _login(self):
+        """
+        Authenticate with the AOS API using provided credentials.
+
+        Raises:
+            Exception: If login fails or session cookie is not returned.
+        """
+        url = f"/auth/"
+        params = {
+            "username": self.username,
+            "password": self.password,
+        }
+        response = await self._client.get(url, params=params)
+        if self.debug:
+            print(f"🔐 Login response {response.status_code}: {response.text}")
+        if response.status_code != 200:
+            raise Exception("Login failed")
+        if "wv_sess" not in self._client.cookies:
+            raise Exception("Login succeeded but 'wv_sess' cookie not found")
+        self._auth_generation += 1
+        self._session.logged_in(self._client.cookies)
+
+    async def _request(self, method: str, path: str, **kwargs) -> ApiResult:
+        """
+        Send an HTTP request, retrying and re-authenticating as necessary.
+
+        Failed attempts are retried according to the client's retry policy. While
+        the switch's circuit breaker is open no request is sent at all. Each
+        attempt waits for the client's rate limiter and concurrency limiter.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            path: API endpoint path.
+            **kwargs: Additional httpx request arguments.
+
+        Returns:
+            Parsed ApiResult object.
+
+        Raises:
+            CircuitOpenError: If the switch is known to be down.
+            httpx.TransportError: If the last attempt could not reach the switch.
+        """
+        params = kwargs.get("params")
+        if isinstance(params, MibQuery):
+            # Send the query string encoded when the query was built.
+            path = params.url(path)
+            kwargs = {key: value for key, value in kwargs.items() if key != "params"}
+
+        if self.debug:
+            print(f"➡️ {method} {path}")
+            if "params" in kwargs:
+                print("Params:", kwargs["params"])
+            if "data" in kwargs:
+                print("Form Data:", kwargs["data"])
+            if "json" in kwargs:
+                print("JSON:", kwargs["json"])
+
+        attempt = 0
+        while True:
+            attempt += 1
+            self.circuit_breaker.check(self.base_url)
+            try:
+                async with self.rate_limiter.limit_async(path), self.concurrency.acquire_async(path) as sample:
+                    response = await self._send(method, path, **kwargs)
+                    sample.status = response.status_code
+            except httpx.TransportError:
+                self.circuit_breaker.record_failure()
+                if self.circuit_breaker.state == CircuitBreaker.OPEN or not self.retry_policy.should_retry(method, attempt, None, path, kwargs.get("params")):
+                    raise
+            except BaseException:
+                self.circuit_breaker.record_abandoned()
+                raise
+            else:
+                self.circuit_breaker.record_success()
+                if not self.retry_policy.should_retry(method, attempt, response.status_code, path, kwargs.get("params")):
+                    break
+            delay = self.retry_policy.delay(attempt)
+            if self.debug:
+                print(f"🔁 Retrying {method} {path} in {delay:.2f}s")
+            await asyncio.sleep(delay)
+
+        if self.debug:
+            print("⬅️ Response:", response.status_code, response.text)
+
+        return self._handle_response(response)
+
+    async def _send(self, method: str, path: str, **kwargs) -> httpx.Response:
+        """
+        Send a single attempt of a request, logging in first or again after a 401.
+        """
+        if "wv_sess" not in self._client.cookies:
+            await self._authenticate()
+
+        generation = self._auth_generation
+        response = await self._client.request(method, path, **kwargs)
+
+        if response.status_code == 401:
+            print("🔁 401 Unauthorized. Re-authenticating...")
+            await self._reauthenticate(generation)
+            response = await self._client.request(method, path, **kwargs)
+
+        if response.status_code != 401:
+            self._session.used(self._client.cookies)
+
+        return response
+
+    # Response decoding is transport independent, share it with the sync client.
+    _handle_response = AosApiClient._handle_response
+
+    async def get(self, path: str, **kwargs) -> ApiResult:
+        """
+        Send a GET request.
+
+        With a read cache configured, cached MIB reads are returned without a
+        request; stale ones are refreshed in the background. Identical MIB reads (same path and query parameters) issued
+        while one is in flight wait for it and get a copy of its ApiResult instead
+        of sending another request.
+
+        Args:
+            path: API endpoint path.
+            **kwargs: Additional parameters for the request.
+
+        Returns:
+            Parsed ApiResult object.
+        """
+        if self.cache is None:
+            return await self._get_shared(path, **kwargs)
+
+        key = self.cache.key(path, kwargs, self.base_url)
+        if key is None:
+            try:
+                return await self._get_shared(path, **kwargs)
+            finally:
+                self.cache.invalidate_for("GET", path, kwargs.get("params"), self.base_url)
+
+        result = self.cache.get(key)
+        if result is None:
+            generation = self.cache.generation
+            result = await self._get_shared(path, **kwargs)
+            self.cache.put(key, result, generation)
+        elif self.cache.claim_refresh(key, result):
+            task = asyncio.ensure_future(self._refresh(key, path, **kwargs))
+            self._background.add(task)
+            task.add_done_callback(self._background.discard)
+        return result
+
+    async def _refresh(self, key, path: str, **kwargs):
+        """
+        Re-read a stale cache entry in the background.
+        """
+        try:
+            generation = self.cache.generation
+            self.cache.put(key, await self._get_shared(path, **kwargs), generation)
+        except Exception as exc:
+            if self.debug:
+                print(f"⚠️ Background refresh of {path} failed: {exc}")
+        finally:
+            self.cache.refresh_done(key)
+
+    async def _get_shared(self, path: str, **kwargs) -> ApiResult:
+        """
+        Send a GET request, sharing it with identical GETs already in flight.
+        """
+        key = self._coalesce_key(path, kwargs)
+        if key is None:
+            return await self._request("GET", path, **kwargs)
+
+        future = self._inflight.get(key)
+        leader = future is None
+        if leader:
+            future = self._inflight[key] = asyncio.ensure_future(self._request("GET", path, **kwargs))
+            future.add_done_callback(lambda f: self._flight_done(key, f))
+        # A cancelled caller must not cancel the request other callers are waiting for.
+        result = await asyncio.shield(future)
+        # Each caller gets its own data, so one caller's edits cannot leak into another's result.
+        return result if leader else result.copy()
+
+    _coalesce_key = staticmethod(AosApiClient._coalesce_key)
+
+    def _flight_done(self, key: Hashable, future: asyncio.Future):
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+        if not future.cancelled():
+            # Mark the error as retrieved in case every caller was cancelled.
+            future.exception()
+
+    async def _write(self, method: str, path: str, **kwargs) -> ApiResult:
+        """
+        Send a request that changes the switch configuration.
+
+        Reads in flight stop being shared, as they may not reflect the write.
+        """
+        self._inflight.clear()
+        try:
+            return await self._request(method, path, **kwargs)
+        finally:
+            if self.cache is not None:
+                self.cache.invalidate_for(method, path, kwargs.get("params"), self.base_url)
+            self._inflight.clear()
+
+    async def post(self, path: str, data: dict = None, **kwargs) -> ApiResult:
+        """
+        Send a POST request.
+
+        Args:
+            path: API endpoint path.
+            data: Dictionary to send in the body.
+            **kwargs: Additional parameters for the request.
+
+        Returns:
+            Parsed ApiResult object.
+        """
+        kwargs.setdefault("data", data)
+        return await self._write("POST", path, **kwargs)
+
+    async def put(self, path: str, data: dict = None, **kwargs) -> ApiResult:
+        """
+        Send a PUT request.
+
+        Args:
+            path: API endpoint path.
+            data: Dictionary to send in the body.
+            **kwargs: Additional parameters for the request.
+
+        Returns:
+            Parsed ApiResult object.
+        """
+        kwargs.setdefault("data", data)
+        return await self._write("PUT", path, **kwargs)
+
+    async def delete(self, path: str, **kwargs) -> ApiResult:
+        """
+        Send a DELETE request.
+
+        Args:
+            path: API endpoint path.
+            **kwargs: Additional parameters for the request.
+
+        Returns:
+            Parsed ApiResult object.
+        """
+        return await self._write("DELETE", path, **kwargs)
+
+    async def batch(self, *calls: Callable, max_urns: int = 8) -> List[ApiResult]:
+        """
+        Run several endpoint reads in as few round trips as possible.
+
+        Single-table MIB reads without filters are merged into multi-urn requests
+        (``urn=tableA|tableB``) and their responses split back per call.
+
+        Example:
+            temperature, fans = await client.batch(
+                lambda c: c.chassis.temperature(),
+                lambda c: c.chassis.fanStatus(),
+            )
+
+        Args:
+            *calls: Functions taking a client and performing one endpoint read.
+            max_urns: Maximum number of tables per merged request.
+
+        Returns:
+            One ApiResult per call, in order.
+        """
+        return await abatch_read(self, calls, max_urns)
+
+    async def close(self):
+        """
+        Close the underlying HTTP connection pool.
+
+        Pending background refreshes are cancelled. The session cookie is saved
+        first when a session store is configured.
+        """
+        for task in list(self._background):
+            task.cancel()
+        if self._http is None:
+            return
+        self._session.save(self._http.cookies)
+        await self._http.aclose()
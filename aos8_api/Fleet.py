@@ -0,0 +1,145 @@
+import asyncio
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple, Union
+from aos8_api.models import ApiResult
+from aos8_api.ApiBuilder import AosApiClientBuilder
+from aos8_api.AsyncApiClient import AsyncAosApiClient
+
+SwitchSpec = Union[AosApiClientBuilder, AsyncAosApiClient, Dict[str, Any]]
+
+
+class FleetCall:
+    """
+    A pending fan-out of one call across every switch of an `AosFleet`.
+
+    Iterate with ``async for`` to receive ``(base_url, ApiResult)`` pairs as each
+    switch completes, or ``await`` it to get a dictionary keyed by base URL in
+    fleet order.
+    """
+
+    def __init__(self, fleet: 'AosFleet', call: Callable[[AsyncAosApiClient], Awaitable[ApiResult]]):
+        self._fleet = fleet
+        self._call = call
+
+    async def __aiter__(self) -> AsyncIterator[Tuple[str, ApiResult]]:
+        tasks = [asyncio.ensure_future(self._fleet._run_one(client, self._call)) for client in self._fleet.clients]
+        try:
+            for future in asyncio.as_completed(tasks):
+                yield await future
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def __await__(self):
+        return self._collect().__await__()
+
+    async def _collect(self) -> Dict[str, ApiResult]:
+        results = dict.fromkeys(client.base_url for client in self._fleet.clients)
+        async for base_url, result in self:
+            results[base_url] = result
+        return results
+
+
+class _EndpointProxy:
+    """Forward ``fleet.<endpoint>.<method>(...)`` to the same endpoint on every switch."""
+
+    def __init__(self, fleet: 'AosFleet', endpoint: str):
+        self._fleet = fleet
+        self._endpoint = endpoint
+
+    def __getattr__(self, method: str) -> Callable[..., FleetCall]:
+        def fan_out(*args, **kwargs) -> FleetCall:
+            return self._fleet.map(
+                lambda client: getattr(getattr(client, self._endpoint), method)(*args, **kwargs)
+            )
+        return fan_out
+
+
+class AosFleet:
+    """
+    Run the same API call against many OmniSwitches with bounded concurrency.
+
+    Every endpoint of `AsyncAosApiClient` is available on the fleet, for example
+    ``fleet.interface.statistic_traffic()``. Switches are polled concurrently,
+    at most `concurrency` at a time, and each switch is given `timeout` seconds.
+    A switch that fails, raises or exceeds its deadline yields an unsuccessful
+    `ApiResult` instead of aborting the sweep.
+
+    Example:
+        async with AosFleet(builders, concurrency=64, timeout=15) as fleet:
+            async for base_url, result in fleet.interface.statistic_traffic():
+                print(base_url, result.success)
+    """
+
+    ENDPOINTS = ("cli", "vlan", "vpa", "ip", "system", "interface", "mvrp", "mac", "chassis", "lacp")
+
+    def __init__(self, switches: Iterable[SwitchSpec], concurrency: int = 32, timeout: Optional[float] = None):
+        """
+        Initialize the fleet.
+
+        Args:
+            switches: Switches to manage. Each entry is an `AosApiClientBuilder`, an
+                `AsyncAosApiClient`, or a dict of `AsyncAosApiClient` keyword arguments
+                (username, password, base_url, verify_ssl, debug).
+            concurrency: Maximum number of switches worked on at the same time.
+            timeout: Per-switch deadline in seconds, or None for no deadline.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self.clients: List[AsyncAosApiClient] = [self._make_client(spec) for spec in switches]
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    @staticmethod
+    def _make_client(spec: SwitchSpec) -> AsyncAosApiClient:
+        if isinstance(spec, AsyncAosApiClient):
+            return spec
+        if isinstance(spec, AosApiClientBuilder):
+            return spec.buildAsync()
+        if isinstance(spec, dict):
+            return AsyncAosApiClient(**spec)
+        raise TypeError(f"Unsupported switch specification: {type(spec).__name__}")
+
+    async def __aenter__(self) -> 'AosFleet':
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    def __getattr__(self, name: str) -> _EndpointProxy:
+        if name in self.ENDPOINTS:
+            return _EndpointProxy(self, name)
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    def map(self, call: Callable[[AsyncAosApiClient], Awaitable[ApiResult]]) -> FleetCall:
+        """
+        Fan out an arbitrary coroutine across the fleet.
+
+        Args:
+            call: Function taking an `AsyncAosApiClient` and returning an awaitable ApiResult.
+
+        Returns:
+            A `FleetCall` to iterate over or await.
+        """
+        return FleetCall(self, call)
+
+    async def _run_one(self, client: AsyncAosApiClient, call) -> Tuple[str, ApiResult]:
+        """
+        Run one call on one switch, converting failures into an ApiResult.
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        async with self._semaphore:
+            try:
+                result = await asyncio.wait_for(call(client), self.timeout)
+            except asyncio.TimeoutError:
+                result = ApiResult(success=False, diag=408, error=f"Deadline of {self.timeout}s exceeded")
+            except Exception as exc:
+                result = ApiResult(success=False, diag=0, error=f"{type(exc).__name__}: {exc}")
+        return client.base_url, result
+
+    async def close(self):
+        """
+        Close the HTTP connection pools of every switch.
+        """
+        await asyncio.gather(*(client.close() for client in self.clients), return_exceptions=True)
@@ -0,0 +1,256 @@
+import asyncio
+import re
+from collections import OrderedDict
+from itertools import islice
+from typing import Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from aos8_api.endpoints.base import AsyncEndpointMixin, LazyEndpoint
+from aos8_api.models import ApiResult
+from aos8_api.query import MibQuery
+
+# Parameters a single-table read may use to be merged with other reads.
+_MERGEABLE_PARAMS = re.compile(r"^(domain|urn|mibObject\d+|function|object|limit|ignoreError)$")
+
+
+class _NotBatchable(Exception):
+    pass
+
+
+def _rename(row: Dict, renames: Dict[str, Optional[str]], keep: Optional[set] = None) -> Dict:
+    """
+    Rename the keys of `row` per `renames`, dropping keys renamed to None.
+
+    With `keep`, keys that are neither renamed nor listed in `keep` are dropped too.
+    """
+    renamed = {}
+    for key, value in row.items():
+        if key in renames:
+            key = renames[key]
+        elif keep is not None and key not in keep:
+            continue
+        if key is not None:
+            renamed[key] = value
+    return renamed
+
+
+class _Read:
+    """One recorded single-table MIB read."""
+
+    def __init__(self, index: int, query: Mapping):
+        self.index = index
+        self.query = query
+        params = {key: str(value) for key, value in query.items()}
+        self.params = params
+        self.urn = params["urn"]
+        self.columns = [params[key] for key in sorted(
+            (key for key in params if key.startswith("mibObject")), key=lambda key: int(key[9:]))]
+        self.functions = params["function"].split("|") if params.get("function") else []
+        objects = params["object"].split("|") if "object" in params else []
+        self.objects = objects + [""] * (len(self.functions) - len(objects))
+        self.limit = int(params["limit"]) if "limit" in params else None
+
+    def shifted_objects(self, offset: int) -> List[str]:
+        """
+        Return the function arguments with references to earlier function outputs
+        (``<function>_<position>``) moved to the functions' position in a merged request.
+        """
+        shifted = []
+        for argument in self.objects:
+            names = []
+            for name in argument.split(","):
+                ref, _, position = name.rpartition("_")
+                if position.isdigit() and int(position) < len(self.functions) and self.functions[int(position)] == ref:
+                    name = f"{ref}_{int(position) + offset}"
+                names.append(name)
+            shifted.append(",".join(names))
+        return shifted
+
+
+class _QueryRecorder:
+    """
+    Stand-in client that records the GET an endpoint method would send.
+
+    Endpoints are the synchronous classes of the real client's endpoints, so
+    recording never needs an event loop.
+    """
+
+    _PENDING = ApiResult(success=False, diag=0, error="Batched read not sent")
+
+    def __init__(self, client):
+        self._real = client
+        self.queries: List[Tuple[str, Mapping, dict]] = []
+
+    def __getattr__(self, name: str):
+        attr = getattr(type(self._real), name, None)
+        if not isinstance(attr, LazyEndpoint):
+            raise AttributeError(name)
+        endpoint_class = attr.endpoint_class
+        if issubclass(endpoint_class, AsyncEndpointMixin):
+            endpoint_class = next(c for c in endpoint_class.__mro__ if not issubclass(c, AsyncEndpointMixin))
+        endpoint = self.__dict__[name] = endpoint_class(self)
+        return endpoint
+
+    def get(self, path: str, params: Optional[dict] = None, **kwargs) -> ApiResult:
+        self.queries.append((path, params if isinstance(params, MibQuery) else dict(params or {}), kwargs))
+        return self._PENDING
+
+    def _write(self, *args, **kwargs):
+        raise _NotBatchable()
+
+    post = put = delete = _write
+
+
+class _BatchPlan:
+    """
+    Merge the reads of a batch into as few multi-urn requests as possible.
+
+    Reads that cannot be merged (writes, several requests, filters, CLI
+    commands, ...) are sent on their own.
+    """
+
+    def __init__(self, client, calls: Sequence[Callable], max_urns: int):
+        if max_urns < 1:
+            raise ValueError("max_urns must be at least 1")
+        self.direct: List[int] = []
+        self.requests: List[Tuple[Mapping, List[Tuple[_Read, int]]]] = []
+        by_urn: "OrderedDict[str, List[_Read]]" = OrderedDict()
+        for index, call in enumerate(calls):
+            read = self._record(client, index, call)
+            if read is None:
+                self.direct.append(index)
+            else:
+                by_urn.setdefault(read.urn, []).append(read)
+
+        urns = list(by_urn)
+        for start in range(0, len(urns), max_urns):
+            chunk = [by_urn[urn] for urn in urns[start:start + max_urns]]
+            if len(chunk) == 1 and len(chunk[0]) == 1:
+                read = chunk[0][0]
+                self.requests.append((read.query, [(read, -1)]))
+            else:
+                self.requests.append(self._merge(chunk))
+
+    @staticmethod
+    def _record(client, index: int, call: Callable) -> Optional[_Read]:
+        recorder = _QueryRecorder(client)
+        try:
+            returned = call(recorder)
+        except Exception:
+            return None
+        if returned is not _QueryRecorder._PENDING or len(recorder.queries) != 1:
+            return None
+        path, params, kwargs = recorder.queries[0]
+        if path != "/" or kwargs or params.get("domain") != "mib" or "|" in params.get("urn", "|"):
+            return None
+        if not all(_MERGEABLE_PARAMS.match(key) for key in params):
+            return None
+        return _Read(index, params)
+
+    @staticmethod
+    def _merge(chunk: List[List[_Read]]) -> Tuple[MibQuery, List[Tuple[_Read, int]]]:
+        table_columns: Dict[str, List[str]] = {}
+        functions: List[str] = []
+        objects: List[str] = []
+        parts: List[Tuple[_Read, int]] = []
+        for reads in chunk:
+            urn = reads[0].urn
+            table_columns[urn] = list(OrderedDict.fromkeys(column for read in reads for column in read.columns))
+            for read in reads:
+                parts.append((read, len(functions)))
+                objects.extend(read.shifted_objects(len(functions)))
+                functions.extend(read.functions)
+        limits = [read.limit for reads in chunk for read in reads]
+        query = MibQuery(
+            "|".join(table_columns),
+            table_columns=table_columns,
+            function="|".join(functions) if functions else None,
+            object="|".join(objects),
+            # The merged request must return at least as many rows as each read asked for.
+            limit=None if None in limits else max(limits),
+            ignore_error=any(read.params.get("ignoreError") == "true" for reads in chunk for read in reads),
+        )
+        return query, parts
+
+    @staticmethod
+    def split(result: ApiResult, params: Mapping, read: _Read, offset: int) -> ApiResult:
+        """
+        Extract the part of a merged response that belongs to one read.
+
+        The read's table is taken from ``data[<urn>]`` and function output
+        columns are renamed back to the positions the read asked for. Reads of
+        the same table are merged into one read of the union of their columns
+        with the largest of their limits, so each read then gets back only its
+        own columns and at most its own limit of rows, as if it had been sent
+        on its own. Output columns of the other reads' functions are dropped.
+
+        Args:
+            result: Response of the request the read was sent in.
+            params: Parameters of that request.
+            read: The read to extract.
+            offset: Position of the read's first function in the merged request,
+                or -1 if the read was sent on its own.
+        """
+        if offset < 0:
+            return result
+        data = result.data
+        if isinstance(data, dict) and read.urn in data:
+            data = data[read.urn]
+        if isinstance(data, dict):
+            functions = params["function"].split("|") if params.get("function") else []
+            own = range(offset, offset + len(read.functions))
+            renames = {f"{fn}_{i}": (f"{fn}_{i - offset}" if i in own else None) for i, fn in enumerate(functions)}
+            if isinstance(data.get("rows"), dict):
+                keep = set(read.columns) if read.columns else None
+                rows = islice(data["rows"].items(), read.limit)
+                data = {**data, "rows": {index: _rename(row, renames, keep) for index, row in rows}}
+            else:
+                data = _rename(data, renames)
+        return ApiResult(success=result.success, diag=result.diag, error=result.error,
+                         output=result.output, data=data, age=result.age)
+
+
+def batch_read(client, calls: Sequence[Callable], max_urns: int = 8) -> List[ApiResult]:
+    """
+    Run several endpoint reads with as few requests as possible.
+
+    Each call receives a client and performs one endpoint read, e.g.
+    ``lambda c: c.chassis.temperature()``. Single-table MIB reads without
+    filters are merged into pipe-joined multi-urn requests of up to `max_urns`
+    tables, and the response is split back into one ApiResult per call.
+    Other calls are run as usual.
+
+    Args:
+        client: An `AosApiClient`.
+        calls: Endpoint reads to run.
+        max_urns: Maximum number of tables per merged request.
+
+    Returns:
+        One ApiResult per call, in the order of `calls`.
+    """
+    plan = _BatchPlan(client, calls, max_urns)
+    results: List[Optional[ApiResult]] = [None] * len(calls)
+    for index in plan.direct:
+        results[index] = calls[index](client)
+    for params, parts in plan.requests:
+        response = client.get("/", params=params)
+        for read, offset in parts:
+            results[read.index] = plan.split(response, params, read, offset)
+    return results
+
+
+async def abatch_read(client, calls: Sequence[Callable], max_urns: int = 8) -> List[ApiResult]:
+    """
+    Async version of `batch_read` for an `AsyncAosApiClient`; requests are sent concurrently.
+    """
+    plan = _BatchPlan(client, calls, max_urns)
+    results: List[Optional[ApiResult]] = [None] * len(calls)
+    outcomes = await asyncio.gather(
+        *(calls[index](client) for index in plan.direct),
+        *(client.get("/", params=params) for params, _ in plan.requests),
+    )
+    for index, result in zip(plan.direct, outcomes):
+        results[index] = result
+    for (params, parts), response in zip(plan.requests, outcomes[len(plan.direct):]):
+        for read, offset in parts:
+            results[read.index] = plan.split(response, params, read, offset)
+    return results
@@ -0,0 +1,218 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Hashable, Iterable, Optional, Tuple
+
+import httpx
+
+from aos8_api.models import ApiResult
+from aos8_api.query import MibQuery
+
+
+@dataclass
+class CacheStats:
+    """
+    Hit and miss counters of a `ReadCache`.
+
+    Attributes:
+        hits (int): Reads answered from the cache.
+        misses (int): Reads sent to the switch.
+        invalidations (int): Entries dropped because of a write.
+        stale_hits (int): Hits served past their TTL, within the stale-while-revalidate window.
+        refreshes (int): Background refreshes started.
+    """
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+    stale_hits: int = 0
+    refreshes: int = 0
+
+
+class ReadCache:
+    """
+    Opt-in TTL cache for MIB reads.
+
+    Entries are keyed by the switch's base URL and the full query (urn,
+    mibObjects, filter and limit parameters), so one cache can be shared by
+    the clients of several switches. They expire after the TTL of their urn.
+    A write to ``/?domain=mib&urn=<table>`` drops that switch's cached reads
+    of the table, and of the tables listed in `DEPENDENT_URNS`. A CLI command
+    other than ``show`` drops every cached read of the switch, since it may
+    change any table.
+
+    With `stale_while_revalidate` set, an entry past its TTL is still served
+    for that many more seconds while the client refreshes it in the background,
+    so readers never wait for the switch. Cached results carry their `age`.
+
+    Only successful results are cached. Results are copied in and out of the
+    cache, so callers may modify the data they get. Counters are kept in
+    `stats` and, per urn, in `urn_stats`.
+
+    Example:
+        cache = ReadCache(ttl=30, ttls={"chasChassisTable": 3600, "ifXTable": 5}, stale_while_revalidate=300)
+    """
+
+    # Tables whose content changes when another table is written.
+    DEPENDENT_URNS: Dict[str, Tuple[str, ...]] = {
+        "alaIpItfConfigTable": ("alaIpInterfaceTable",),
+    }
+
+    # Reads that must always reach the switch, e.g. the keep-alive query.
+    DEFAULT_TTLS: Dict[str, float] = {
+        "trapCount": 0,
+    }
+
+    def __init__(self, ttl: float = 30.0, ttls: Optional[Dict[str, float]] = None, max_entries: int = 1024,
+                 stale_while_revalidate: float = 0.0):
+        """
+        Args:
+            ttl: Default time to live in seconds.
+            ttls: Time to live per urn, overriding `ttl`; 0 disables caching of that urn.
+            max_entries: Maximum number of cached reads; least recently used ones are evicted.
+            stale_while_revalidate: Seconds past the TTL during which a stale entry is
+                served while it is refreshed in the background; 0 disables it.
+        """
+        self.ttl = ttl
+        self.ttls = {**self.DEFAULT_TTLS, **(ttls or {})}
+        self.max_entries = max_entries
+        self.stale_while_revalidate = stale_while_revalidate
+        self.stats = CacheStats()
+        self.urn_stats: Dict[str, CacheStats] = {}
+        self.generation = 0
+        self._entries: "OrderedDict[Hashable, Tuple[ApiResult, float, Tuple[str, ...]]]" = OrderedDict()
+        self._refreshing = set()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _query(path: str, params=None) -> httpx.QueryParams:
+        return httpx.URL(path).params.merge(httpx.QueryParams(params))
+
+    def key(self, path: str, kwargs: dict, base_url: str = "") -> Optional[Hashable]:
+        """
+        Return the cache key of a GET request to the switch at `base_url`, or None if it must not be cached.
+        """
+        if set(kwargs) - {"params"}:
+            return None
+        params = kwargs.get("params")
+        if isinstance(params, MibQuery) and path == "/":
+            if params.domain != "mib":
+                return None
+            urns, items = params.urns, params.key
+        else:
+            query = self._query(path, params)
+            urn = query.get("urn")
+            if query.get("domain") != "mib" or not urn:
+                return None
+            urns, items = tuple(urn.split("|")), tuple(sorted(query.multi_items()))
+        if self.ttl_for(urns) <= 0:
+            return None
+        return urns, base_url, items
+
+    def ttl_for(self, urns: Iterable[str]) -> float:
+        """
+        Return the time to live of a read spanning `urns`: the shortest of their TTLs.
+        """
+        return min(self.ttls.get(urn, self.ttl) for urn in urns)
+
+    def get(self, key: Hashable) -> Optional[ApiResult]:
+        """
+        Return a copy of the cached result for `key`, with its own data and its `age`, counting a hit or a miss.
+
+        Entries past their TTL are returned only within the stale-while-revalidate
+        window; use `claim_refresh` to find out whether one should be refreshed.
+        """
+        urns = key[0]
+        ttl = self.ttl_for(urns)
+        with self._lock:
+            entry = self._entries.get(key)
+            age = time.monotonic() - entry[1] if entry is not None else 0.0
+            if entry is not None and age >= ttl + self.stale_while_revalidate:
+                del self._entries[key]
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+            self._count(urns, hit=entry is not None, stale=age >= ttl)
+        return entry[0].copy(age=age) if entry is not None else None
+
+    def claim_refresh(self, key: Hashable, result: ApiResult) -> bool:
+        """
+        Return True if `result` is stale and no refresh of `key` is pending yet.
+
+        The caller that gets True must refresh the entry and then call `refresh_done`.
+        """
+        if result.age is None or result.age < self.ttl_for(key[0]):
+            return False
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            self.stats.refreshes += 1
+            return True
+
+    def refresh_done(self, key: Hashable):
+        """
+        Record that the refresh claimed for `key` has finished.
+        """
+        with self._lock:
+            self._refreshing.discard(key)
+
+    def put(self, key: Hashable, result: ApiResult, generation: int):
+        """
+        Cache a result read while the cache was at `generation`.
+
+        The result is dropped if a write happened since, as it may predate the write.
+        """
+        if not result.success:
+            return
+        result = result.copy()
+        with self._lock:
+            if generation != self.generation:
+                return
+            self._entries[key] = (result, time.monotonic(), key[0])
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, urns: Optional[Iterable[str]] = None, base_url: Optional[str] = None):
+        """
+        Drop the cached reads of `urns` and their dependent tables, or of every table if None.
+
+        Args:
+            urns: Tables that changed, or None for all of them.
+            base_url: Switch whose reads are dropped, or None for every switch.
+        """
+        with self._lock:
+            self.generation += 1
+            targets = None
+            if urns is not None:
+                targets = set()
+                for urn in urns:
+                    targets.add(urn)
+                    targets.update(self.DEPENDENT_URNS.get(urn, ()))
+            dropped = [key for key, entry in self._entries.items()
+                       if (base_url is None or key[1] == base_url) and (targets is None or targets.intersection(entry[2]))]
+            for key in dropped:
+                urns = self._entries.pop(key)[2]
+                self.urn_stats.setdefault("|".join(urns), CacheStats()).invalidations += 1
+            self.stats.invalidations += len(dropped)
+
+    def invalidate_for(self, method: str, path: str, params=None, base_url: Optional[str] = None):
+        """
+        Drop what a request to the switch at `base_url` may have changed: the urn of a MIB write,
+        or every table for a CLI command.
+        """
+        if path.startswith("/cli/"):
+            if not self._query(path, params).get("cmd", "").strip().lower().startswith("show"):
+                self.invalidate(base_url=base_url)
+        elif method != "GET":
+            urn = self._query(path, params).get("urn")
+            self.invalidate(urn.split("|") if urn else None, base_url)
+
+    def _count(self, urns: Tuple[str, ...], hit: bool, stale: bool):
+        for stats in (self.stats, self.urn_stats.setdefault("|".join(urns), CacheStats())):
+            if hit:
+                stats.hits += 1
+                stats.stale_hits += stale
+            else:
+                stats.misses += 1
@@ -0,0 +1,164 @@
+import asyncio
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import Dict, Optional
+
+import httpx
+
+
+class _Sample:
+    """One request observed by a concurrency limiter."""
+
+    __slots__ = ("start", "saturated", "status", "kind")
+
+    def __init__(self, saturated: bool = False, kind: str = "mib"):
+        self.start = time.monotonic()
+        self.saturated = saturated
+        self.status: Optional[int] = None
+        self.kind = kind
+
+
+def request_class(path: str) -> str:
+    """
+    Return the latency class of a request path: "cli" for ``/cli/aos`` commands, "mib" otherwise.
+    """
+    return "cli" if path.startswith("/cli/aos") else "mib"
+
+
+class ConcurrencyLimiter:
+    """
+    Base class for per-switch concurrency limiters.
+
+    The base class does not limit anything. Clients send every request attempt
+    inside ``with limiter.acquire(path) as sample`` (or ``acquire_async``) and
+    set ``sample.status`` to the response status code.
+    """
+
+    limit: Optional[float] = None
+
+    @contextmanager
+    def acquire(self, path: str = ""):
+        """
+        Hold a concurrency slot while a request to `path` runs.
+        """
+        yield _Sample(kind=request_class(path))
+
+    @asynccontextmanager
+    async def acquire_async(self, path: str = ""):
+        """
+        Async version of `acquire`.
+        """
+        yield _Sample(kind=request_class(path))
+
+
+class AdaptiveConcurrency(ConcurrencyLimiter):
+    """
+    Learn how many concurrent requests a switch sustains (AIMD).
+
+    The window grows by one request per window's worth of fast, successful
+    responses while it is fully used (additive increase) and is cut by
+    `backoff` on a transport error, a 429/5xx response, or a response slower
+    than the latency target (multiplicative decrease). Only requests started
+    after the previous cut can cut the window again, so one overloaded burst
+    counts once.
+
+    The latency target is `latency_target` if given, otherwise `tolerance`
+    times the smallest latency observed recently for the same class of request.
+    MIB requests and ``/cli/aos`` commands keep separate baselines, as in
+    `RateLimiter`, so a slow CLI command is not mistaken for an overloaded
+    switch when MIB reads set the baseline.
+
+    Threads and asyncio tasks share the learned window but are counted
+    separately against it.
+    """
+
+    def __init__(self, initial: int = 4, min_limit: int = 1, max_limit: int = 64, backoff: float = 0.5,
+                 tolerance: float = 2.0, latency_target: Optional[float] = None):
+        """
+        Args:
+            initial: Initial window size.
+            min_limit: Smallest window size.
+            max_limit: Largest window size.
+            backoff: Factor applied to the window on overload, in (0, 1).
+            tolerance: Latency target as a multiple of the baseline latency.
+            latency_target: Fixed latency target in seconds, instead of a learned one.
+        """
+        if not 1 <= min_limit <= initial <= max_limit:
+            raise ValueError("limits must satisfy 1 <= min_limit <= initial <= max_limit")
+        if not 0 < backoff < 1:
+            raise ValueError("backoff must be in (0, 1)")
+        self.limit = float(initial)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff = backoff
+        self.tolerance = tolerance
+        self.latency_target = latency_target
+        self.baselines: Dict[str, float] = {}
+        self._last_decrease = 0.0
+        self._lock = threading.Lock()
+        self._cond = threading.Condition()
+        self._in_flight = 0
+        self._async_cond: Optional[asyncio.Condition] = None
+        self._async_in_flight = 0
+
+    def _update(self, sample: _Sample, failed: bool):
+        latency = time.monotonic() - sample.start
+        failed = failed or sample.status == 429 or (sample.status or 0) >= 500
+        with self._lock:
+            baseline = self.baselines.get(sample.kind)
+            if not failed:
+                # Let the baseline drift up slowly, so a switch that became
+                # permanently slower is not throttled forever.
+                if baseline is None or latency < baseline:
+                    self.baselines[sample.kind] = latency
+                else:
+                    self.baselines[sample.kind] = baseline + (latency - baseline) * 0.01
+            target = self.latency_target
+            if target is None and baseline is not None:
+                target = baseline * self.tolerance
+            if failed or (target is not None and latency > target):
+                if sample.start >= self._last_decrease:
+                    self.limit = max(float(self.min_limit), self.limit * self.backoff)
+                    self._last_decrease = time.monotonic()
+            elif sample.saturated:
+                self.limit = min(float(self.max_limit), self.limit + 1 / self.limit)
+
+    @contextmanager
+    def acquire(self, path: str = ""):
+        with self._cond:
+            self._cond.wait_for(lambda: self._in_flight < int(self.limit))
+            self._in_flight += 1
+            sample = _Sample(saturated=self._in_flight >= int(self.limit), kind=request_class(path))
+        try:
+            yield sample
+        except httpx.TransportError:
+            self._update(sample, failed=True)
+            raise
+        else:
+            self._update(sample, failed=False)
+        finally:
+            with self._cond:
+                self._in_flight -= 1
+                self._cond.notify_all()
+
+    @asynccontextmanager
+    async def acquire_async(self, path: str = ""):
+        if self._async_cond is None:
+            self._async_cond = asyncio.Condition()
+        async with self._async_cond:
+            await self._async_cond.wait_for(lambda: self._async_in_flight < int(self.limit))
+            self._async_in_flight += 1
+            sample = _Sample(saturated=self._async_in_flight >= int(self.limit), kind=request_class(path))
+        try:
+            yield sample
+        except httpx.TransportError:
+            self._update(sample, failed=True)
+            raise
+        else:
+            self._update(sample, failed=False)
+        finally:
+            # Decrement before taking the lock so a cancellation cannot leak the slot.
+            self._async_in_flight -= 1
+            async with self._async_cond:
+                self._async_cond.notify_all()
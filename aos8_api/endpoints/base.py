@@ -1,3 +1,17 @@
+import asyncio
+import copy
+import functools
+import inspect
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Sequence
+from aos8_api.models import ApiResult
+from aos8_api.paging import aiter_mib_rows, iter_mib_rows
+from aos8_api.query import MibQuery
+
+# What write methods read back after a successful write: nothing, the written row, or the whole table.
+REFRESH_MODES = ("none", "row", "full")
+
+
 class BaseEndpoint:
     """
     Base class for all API endpoint classes.
@@ -9,6 +23,10 @@ class BaseEndpoint:
         _client: The API client instance used for sending HTTP requests.
     """
 
+    # Whether bulk writes pack several rows into one POST. Cleared on an
+    # endpoint once its switch rejects multi-row writes that succeed row by row.
+    _multi_row_writes = True
+
     def __init__(self, client):
         """
         Initialize the BaseEndpoint.
@@ -17,3 +35,230 @@ class BaseEndpoint:
             client: An instance of the API client that provides request methods (e.g., get, post).
         """
         self._client = client
+
+    def _refresh_mode(self, refresh: Optional[str]) -> str:
+        """
+        Return the refresh mode of a write: `refresh`, or the client's default if None.
+        """
+        mode = refresh if refresh is not None else getattr(self._client, "refresh", "full")
+        if mode not in REFRESH_MODES:
+            raise ValueError(f"refresh must be one of {', '.join(REFRESH_MODES)}")
+        return mode
+
+    def _post_and_refresh(self, url: str, form_data: dict, full, row=None, refresh: Optional[str] = None):
+        """
+        POST a MIB write and, on success, return the result of a follow-up read.
+
+        Args:
+            url: MIB write URL (e.g., "/?domain=mib&urn=vlanTable").
+            form_data: Form fields of the write.
+            full: Callable returning the ApiResult of the whole table.
+            row: Callable returning the ApiResult of only the written row, if the write supports it.
+            refresh: "full", "row" or "none"; the client's default if None.
+
+        Returns:
+            ApiResult: The refreshed data on success, otherwise the failed write result.
+            With refresh "none", the write result; "row" falls back to "full" without `row`.
+        """
+        mode = self._refresh_mode(refresh)
+        response = self._client.post(url, data=form_data)
+        if not response.success or mode == "none":
+            return response
+        return row() if mode == "row" and row is not None else full()
+
+    @staticmethod
+    def _pack_rows(rows: Sequence[dict]) -> dict:
+        """
+        Merge the write forms of several rows of one table into one form.
+
+        The mibObjectN fields of the rows are renumbered consecutively; each
+        row starts with its index objects ("name:|value").
+        """
+        form = {}
+        for row in rows:
+            for value in row.values():
+                form[f"mibObject{len(form)}"] = value
+        return form
+
+    @staticmethod
+    def _row_results(response: ApiResult, count: int) -> List[ApiResult]:
+        """
+        Return one independent copy of a multi-row write's response per row.
+        """
+        return [copy.deepcopy(response) for _ in range(count)]
+
+    def _post_rows(self, url: str, rows: Sequence[dict], rows_per_request: int) -> List[ApiResult]:
+        """
+        POST several rows of one table, packing up to `rows_per_request` rows into each request.
+
+        A rejected multi-row request is retried one row at a time. If every row
+        then succeeds on its own, the switch does not accept multi-row writes and
+        later requests of this endpoint send one row each. Each row of an
+        accepted multi-row request gets its own copy of the response; the switch
+        does not report which rows it applied, so callers only pack rows on
+        switches known to apply every row.
+
+        Args:
+            url: MIB write URL (e.g., "/?domain=mib&urn=vlanTable").
+            rows: Form fields of each row.
+            rows_per_request: Maximum number of rows per request.
+
+        Returns:
+            List[ApiResult]: The result of each row, in the order of `rows`.
+        """
+        if rows_per_request < 1:
+            raise ValueError("rows_per_request must be at least 1")
+        results = []
+        for start in range(0, len(rows), rows_per_request):
+            chunk = rows[start:start + rows_per_request]
+            packed = len(chunk) > 1 and self._multi_row_writes
+            if packed:
+                response = self._client.post(url, data=self._pack_rows(chunk))
+                if response.success:
+                    results.extend(self._row_results(response, len(chunk)))
+                    continue
+            outcomes = [self._client.post(url, data=row) for row in chunk]
+            if packed and all(outcome.success for outcome in outcomes):
+                self._multi_row_writes = False
+            results.extend(outcomes)
+        return results
+
+    def _get_all(self, paths: Sequence[str]) -> List[ApiResult]:
+        """
+        Send independent GET requests, up to the client's `show_concurrency` at a time.
+
+        Args:
+            paths: Request paths, e.g. CLI show commands.
+
+        Returns:
+            List[ApiResult]: The result of each request, in the order of `paths`.
+        """
+        workers = min(getattr(self._client, "show_concurrency", 1), len(paths))
+        if workers <= 1:
+            return [self._client.get(path) for path in paths]
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(self._client.get, paths))
+
+    def _paginate(self, query: MibQuery, page_size: int):
+        """
+        Iterate over every row of a MIB query, fetching `page_size` rows per request.
+
+        Returns:
+            Iterator of (index, row) pairs; an async iterator on async endpoints.
+        """
+        return iter_mib_rows(self._client, query, page_size)
+
+
+def _as_coroutine(func):
+    """
+    Wrap a synchronous endpoint method so it can be awaited on an async client.
+
+    The wrapped method runs unchanged; if it returns an awaitable (because the
+    underlying client call is a coroutine) the wrapper awaits it.
+    """
+    @functools.wraps(func)
+    async def wrapper(self, *args, **kwargs):
+        result = func(self, *args, **kwargs)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+    return wrapper
+
+
+class AsyncEndpointMixin:
+    """
+    Mixin turning a synchronous endpoint class into its asyncio counterpart.
+
+    Subclasses are declared as ``class AsyncXEndpoint(AsyncEndpointMixin, XEndpoint)``
+    and bound to an `AsyncAosApiClient`. Every public method inherited from the
+    synchronous class is exposed as a coroutine function, except ``iter_*``
+    methods, which return async iterators. Methods that chain several requests
+    must be overridden with an ``async def`` in the subclass.
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for klass in cls.__mro__[1:]:
+            if klass in (AsyncEndpointMixin, BaseEndpoint, object):
+                continue
+            for name, attr in vars(klass).items():
+                if name.startswith(("_", "iter_")) or name in cls.__dict__:
+                    continue
+                if inspect.isfunction(attr) and not inspect.iscoroutinefunction(attr):
+                    setattr(cls, name, _as_coroutine(attr))
+
+    async def _post_and_refresh(self, url: str, form_data: dict, full, row=None, refresh: Optional[str] = None):
+        """
+        Async version of `BaseEndpoint._post_and_refresh`.
+        """
+        mode = self._refresh_mode(refresh)
+        response = await self._client.post(url, data=form_data)
+        if not response.success or mode == "none":
+            return response
+        return await (row() if mode == "row" and row is not None else full())
+
+    async def _post_rows(self, url: str, rows: Sequence[dict], rows_per_request: int) -> List[ApiResult]:
+        """
+        Async version of `BaseEndpoint._post_rows`; rows retried one at a time are sent concurrently.
+        """
+        if rows_per_request < 1:
+            raise ValueError("rows_per_request must be at least 1")
+        results = []
+        for start in range(0, len(rows), rows_per_request):
+            chunk = rows[start:start + rows_per_request]
+            packed = len(chunk) > 1 and self._multi_row_writes
+            if packed:
+                response = await self._client.post(url, data=self._pack_rows(chunk))
+                if response.success:
+                    results.extend(self._row_results(response, len(chunk)))
+                    continue
+            outcomes = await asyncio.gather(*(self._client.post(url, data=row) for row in chunk))
+            if packed and all(outcome.success for outcome in outcomes):
+                self._multi_row_writes = False
+            results.extend(outcomes)
+        return results
+
+    async def _get_all(self, paths: Sequence[str]) -> List[ApiResult]:
+        """
+        Async version of `BaseEndpoint._get_all`; requests are gathered, up to `show_concurrency` at a time.
+        """
+        semaphore = asyncio.Semaphore(getattr(self._client, "show_concurrency", 1))
+
+        async def get(path: str) -> ApiResult:
+            async with semaphore:
+                return await self._client.get(path)
+
+        return list(await asyncio.gather(*(get(path) for path in paths)))
+
+    def _paginate(self, query: MibQuery, page_size: int):
+        """
+        Async version of `BaseEndpoint._paginate`.
+        """
+        return aiter_mib_rows(self._client, query, page_size)
+
+
+class LazyEndpoint:
+    """
+    Client attribute that instantiates an endpoint class on first access.
+
+    The endpoint is then cached on the client instance, so later accesses are
+    plain attribute lookups.
+
+    Example:
+        class AosApiClient:
+            vlan = LazyEndpoint(VlanEndpoint)
+    """
+
+    def __init__(self, endpoint_class):
+        self.endpoint_class = endpoint_class
+        self.name = None
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, client, owner=None):
+        if client is None:
+            return self
+        endpoint = self.endpoint_class(client)
+        client.__dict__[self.name] = endpoint
+        return endpoint
@@ -1,422 +1,457 @@
-from helper import parse_system_output_json
-from typing import Optional
-from endpoints.base import BaseEndpoint
-from models import ApiResult
+from aos8_api.helper import parse_system_output_json
+from typing import Optional, List
+from aos8_api.endpoints.base import BaseEndpoint, AsyncEndpointMixin
+from aos8_api.models import ApiResult
+from aos8_api.query import MibQuery
 
 class ChassisEndpoint(BaseEndpoint):
     """
     Endpoint to manage chassis on an Alcatel-Lucent OmniSwitch using MIB-based API commands.
     """
-    def hardwareinfo(self, limit: int = 200) -> ApiResult:
+    _HARDWAREINFO_QUERY = MibQuery(
+        "chasChassisTable",
+        columns=[
+            "entPhysicalIndex",
+            "entPhysicalModelName",
+            "chasEntPhysPartNumber",
+            "entPhysicalClass",
+            "entPhysicalDescr",
+            "entPhysicalHardwareRev",
+            "entPhysicalSerialNum",
+            "entPhysicalMfgName",
+            "chasEntPhysAdminStatus",
+            "chasEntPhysOperStatus",
+            "chasNumberOfResets",
+            "chasCPMAHardwareBoardTemp",
+            "chasTempThreshold",
+            "chasTempRange",
+            "chasDangerTempThreshold",
+        ],
+        function="chassisSlotArr_entPhysIndex",
+        object="entPhysicalIndex",
+        ignore_error=True,
+    )
+
+    def hardwareinfo(self, limit: int = 200, columns: Optional[List[str]] = None) -> ApiResult:
         """
         Retrieve chassis component and environmental status.
 
         Args:
             limit (int): Maximum number of rows to retrieve.
+            columns (Optional[List[str]]): MIB objects to return; all of the method's objects by default.
 
         Returns:
             ApiResult: Parsed data including hardware, temperature, and status info.
         """
-        params = {
-            "domain": "mib",
-            "urn": "chasChassisTable",
-            "mibObject0": "entPhysicalIndex",
-            "mibObject1": "entPhysicalModelName",
-            "mibObject2": "chasEntPhysPartNumber",
-            "mibObject3": "entPhysicalClass",
-            "mibObject4": "entPhysicalDescr",
-            "mibObject5": "entPhysicalHardwareRev",
-            "mibObject6": "entPhysicalSerialNum",
-            "mibObject7": "entPhysicalMfgName",
-            "mibObject8": "chasEntPhysAdminStatus",
-            "mibObject9": "chasEntPhysOperStatus",
-            "mibObject10": "chasNumberOfResets",
-            "mibObject11": "chasCPMAHardwareBoardTemp",
-            "mibObject12": "chasTempThreshold",
-            "mibObject13": "chasTempRange",
-            "mibObject14": "chasDangerTempThreshold",
-            "function": "chassisSlotArr_entPhysIndex",
-            "object": "entPhysicalIndex",
-            "limit": str(limit),
-            "ignoreError": "true"
-        }
-
-        return self._client.get("/", params=params)
-
-    def temperature(self, limit: int = 200) -> ApiResult:
+        query = self._HARDWAREINFO_QUERY.replace(limit=limit)
+
+        return self._client.get("/", params=query.select(columns))
+
+    _TEMPERATURE_QUERY = MibQuery(
+        "chasEntTemperatureTable",
+        columns=[
+            "chasEntTempCurrent",
+            "chasEntTempThreshold",
+            "chasEntTempDangerThreshold",
+            "chasEntTempStatus",
+        ],
+        function="chassisSlotWithType_entPhysicalIndex",
+        object="index",
+        ignore_error=True,
+    )
+
+    def temperature(self, limit: int = 200, columns: Optional[List[str]] = None) -> ApiResult:
         """
         Retrieve current temperature, thresholds, and status for all temperature sensors.
 
         Args:
             limit (int): Max number of entries to retrieve. Defaults to 200.
+            columns (Optional[List[str]]): MIB objects to return; all of the method's objects by default.
 
         Returns:
             ApiResult: Parsed temperature data including thresholds and sensor status.
         """
-        params = {
-            "domain": "mib",
-            "urn": "chasEntTemperatureTable",
-            "mibObject0": "chasEntTempCurrent",
-            "mibObject1": "chasEntTempThreshold",
-            "mibObject2": "chasEntTempDangerThreshold",
-            "mibObject3": "chasEntTempStatus",
-            "function": "chassisSlotWithType_entPhysicalIndex",
-            "object": "index",
-            "limit": str(limit),
-            "ignoreError": "true"
-        }
-
-        return self._client.get("/", params=params)
+        query = self._TEMPERATURE_QUERY.replace(limit=limit)
+
+        return self._client.get("/", params=query.select(columns))
     
-    def software(self, limit: int = 200) -> ApiResult:
+    _SOFTWARE_QUERY = MibQuery(
+        "chasControlModuleTable|systemMicrocodeLoadedTable|systemVcHardwareTable",
+        table_columns={
+            "chasControlModuleTable": [
+                "entPhysicalIndex",
+                "chasPrimaryPhysicalIndex",
+                "chasControlCurrentRunningVersion",
+                "chasEntPhysAdminStatus",
+                "chasEntPhysOperStatus",
+                "chasControlDelayedRebootTimer",
+                "chasEntPhysPower",
+                "chasNumberOfResets",
+            ],
+            "systemMicrocodeLoadedTable": [
+                "systemMicrocodeLoadedDirectory",
+                "systemMicrocodeLoadedVersion",
+            ],
+            "systemVcHardwareTable": [
+                "virtualChassisOperChasId",
+                "systemVcHardwareFpga1Version",
+                "systemVcHardwareUbootVersion",
+            ],
+        },
+        function="entPhysIndexModuleType|chassis_entPhysIndex|entPhysicalIndex_chassisId|chassisSlotWithType_entPhysicalIndex",
+        object="index|index|chassis_entPhysIndex_1|index",
+        ignore_error=True,
+    )
+
+    def software(self, limit: int = 200, columns: Optional[List[str]] = None) -> ApiResult:
         """
         Fetch control module, loaded microcode, and virtual chassis hardware information.
 
         Args:
             limit (int): Maximum number of rows to retrieve.
+            columns (Optional[List[str]]): MIB objects to return; all of the method's objects by default.
 
         Returns:
             ApiResult: Parsed data including control status and versioning.
         """
-        params = {
-            "domain": "mib",
-            "urn": "chasControlModuleTable|systemMicrocodeLoadedTable|systemVcHardwareTable",
-
-            # chasControlModuleTable MIB objects
-            "chasControlModuleTable-mibObject0": "entPhysicalIndex",
-            "chasControlModuleTable-mibObject1": "chasPrimaryPhysicalIndex",
-            "chasControlModuleTable-mibObject2": "chasControlCurrentRunningVersion",
-            "chasControlModuleTable-mibObject3": "chasEntPhysAdminStatus",
-            "chasControlModuleTable-mibObject4": "chasEntPhysOperStatus",
-            "chasControlModuleTable-mibObject5": "chasControlDelayedRebootTimer",
-            "chasControlModuleTable-mibObject6": "chasEntPhysPower",
-            "chasControlModuleTable-mibObject7": "chasNumberOfResets",
-
-            # systemMicrocodeLoadedTable MIB objects
-            "systemMicrocodeLoadedTable-mibObject0": "systemMicrocodeLoadedDirectory",
-            "systemMicrocodeLoadedTable-mibObject1": "systemMicrocodeLoadedVersion",
-
-            # systemVcHardwareTable MIB objects
-            "systemVcHardwareTable-mibObject0": "virtualChassisOperChasId",
-            "systemVcHardwareTable-mibObject1": "systemVcHardwareFpga1Version",
-            "systemVcHardwareTable-mibObject2": "systemVcHardwareUbootVersion",
-
-            # Shared query controls
-            "function": "entPhysIndexModuleType|chassis_entPhysIndex|entPhysicalIndex_chassisId|chassisSlotWithType_entPhysicalIndex",
-            "object": "index|index|chassis_entPhysIndex_1|index",
-            "limit": str(limit),
-            "ignoreError": "true"
-        }
-
-        return self._client.get("/", params=params)
+        query = self._SOFTWARE_QUERY.replace(limit=limit)
+
+        return self._client.get("/", params=query.select(columns))
     
-    def cmmHardwareInfo(self, limit: int = 200) -> ApiResult:
+    _CMM_HARDWARE_INFO_QUERY = MibQuery(
+        "entPhysicalTable",
+        columns=[
+            "entPhysicalIndex",
+            "chasEntPhysOperStatus",
+            "entPhysicalModelName",
+            "chasEntPhysPartNumber",
+            "entPhysicalDescr",
+            "entPhysicalHardwareRev",
+            "entPhysicalSerialNum",
+            "entPhysicalMfgName",
+        ],
+        function="entPhysIndexModuleType|chassisSlotWithType_entPhysicalIndex",
+        object="index|index",
+        filter_object="entPhysIndexModuleType_0",
+        filter_value="CMM",
+        ignore_error=True,
+    )
+
+    def cmmHardwareInfo(self, limit: int = 200, columns: Optional[List[str]] = None) -> ApiResult:
         """
         Retrieve details about the active CMM module(s), including model, part number, and status.
 
         Args:
             limit (int): Maximum number of results to return.
+            columns (Optional[List[str]]): MIB objects to return; all of the method's objects by default.
 
         Returns:
             ApiResult: Parsed hardware and operational info of CMM modules.
         """
-        params = {
-            "domain": "mib",
-            "urn": "entPhysicalTable",
-            "mibObject0": "entPhysicalIndex",
-            "mibObject1": "chasEntPhysOperStatus",
-            "mibObject2": "entPhysicalModelName",
-            "mibObject3": "chasEntPhysPartNumber",
-            "mibObject4": "entPhysicalDescr",
-            "mibObject5": "entPhysicalHardwareRev",
-            "mibObject6": "entPhysicalSerialNum",
-            "mibObject7": "entPhysicalMfgName",
-            "function": "entPhysIndexModuleType|chassisSlotWithType_entPhysicalIndex",
-            "object": "index|index",
-            "filterObject": "entPhysIndexModuleType_0",
-            "filterOperation": "==",
-            "filterValue": "CMM",
-            "limit": str(limit),
-            "ignoreError": "true"
-        }
-
-        return self._client.get("/", params=params)    
+        query = self._CMM_HARDWARE_INFO_QUERY.replace(limit=limit)
+
+        return self._client.get("/", params=query.select(columns))    
     
-    def slot(self, limit: int = 200) -> ApiResult:
+    _SLOT_QUERY = MibQuery(
+        "entPhysicalTable|alaPethMainPseTable",
+        table_columns={
+            "entPhysicalTable": [
+                "entPhysicalIndex",
+                "entPhysicalClass",
+                "chasEntPhysModuleType",
+                "entPhysicalModelName",
+                "chasEntPhysPartNumber",
+                "chasEntPhysAdminStatus",
+                "chasEntPhysOperStatus",
+                "chasControlReloadStatus",
+                "chasEntPhysPower",
+                "entPhysicalDescr",
+                "chasEntPhysUbootRev",
+                "chasEntPhysDaughterFpga1Rev",
+                "entPhysicalHardwareRev",
+                "entPhysicalFirmwareRev",
+                "chasEntPhysDaughterFpga2Rev",
+                "entPhysicalSerialNum",
+                "entPhysicalMfgName",
+                "chasEntPhysMacAddress",
+            ],
+            "alaPethMainPseTable": [
+                "alaPethMainPsePoESoftwareVersion",
+                "alaPethMainPsePoEHardwareVersion",
+            ],
+        },
+        function="entPhysIndexModuleType|chassisSlot_entPhysicalIndex|chassisEntSlotArr_entPhysIndex|wvGetVCMode",
+        object="index|entPhysicalIndex|entPhysicalIndex",
+        filter_object="entPhysIndexModuleType_0",
+        filter_value="NI",
+        ignore_error=True,
+    )
+
+    def slot(self, limit: int = 200, columns: Optional[List[str]] = None) -> ApiResult:
         """
         Retrieve hardware and PoE firmware details for NI modules.
 
         Args:
             limit (int): Maximum number of entries to return.
+            columns (Optional[List[str]]): MIB objects to return; all of the method's objects by default.
 
         Returns:
             ApiResult: Parsed inventory and versioning data for NI modules.
         """
-        params = {
-            "domain": "mib",
-            "urn": "entPhysicalTable|alaPethMainPseTable",
-
-            # entPhysicalTable MIB objects
-            "entPhysicalTable-mibObject0": "entPhysicalIndex",
-            "entPhysicalTable-mibObject1": "entPhysicalClass",
-            "entPhysicalTable-mibObject2": "chasEntPhysModuleType",
-            "entPhysicalTable-mibObject3": "entPhysicalModelName",
-            "entPhysicalTable-mibObject4": "chasEntPhysPartNumber",
-            "entPhysicalTable-mibObject5": "chasEntPhysAdminStatus",
-            "entPhysicalTable-mibObject6": "chasEntPhysOperStatus",
-            "entPhysicalTable-mibObject7": "chasControlReloadStatus",
-            "entPhysicalTable-mibObject8": "chasEntPhysPower",
-            "entPhysicalTable-mibObject9": "entPhysicalDescr",
-            "entPhysicalTable-mibObject10": "chasEntPhysUbootRev",
-            "entPhysicalTable-mibObject11": "chasEntPhysDaughterFpga1Rev",
-            "entPhysicalTable-mibObject12": "entPhysicalHardwareRev",
-            "entPhysicalTable-mibObject13": "entPhysicalFirmwareRev",
-            "entPhysicalTable-mibObject14": "chasEntPhysDaughterFpga2Rev",
-            "entPhysicalTable-mibObject15": "entPhysicalSerialNum",
-            "entPhysicalTable-mibObject16": "entPhysicalMfgName",
-            "entPhysicalTable-mibObject17": "chasEntPhysMacAddress",
-
-            # alaPethMainPseTable MIB objects
-            "alaPethMainPseTable-mibObject0": "alaPethMainPsePoESoftwareVersion",
-            "alaPethMainPseTable-mibObject1": "alaPethMainPsePoEHardwareVersion",
-
-            # Query function and filters
-            "function": "entPhysIndexModuleType|chassisSlot_entPhysicalIndex|chassisEntSlotArr_entPhysIndex|wvGetVCMode",
-            "object": "index|entPhysicalIndex|entPhysicalIndex",
-            "filterObject": "entPhysIndexModuleType_0",
-            "filterOperation": "==",
-            "filterValue": "NI",
-            "limit": str(limit),
-            "ignoreError": "true"
-        }
-
-        return self._client.get("/", params=params)   
+        query = self._SLOT_QUERY.replace(limit=limit)
+
+        return self._client.get("/", params=query.select(columns))   
     
-    def powerSupplies(self, limit: int = 200) -> ApiResult:
+    _POWER_SUPPLIES_QUERY = MibQuery(
+        "entPhysicalTable",
+        columns=[
+            "entPhysicalIndex",
+            "chasEntPhysPower",
+            "chasEntPhysPowerType",
+            "chasEntPhysOperStatus",
+            "chasEntPhysAirflow",
+        ],
+        function="entPhysIndexModuleType|chassisSlot_entPhysicalIndex",
+        object="index|entPhysicalIndex",
+        filter_object="entPhysIndexModuleType_0",
+        filter_value="PS",
+        ignore_error=True,
+    )
+
+    def powerSupplies(self, limit: int = 200, columns: Optional[List[str]] = None) -> ApiResult:
         """
         Retrieve details of power supplies including power type and operational status.
 
         Args:
             limit (int): Maximum number of records to return.
+            columns (Optional[List[str]]): MIB objects to return; all of the method's objects by default.
 
         Returns:
             ApiResult: Parsed response with power supply information.
         """
-        params = {
-            "domain": "mib",
-            "urn": "entPhysicalTable",
-            "mibObject0": "entPhysicalIndex",
-            "mibObject1": "chasEntPhysPower",
-            "mibObject2": "chasEntPhysPowerType",
-            "mibObject3": "chasEntPhysOperStatus",
-            "mibObject4": "chasEntPhysAirflow",
-            "function": "entPhysIndexModuleType|chassisSlot_entPhysicalIndex",
-            "object": "index|entPhysicalIndex",
-            "filterObject": "entPhysIndexModuleType_0",
-            "filterOperation": "==",
-            "filterValue": "PS",  # Filter for Power Supply modules
-            "limit": str(limit),
-            "ignoreError": "true"
-        }
-
-        return self._client.get("/", params=params)   
-
-    def poePower(self, limit: int = 200) -> ApiResult:
+        query = self._POWER_SUPPLIES_QUERY.replace(limit=limit)
+
+        return self._client.get("/", params=query.select(columns))   
+
+    _POE_POWER_QUERY = MibQuery(
+        "alaPethMainPseTable",
+        columns=[
+            "pethMainPseGroupIndex",
+            "alaPethMainPseAdminStatus",
+            "alaPethMainPseMaxPower",
+            "alaPethMainPsePriorityDisconnect",
+            "alaPethMainPseClassDetection",
+            "pethMainPseUsageThreshold",
+            "alaPethMainPseFastPoE",
+            "alaPethMainPsePerpetualPoE",
+            "alaPethMainPseHighResistanceDetection",
+            "alaPethMainPseFirmwareUpgradeSWVersion",
+            "alaPethMainPseFirmwareUpgradeStatus",
+            "alaPethMainPseDelayTime",
+        ],
+        function="chassisSlot_vcSlotNum",
+        object="pethMainPseGroupIndex",
+        ignore_error=True,
+    )
+
+    def poePower(self, limit: int = 200, columns: Optional[List[str]] = None) -> ApiResult:
         """
         Retrieve PoE controller configurations and firmware status.
 
         Args:
             limit (int): Maximum number of records to return.
+            columns (Optional[List[str]]): MIB objects to return; all of the method's objects by default.
 
         Returns:
             ApiResult: Parsed response containing PoE controller information.
         """
-        params = {
-            "domain": "mib",
-            "urn": "alaPethMainPseTable",
-            "mibObject0": "pethMainPseGroupIndex",
-            "mibObject1": "alaPethMainPseAdminStatus",
-            "mibObject2": "alaPethMainPseMaxPower",
-            "mibObject3": "alaPethMainPsePriorityDisconnect",
-            "mibObject4": "alaPethMainPseClassDetection",
-            "mibObject5": "pethMainPseUsageThreshold",
-            "mibObject6": "alaPethMainPseFastPoE",
-            "mibObject7": "alaPethMainPsePerpetualPoE",
-            "mibObject8": "alaPethMainPseHighResistanceDetection",
-            "mibObject9": "alaPethMainPseFirmwareUpgradeSWVersion",
-            "mibObject10": "alaPethMainPseFirmwareUpgradeStatus",
-            "mibObject11": "alaPethMainPseDelayTime",
-            "function": "chassisSlot_vcSlotNum",
-            "object": "pethMainPseGroupIndex",
-            "limit": str(limit),
-            "ignoreError": "true"
-        }
-
-        return self._client.get("/", params=params)    
-
-    def transceiversInfo(self, limit: int = 200) -> ApiResult:
+        query = self._POE_POWER_QUERY.replace(limit=limit)
+
+        return self._client.get("/", params=query.select(columns))    
+
+    _TRANSCEIVERS_INFO_QUERY = MibQuery(
+        "entPhysicalTable",
+        columns=[
+            "chasEntPhysNiNum",
+            "chasEntPhysGbicNum",
+            "entPhysicalMfgName",
+            "chasEntPhysPartNumber",
+            "entPhysicalHardwareRev",
+            "entPhysicalSerialNum",
+            "entPhysicalMfgDate",
+            "chasEntPhysWaveLen",
+            "chasEntPhysAdminStatus",
+            "chasEntPhysOperStatus",
+        ],
+        function="entPhysIndexModuleType|chassis_entPhysIndex|addChassisIfVcMode",
+        object="index|index|chassis_entPhysIndex_1,chasEntPhysNiNum",
+        filter_object="entPhysIndexModuleType_0",
+        filter_value="GBIC",
+        ignore_error=True,
+    )
+
+    def transceiversInfo(self, limit: int = 200, columns: Optional[List[str]] = None) -> ApiResult:
         """
         Retrieve GBIC/transceiver module information.
 
         Args:
             limit (int): Maximum number of entries to return.
+            columns (Optional[List[str]]): MIB objects to return; all of the method's objects by default.
 
         Returns:
             ApiResult: Parsed response with GBIC module data.
         """
-        params = {
-            "domain": "mib",
-            "urn": "entPhysicalTable",
-            "mibObject0": "chasEntPhysNiNum",
-            "mibObject1": "chasEntPhysGbicNum",
-            "mibObject2": "entPhysicalMfgName",
-            "mibObject3": "chasEntPhysPartNumber",
-            "mibObject4": "entPhysicalHardwareRev",
-            "mibObject5": "entPhysicalSerialNum",
-            "mibObject6": "entPhysicalMfgDate",
-            "mibObject7": "chasEntPhysWaveLen",
-            "mibObject8": "chasEntPhysAdminStatus",
-            "mibObject9": "chasEntPhysOperStatus",
-            "function": "entPhysIndexModuleType|chassis_entPhysIndex|addChassisIfVcMode",
-            "object": "index|index|chassis_entPhysIndex_1,chasEntPhysNiNum",
-            "filterObject": "entPhysIndexModuleType_0",
-            "filterOperation": "==",
-            "filterValue": "GBIC",
-            "limit": str(limit),
-            "ignoreError": "true"
-        }
-
-        return self._client.get("/", params=params)  
-
-    def dmmConfig(self) -> ApiResult:
+        query = self._TRANSCEIVERS_INFO_QUERY.replace(limit=limit)
+
+        return self._client.get("/", params=query.select(columns))  
+
+    _DMM_CONFIG_QUERY = MibQuery(
+        "ddmConfiguration",
+        columns=[
+            "ddmConfig",
+            "ddmTrapConfig",
+        ],
+    )
+
+    def dmmConfig(self, columns: Optional[List[str]] = None) -> ApiResult:
         """
         Get global DDM configuration and trap settings.
 
+        Args:
+            columns (Optional[List[str]]): MIB objects to return; all of the method's objects by default.
+
         Returns:
             ApiResult: Parsed DDM configuration response.
         """
-        params = {
-            "domain": "mib",
-            "urn": "ddmConfiguration",
-            "mibObject0": "ddmConfig",
-            "mibObject1": "ddmTrapConfig"
-        }
-
-        return self._client.get("/", params=params)       
+        return self._client.get("/", params=self._DMM_CONFIG_QUERY.select(columns))       
     
-    def fanStatus(self, limit: int = 200) -> ApiResult:
+    _FAN_STATUS_QUERY = MibQuery(
+        "alaChasEntPhysFanTable",
+        columns=[
+            "entPhysicalIndex",
+            "alaChasEntPhysFanLocalIndex",
+            "alaChasEntPhysFanStatus",
+            "alaChasEntPhysFanSpeed",
+            "alaChasEntPhysFanAirflow",
+        ],
+        function="chassisSlot_entPhysicalIndex",
+        object="entPhysicalIndex",
+        ignore_error=True,
+    )
+
+    def fanStatus(self, limit: int = 200, columns: Optional[List[str]] = None) -> ApiResult:
         """
         Retrieve fan information such as status, speed, and airflow.
 
         Args:
             limit (int): Maximum number of entries to retrieve.
+            columns (Optional[List[str]]): MIB objects to return; all of the method's objects by default.
 
         Returns:
             ApiResult: Fan hardware data from the switch.
         """
-        params = {
-            "domain": "mib",
-            "urn": "alaChasEntPhysFanTable",
-            "mibObject0": "entPhysicalIndex",
-            "mibObject1": "alaChasEntPhysFanLocalIndex",
-            "mibObject2": "alaChasEntPhysFanStatus",
-            "mibObject3": "alaChasEntPhysFanSpeed",
-            "mibObject4": "alaChasEntPhysFanAirflow",
-            "function": "chassisSlot_entPhysicalIndex",
-            "object": "entPhysicalIndex",
-            "limit": str(limit),
-            "ignoreError": "true"
-        }
-
-        return self._client.get("/", params=params)    
+        query = self._FAN_STATUS_QUERY.replace(limit=limit)
+
+        return self._client.get("/", params=query.select(columns))    
     
-    def runningDirectory(self, limit: int = 200) -> ApiResult:
+    _RUNNING_DIRECTORY_QUERY = MibQuery(
+        "chasControlModuleTable",
+        columns=[
+            "entPhysicalIndex",
+            "chasEntPhysOperStatus",
+            "chasControlCurrentRunningVersion",
+            "chasControlNextRunningVersion",
+            "chasControlCertifyStatus",
+            "chasControlWorkingVersion",
+            "chasControlRedundancyTime",
+            "chasControlSynchronizationStatus",
+            "configChangeStatus",
+        ],
+        function="chassis_entPhysIndex|getSwitchSecondaryCMMPhysicalIndex|getVCRole|csIsChassisModeVcOrErrStr|chassisSlotWithType_entPhysicalIndex",
+        object="index|chassis_entPhysIndex_0|chassis_entPhysIndex_0||entPhysicalIndex",
+        ignore_error=True,
+    )
+
+    def runningDirectory(self, limit: int = 200, columns: Optional[List[str]] = None) -> ApiResult:
         """
         Retrieve control module details including versions, status, and synchronization.
 
         Args:
             limit (int): Maximum number of entries to return.
+            columns (Optional[List[str]]): MIB objects to return; all of the method's objects by default.
 
         Returns:
             ApiResult: Control module information from the switch.
         """
-        params = {
-            "domain": "mib",
-            "urn": "chasControlModuleTable",
-            "mibObject0": "entPhysicalIndex",
-            "mibObject1": "chasEntPhysOperStatus",
-            "mibObject2": "chasControlCurrentRunningVersion",
-            "mibObject3": "chasControlNextRunningVersion",
-            "mibObject4": "chasControlCertifyStatus",
-            "mibObject5": "chasControlWorkingVersion",
-            "mibObject6": "chasControlRedundancyTime",
-            "mibObject7": "chasControlSynchronizationStatus",
-            "mibObject8": "configChangeStatus",
-            "function": "chassis_entPhysIndex|getSwitchSecondaryCMMPhysicalIndex|getVCRole|csIsChassisModeVcOrErrStr|chassisSlotWithType_entPhysicalIndex",
-            "object": "index|chassis_entPhysIndex_0|chassis_entPhysIndex_0||entPhysicalIndex",
-            "limit": str(limit),
-            "ignoreError": "true"
-        }
-
-        return self._client.get("/", params=params)   
-
-    def getHashControl(self) -> ApiResult:
+        query = self._RUNNING_DIRECTORY_QUERY.replace(limit=limit)
+
+        return self._client.get("/", params=query.select(columns))   
+
+    _GET_HASH_CONTROL_QUERY = MibQuery(
+        "alaCapManHashControlCommands",
+        columns=[
+            "alaCapManHashMode",
+            "alaCapManUdpTcpPortMode",
+            "alaCapManNonUCHashControl",
+            "alaCapManNonUCTunnelProtocol",
+            "alaCapManNonUCSourcePort",
+        ],
+    )
+
+    def getHashControl(self, columns: Optional[List[str]] = None) -> ApiResult:
         """
         Retrieve hash configuration parameters including hash mode and non-unicast behavior.
 
+        Args:
+            columns (Optional[List[str]]): MIB objects to return; all of the method's objects by default.
+
         Returns:
             ApiResult: Parsed hash control settings from the switch.
         """
-        params = {
-            "domain": "mib",
-            "urn": "alaCapManHashControlCommands",
-            "mibObject0": "alaCapManHashMode",
-            "mibObject1": "alaCapManUdpTcpPortMode",
-            "mibObject2": "alaCapManNonUCHashControl",
-            "mibObject3": "alaCapManNonUCTunnelProtocol",
-            "mibObject4": "alaCapManNonUCSourcePort"
-        }
-
-        return self._client.get("/", params=params)  
+        return self._client.get("/", params=self._GET_HASH_CONTROL_QUERY.select(columns))  
     
-    def getLEDStatus(self, filter_value: str = "CMM", limit: int = 200) -> ApiResult:
+    _GET_LED_STATUS_QUERY = MibQuery(
+        "chasEntPhysicalTable",
+        table_columns={
+            "chasEntPhysicalTable": [
+                "chasEntPhysLedStatusOk1",
+                "chasEntPhysLedStatusOk2",
+                "chasEntPhysLedStatusPrimaryCMM",
+                "chasEntPhysLedStatusSecondaryCMM",
+                "chasEntPhysLedStatusTemperature",
+                "chasEntPhysLedStatusFan",
+                "chasEntPhysLedStatusBackupPS",
+                "chasEntPhysLedStatusInternalPS",
+                "chasEntPhysLedStatusControl",
+                "chasEntPhysLedStatusFabric",
+                "chasEntPhysLedStatusPS",
+                "chasEntPhysOperStatus",
+                "chasEntPhysAdminStatus",
+                "entPhysicalIndex",
+            ],
+        },
+        function="entPhysIndexModuleType|chassisEntSlotArr_entPhysIndex",
+        object="entPhysicalIndex|entPhysicalIndex",
+        filter_object="entPhysIndexModuleType_0",
+        ignore_error=True,
+    )
+
+    def getLEDStatus(self, filter_value: str = "CMM", limit: int = 200, columns: Optional[List[str]] = None) -> ApiResult:
         """
         Retrieve the list of LED and status information for CMM modules.
 
         Args:
             filter_value (str): Filter to apply on entPhysIndexModuleType (e.g., "CMM").
             limit (int): Maximum number of entries to return.
+            columns (Optional[List[str]]): MIB objects to return; all of the method's objects by default.
 
         Returns:
             ApiResult: Parsed status data from the switch.
         """
-        params = {
-            "domain": "mib",
-            "urn": "chasEntPhysicalTable",
-            "chasEntPhysicalTable-mibObject0": "chasEntPhysLedStatusOk1",
-            "chasEntPhysicalTable-mibObject1": "chasEntPhysLedStatusOk2",
-            "chasEntPhysicalTable-mibObject2": "chasEntPhysLedStatusPrimaryCMM",
-            "chasEntPhysicalTable-mibObject3": "chasEntPhysLedStatusSecondaryCMM",
-            "chasEntPhysicalTable-mibObject4": "chasEntPhysLedStatusTemperature",
-            "chasEntPhysicalTable-mibObject5": "chasEntPhysLedStatusFan",
-            "chasEntPhysicalTable-mibObject6": "chasEntPhysLedStatusBackupPS",
-            "chasEntPhysicalTable-mibObject7": "chasEntPhysLedStatusInternalPS",
-            "chasEntPhysicalTable-mibObject8": "chasEntPhysLedStatusControl",
-            "chasEntPhysicalTable-mibObject9": "chasEntPhysLedStatusFabric",
-            "chasEntPhysicalTable-mibObject10": "chasEntPhysLedStatusPS",
-            "chasEntPhysicalTable-mibObject11": "chasEntPhysOperStatus",
-            "chasEntPhysicalTable-mibObject12": "chasEntPhysAdminStatus",
-            "chasEntPhysicalTable-mibObject13": "entPhysicalIndex",
-            "function": "entPhysIndexModuleType|chassisEntSlotArr_entPhysIndex",
-            "object": "entPhysicalIndex|entPhysicalIndex",
-            "filterObject": "entPhysIndexModuleType_0",
-            "filterOperation": "==",
-            "filterValue": filter_value,
-            "limit": str(limit),
-            "ignoreError": "true"
-        }
-
-        return self._client.get("/", params=params)       
+        query = self._GET_LED_STATUS_QUERY.replace(filter_value=filter_value, limit=limit)
 
+        return self._client.get("/", params=query.select(columns))
 
-    
+
+class AsyncChassisEndpoint(AsyncEndpointMixin, ChassisEndpoint):
+    """Asynchronous variant of `ChassisEndpoint` for use with `AsyncAosApiClient`."""
@@ -1,5 +1,5 @@
 from aos8_api.helper import parse_output_json
-from aos8_api.endpoints.base import BaseEndpoint
+from aos8_api.endpoints.base import BaseEndpoint, AsyncEndpointMixin
 from aos8_api.models import ApiResult
 
 class CLIEndpoint(BaseEndpoint):
@@ -13,5 +13,9 @@ class CLIEndpoint(BaseEndpoint):
             ApiResult of the CLI command.
         
         """
-        response = self._client.get(f"/cli/aos?cmd={cmd.replace(" ", "+")}")       
-        return response
\ No newline at end of file
+        response = self._client.get(f"/cli/aos?cmd={cmd.replace(' ', '+')}")
+        return response
+
+
+class AsyncCLIEndpoint(AsyncEndpointMixin, CLIEndpoint):
+    """Asynchronous variant of `CLIEndpoint` for use with `AsyncAosApiClient`."""
@@ -1,8 +1,11 @@
 from aos8_api.helper import parse_interface_status, parse_interface_detail, parse_violation_output_to_json, parse_violation_recovery_configuration
 from aos8_api.helper import parse_interfaces_capability, parse_interface_accounting, parse_interface_counters, parse_interface_counters_errors
-from typing import Optional,List, Dict, Union, Literal
-from aos8_api.endpoints.base import BaseEndpoint
+from aos8_api.helper import split_interface_detail
+from typing import Optional, List, Dict, Union, Literal, Tuple
+from aos8_api.endpoints.base import BaseEndpoint, AsyncEndpointMixin
 from aos8_api.models import ApiResult
+from aos8_api.ports import PortSet
+from aos8_api.query import MibQuery
 
 class InterfaceEndpoint(BaseEndpoint):
     """
@@ -10,189 +13,344 @@ class InterfaceEndpoint(BaseEndpoint):
     for Alcatel-Lucent OmniSwitch using MIB-based REST API.
     """
 
-    def _expand_port_range(self, port_range: str) -> list[str]:
+    def _run_and_show(
+        self,
+        cmd: str,
+        target: Optional[str],
+        show_cmd: str = "show+interfaces+port+{}",
+        parser=parse_interface_detail
+    ) -> ApiResult:
         """
-        Expand a port range string into a list of individual port identifiers.
+        Run a CLI command and, on success, replace its output with per-port show results.
 
         Args:
-            port_range: A string like "1/1/1-3" or "1/1/1".
+            cmd: CLI command with "+" separators (e.g., "interfaces+port+1/1/1+admin-state+enable").
+            target: Ports the command applies to, as written in `cmd` (e.g.,
+                "1/1/1-3", "port+1/1/1-3" or the slot "1/1"), or None to keep the command output.
+            show_cmd: Show command template, "{}" is replaced by each port or port range.
+            parser: Parser applied to each port's show output.
 
         Returns:
-            A list of individual port identifiers, e.g., ["1/1/1", "1/1/2", "1/1/3"].
+            An `ApiResult` whose output is the list of parsed show results, or
+            the first failed command's result.
+        """
+        commands, ports = self._port_commands(cmd, target)
+        for command in commands:
+            response = self._client.get(f"/cli/aos?cmd={command}")
+            if not response.success:
+                return response
+        if ports is not None:
+            response.output = self._show_ports(ports, show_cmd, parser)
+        return response
+
+    @staticmethod
+    def _port_commands(cmd: str, target: Optional[str]) -> Tuple[List[str], Optional[Union[PortSet, List[str]]]]:
         """
-        if '-' not in port_range:
-            return [port_range]
-        
-        prefix, start_end = port_range.rsplit('/', 1)
-        start, end = map(int, start_end.split('-'))
-        return [f"{prefix}/{i}" for i in range(start, end + 1)]
+        Split a CLI command over the port ranges of its target.
+
+        A list of "chassis/slot/port" ports or ranges the CLI does not take in
+        one command (e.g. "1/1/1-24,1/2/1-4") becomes one command per range
+        token of its `PortSet`. Other targets (slots such as "1/1", link
+        aggregates, ...) keep the command as is and are shown as given;
+        keyword targets such as "slot+1/1" are not shown.
+
+        Returns:
+            The commands to send, and the ports to show afterwards: a `PortSet`,
+            the target itself, or None if nothing is shown.
+        """
+        ports_spec = target[len("port+"):] if target and target.startswith("port+") else target
+        if not ports_spec or "+" in ports_spec:
+            return [cmd], None
+        tokens = ports_spec.replace(",", " ").split()
+        if not tokens or not all(token.partition("-")[0].count("/") >= 2 for token in tokens):
+            return [cmd], [ports_spec]
+        try:
+            ports = PortSet(ports_spec)
+        except ValueError:
+            return [cmd], [ports_spec]
+        return [cmd.replace(ports_spec, token, 1) for token in ports.ranges()], ports
+
+    # Show command whose multi-port output is split per port (see `_show_groups`).
+    _DETAIL_SHOW = "show+interfaces+port+{}"
+
+    def _show_ports(self, ports: Union[PortSet, List[str]], show_cmd: str, parser) -> list:
+        """
+        Run a show command for the given ports and collect the parsed outputs.
 
-    def list(self, limit: int = 200) -> ApiResult:
+        The show commands are sent concurrently, up to the client's
+        `show_concurrency` at a time. Ports missing from the output of a port
+        range are shown on their own.
+
+        Args:
+            ports: Ports to show, or targets shown as given (e.g. ["1/1"]).
+            show_cmd: Show command template, "{}" is replaced by each port or port range.
+            parser: Parser applied to each port's show output.
+
+        Returns:
+            A list of parsed outputs, in the order of `ports`, for the ports whose show command succeeded.
+        """
+        groups = self._show_groups(ports, show_cmd)
+        responses = self._get_all([f"/cli/aos?cmd={show_cmd.format(shown)}" for shown, _ in groups])
+        outputs, missing = self._collect_outputs(groups, responses)
+        if missing:
+            retried = self._get_all([f"/cli/aos?cmd={show_cmd.format(p)}" for p in missing])
+            outputs.update(self._collect_outputs([(p, [p]) for p in missing], retried)[0])
+        return [parser(outputs[p]) for p in ports if p in outputs]
+
+    @classmethod
+    def _show_groups(cls, ports: Union[PortSet, List[str]], show_cmd: str) -> List[Tuple[str, List[str]]]:
+        """
+        Plan the show commands for `ports`.
+
+        "show interfaces port" is run once per port range token (e.g.
+        "1/1/1-48"), since its output can be split per port. Other show
+        commands, and targets that are not a `PortSet`, are run once per entry.
+
+        Returns:
+            (port or port range to show, ports it covers) pairs.
+        """
+        if show_cmd != cls._DETAIL_SHOW or not isinstance(ports, PortSet):
+            return [(p, [p]) for p in ports]
+        return [(token, list(PortSet(token))) for token in ports.ranges()]
+
+    @classmethod
+    def _collect_outputs(cls, groups: List[Tuple[str, List[str]]], responses: List[ApiResult]) -> Tuple[Dict[str, str], List[str]]:
+        """
+        Split the responses of the planned show commands per port.
+
+        Returns:
+            The show output of each port, and the ports of port ranges whose output is missing.
+        """
+        outputs, missing = {}, []
+        for (_, members), show_resp in zip(groups, responses):
+            if show_resp.success:
+                outputs.update(cls._port_outputs(show_resp.output, members))
+            if len(members) > 1:
+                missing += [p for p in members if p not in outputs]
+        return outputs, missing
+
+    @staticmethod
+    def _port_outputs(output: str, members: List[str]) -> Dict[str, str]:
+        """
+        Split the output of one show command into the output of each port it covers.
+        """
+        if len(members) == 1:
+            return {members[0]: output}
+        blocks = split_interface_detail(output)
+        return {p: blocks[p] for p in members if p in blocks}
+
+    def _show(self, target: str, show_cmd: str, parser) -> ApiResult:
+        """
+        Run a show command for the ports of `target` and parse each output.
+
+        Each port of a port list is shown on its own, since the output of these
+        show commands cannot be split per port; other targets (a single port,
+        a slot) are shown with one command.
+
+        Args:
+            target: Port, port range or slot, e.g., "1/1/1", "1/1/1-4" or "1/1".
+            show_cmd: Show command template, "{}" is replaced by each port.
+            parser: Parser applied to each port's show output.
+
+        Returns:
+            An `ApiResult` whose output is the list of parsed show results, or
+            the first show command's result if none succeeded.
+        """
+        responses = self._get_all([f"/cli/aos?cmd={show_cmd.format(p)}" for p in self._show_targets(target, show_cmd)])
+        return self._parsed_shows(responses, parser)
+
+    @classmethod
+    def _show_targets(cls, target: str, show_cmd: str) -> List[str]:
+        """
+        Return the ports or targets `_show` sends one show command for.
+        """
+        _, ports = cls._port_commands(show_cmd.format(target), target)
+        return list(ports) if ports is not None else [target]
+
+    @staticmethod
+    def _parsed_shows(responses: List[ApiResult], parser) -> ApiResult:
+        """
+        Combine the responses of per-port show commands into one result with the parsed outputs.
+        """
+        succeeded = [response for response in responses if response.success]
+        if not succeeded:
+            return responses[0]
+        parsed = [parser(response.output) for response in succeeded]
+        succeeded[0].output = parsed
+        return succeeded[0]
+
+    _LIST_QUERY = MibQuery(
+        "esmConfTable",
+        columns=[
+            "ifIndex",
+            "esmPortAlias",
+            "esmPortGbicType",
+            "esmPortEPPEnable",
+            "esmPortInterfaceType",
+            "esmPortCfgAutoNegotiation",
+            "esmPortLinkUpDownTrapEnable",
+            "esmPortCfgPause",
+            "esmPortIsFiberChannelCapable",
+            "ifType",
+            "esmPortEEEEnable",
+            "esmPortMacsecSupported",
+            "esmPortMacsec256bit",
+        ],
+        joins={
+            "ifTable-ifIndex": ["ifIndex", "ifOperStatus", "ifAdminStatus"],
+            "alaPortXTable-ifIndex": ["ifIndex"],
+        },
+        function="slotPort_ifindex",
+        object="ifIndex",
+        ignore_error=True,
+    )
+
+    def list(self, limit: int = 200, columns: Optional[List[str]] = None) -> ApiResult:
         """
         Retrieve the list of ESM port configurations using the MIB-based REST API.
 
         Args:
             limit (int): Maximum number of results to return.
+            columns (Optional[List[str]]): MIB objects to return; all of the method's objects by default.
 
         Returns:
             ApiResult: Parsed ESM port config data from the switch.
         """
-        params = {
-            "domain": "mib",
-            "urn": "esmConfTable",
-            "mibObject0": "ifIndex",
-            "mibObject1": "esmPortAlias",
-            "mibObject2": "esmPortGbicType",
-            "mibObject3": "esmPortEPPEnable",
-            "mibObject4": "esmPortInterfaceType",
-            "mibObject5": "esmPortCfgAutoNegotiation",
-            "mibObject6": "esmPortLinkUpDownTrapEnable",
-            "mibObject7": "esmPortCfgPause",
-            "mibObject8": "esmPortIsFiberChannelCapable",
-            "mibObject9": "ifType",
-            "mibObject10": "esmPortEEEEnable",
-            "mibObject11": "esmPortMacsecSupported",
-            "mibObject12": "esmPortMacsec256bit",
-            "ifTable-ifIndex-0": "ifIndex",
-            "ifTable-ifIndex-1": "ifOperStatus",
-            "ifTable-ifIndex-2": "ifAdminStatus",
-            "alaPortXTable-ifIndex-0": "ifIndex",
-            "function": "slotPort_ifindex",
-            "object": "ifIndex",
-            "limit": str(limit),
-            "ignoreError": "true"
-        }
+        return self._client.get("/", params=self._LIST_QUERY.replace(limit=limit).select(columns))
 
-        response = self._client.get("/", params=params)
-        return response
+    def iter_list(self, page_size: int = 200):
+        """
+        Iterate over the ESM port configuration of every port, one page at a time.
+
+        Unlike `list`, rows are not truncated on chassis with many ports.
+
+        Args:
+            page_size (int): Number of rows requested per page.
+
+        Returns:
+            Iterator of (index, row) pairs.
+        """
+        return self._paginate(self._LIST_QUERY, page_size)
     
-    def status(self, limit: int = 200) -> ApiResult:
+    _STATUS_QUERY = MibQuery(
+        "esmConfTable",
+        columns=[
+            "ifIndex",
+            "esmPortAutoSpeed",
+            "esmPortAutoDuplexMode",
+            "esmLinkStateChangeTime",
+            "esmLinkStateChangeCount",
+            "esmPortFecOperMode",
+            "esmPortOperationalHybridType",
+            "esmPortCfgHybridActiveType",
+            "esmPortDownReason",
+        ],
+        joins={
+            "ifTable-ifIndex": ["ifIndex", "ifOperStatus", "ifAdminStatus"],
+        },
+        function="slotPort_ifindex",
+        object="ifIndex",
+        ignore_error=True,
+    )
+
+    def status(self, limit: int = 200, columns: Optional[List[str]] = None) -> ApiResult:
         """
         Retrieve detailed ESM port operational status using the MIB-based REST API.
 
         Args:
             limit (int): Maximum number of results to return. Defaults to 200.
+            columns (Optional[List[str]]): MIB objects to return; all of the method's objects by default.
 
         Returns:
             ApiResult: Parsed data from the switch response.
         """
-        params = {
-            "domain": "mib",
-            "urn": "esmConfTable",
-            "mibObject0": "ifIndex",
-            "mibObject1": "esmPortAutoSpeed",
-            "mibObject2": "esmPortAutoDuplexMode",
-            "mibObject3": "esmLinkStateChangeTime",
-            "mibObject4": "esmLinkStateChangeCount",
-            "mibObject5": "esmPortFecOperMode",
-            "mibObject6": "esmPortOperationalHybridType",
-            "mibObject7": "esmPortCfgHybridActiveType",
-            "mibObject8": "esmPortDownReason",
-            "ifTable-ifIndex-0": "ifIndex",
-            "ifTable-ifIndex-1": "ifOperStatus",
-            "ifTable-ifIndex-2": "ifAdminStatus",
-            "function": "slotPort_ifindex",
-            "object": "ifIndex",
-            "limit": str(limit),
-            "ignoreError": "true"
-        }
+        query = self._STATUS_QUERY.replace(limit=limit)
 
-        response = self._client.get("/", params=params)
+        response = self._client.get("/", params=query.select(columns))
         return response    
 
-    def status_extended(self, limit: int = 200) -> ApiResult:
+    _STATUS_EXTENDED_QUERY = MibQuery(
+        "esmConfTable",
+        columns=[
+            "ifIndex",
+            "esmPortCfgMaxFrameSize",
+            "esmPortIfg",
+            "esmPortCfgSpeed",
+            "esmPortCfgHybridMode",
+            "esmPortCfgDuplexMode",
+            "esmPortIngressRateLimitEnable",
+            "esmPortIngressRateLimit",
+            "esmPortIngressRateLimitBurst",
+            "esmPortFecMode",
+        ],
+        function="slotPort_ifindex",
+        object="ifIndex",
+        ignore_error=True,
+    )
+
+    def status_extended(self, limit: int = 200, columns: Optional[List[str]] = None) -> ApiResult:
         """
         Retrieve ESM port performance and ingress settings using MIB GET.
 
         Args:
             limit (int): Maximum number of results to return. Defaults to 200.
+            columns (Optional[List[str]]): MIB objects to return; all of the method's objects by default.
 
         Returns:
             ApiResult: Parsed data containing max frame size, speed, ingress rate limits, etc.
         """
-        params = {
-            "domain": "mib",
-            "urn": "esmConfTable",
-            "mibObject0": "ifIndex",
-            "mibObject1": "esmPortCfgMaxFrameSize",
-            "mibObject2": "esmPortIfg",
-            "mibObject3": "esmPortCfgSpeed",
-            "mibObject4": "esmPortCfgHybridMode",
-            "mibObject5": "esmPortCfgDuplexMode",
-            "mibObject6": "esmPortIngressRateLimitEnable",
-            "mibObject7": "esmPortIngressRateLimit",
-            "mibObject8": "esmPortIngressRateLimitBurst",
-            "mibObject9": "esmPortFecMode",
-            "function": "slotPort_ifindex",
-            "object": "ifIndex",
-            "limit": str(limit),
-            "ignoreError": "true"
-        }
+        query = self._STATUS_EXTENDED_QUERY.replace(limit=limit)
 
-        response = self._client.get("/", params=params)
+        response = self._client.get("/", params=query.select(columns))
         return response
 
-    def flood_control(self, limit: int = 200) -> ApiResult:
+    _FLOOD_CONTROL_QUERY = MibQuery(
+        "esmConfTable",
+        columns=[
+            "ifIndex",
+            "esmPortBcastRateLimitType",
+            "esmPortBcastRateLimit",
+            "esmPortMinBcastRateLimit",
+            "esmPortBcastRateLimitEnable",
+            "esmPortBcastStormState",
+            "esmPortBcastThresholdAction",
+            "esmPortUucastRateLimitType",
+            "esmPortUucastRateLimit",
+            "esmPortMinUucastRateLimit",
+            "esmPortUucastRateLimitEnable",
+            "esmPortUucastStormState",
+            "esmPortUucastThresholdAction",
+            "esmPortMcastRateLimitType",
+            "esmPortMcastRateLimit",
+            "esmPortMinMcastRateLimit",
+            "esmPortMcastRateLimitEnable",
+            "esmPortMcastStormState",
+            "esmPortMcastThresholdAction",
+        ],
+        function="slotPort_ifindex",
+        object="ifIndex",
+        ignore_error=True,
+    )
+
+    def flood_control(self, limit: int = 200, columns: Optional[List[str]] = None) -> ApiResult:
         """
         Retrieve broadcast, unicast, and multicast storm control settings.
 
         Args:
             limit (int): Maximum number of results to return. Defaults to 200.
+            columns (Optional[List[str]]): MIB objects to return; all of the method's objects by default.
 
         Returns:
             ApiResult: Parsed storm control data from the switch.
         """
-        params = {
-            "domain": "mib",
-            "urn": "esmConfTable",
-            "mibObject0": "ifIndex",
-            "mibObject1": "esmPortBcastRateLimitType",
-            "mibObject2": "esmPortBcastRateLimit",
-            "mibObject3": "esmPortMinBcastRateLimit",
-            "mibObject4": "esmPortBcastRateLimitEnable",
-            "mibObject5": "esmPortBcastStormState",
-            "mibObject6": "esmPortBcastThresholdAction",
-            "mibObject7": "esmPortUucastRateLimitType",
-            "mibObject8": "esmPortUucastRateLimit",
-            "mibObject9": "esmPortMinUucastRateLimit",
-            "mibObject10": "esmPortUucastRateLimitEnable",
-            "mibObject11": "esmPortUucastStormState",
-            "mibObject12": "esmPortUucastThresholdAction",
-            "mibObject13": "esmPortMcastRateLimitType",
-            "mibObject14": "esmPortMcastRateLimit",
-            "mibObject15": "esmPortMinMcastRateLimit",
-            "mibObject16": "esmPortMcastRateLimitEnable",
-            "mibObject17": "esmPortMcastStormState",
-            "mibObject18": "esmPortMcastThresholdAction",
-            "function": "slotPort_ifindex",
-            "object": "ifIndex",
-            "limit": str(limit),
-            "ignoreError": "true"
-        }
+        query = self._FLOOD_CONTROL_QUERY.replace(limit=limit)
 
-        response = self._client.get("/", params=params)
+        response = self._client.get("/", params=query.select(columns))
         return response
     
-    def statistic_packets(self, limit: int = 200) -> ApiResult:
-        """
-        Retrieve interface statistics (standard + FC-specific) from ifTable.
-
-        Args:
-            limit (int): Maximum number of results to retrieve. Defaults to 200.
-
-        Returns:
-            ApiResult: Parsed interface stats from the switch.
-        """
-        params = {
-            "domain": "mib",
-            "urn": "ifTable",
-            "function": "slotPort_ifindex",
-            "object": "ifIndex",
-            "limit": str(limit),
-            "ignoreError": "true"
-        }
-
-        mib_objects = [
+    _STATISTIC_PACKETS_QUERY = MibQuery(
+        "ifTable",
+        columns=[
             "ifIndex",
             "ifType",
             "ifAdminStatus",
@@ -218,91 +376,94 @@ class InterfaceEndpoint(BaseEndpoint):
             "ifHCInUcastPkts",
             "ifHCInMulticastPkts",
             "ifHCInBroadcastPkts",
-            "ifName"
-        ]
+            "ifName",
+        ],
+        function="slotPort_ifindex",
+        object="ifIndex",
+        ignore_error=True,
+    )
+
+    def statistic_packets(self, limit: int = 200, columns: Optional[List[str]] = None) -> ApiResult:
+        """
+        Retrieve interface statistics (standard + FC-specific) from ifTable.
+
+        Args:
+            limit (int): Maximum number of results to retrieve. Defaults to 200.
+            columns (Optional[List[str]]): MIB objects to return; all of the method's objects by default.
 
-        for i, obj in enumerate(mib_objects):
-            params[f"mibObject{i}"] = obj
+        Returns:
+            ApiResult: Parsed interface stats from the switch.
+        """
+        query = self._STATISTIC_PACKETS_QUERY.replace(limit=limit)
 
-        response = self._client.get("/", params=params)
+        response = self._client.get("/", params=query.select(columns))
         return response
 
-    def statistic_counter(self, limit: int = 200) -> ApiResult:
+    _STATISTIC_COUNTER_QUERY = MibQuery(
+        "interfaceStatsTable",
+        columns=[
+            "ifIndex",
+            "outBitsPerSec",
+            "ifOutPauseFrames",
+            "ifOutPktsPerSec",
+            "inBitsPerSec",
+            "ifInPauseFrames",
+            "ifInPktsPerSec",
+        ],
+        function="slotPort_ifindex",
+        object="ifIndex",
+        ignore_error=True,
+    )
+
+    def statistic_counter(self, limit: int = 200, columns: Optional[List[str]] = None) -> ApiResult:
         """
         Retrieve real-time interface traffic rates and pause frame stats.
 
         Args:
             limit (int): Maximum number of results to retrieve. Defaults to 200.
+            columns (Optional[List[str]]): MIB objects to return; all of the method's objects by default.
 
         Returns:
             ApiResult: Parsed interface rate and pause frame stats from the switch.
         """
-        params = {
-            "domain": "mib",
-            "urn": "interfaceStatsTable",
-            "mibObject0": "ifIndex",
-            "mibObject1": "outBitsPerSec",
-            "mibObject2": "ifOutPauseFrames",
-            "mibObject3": "ifOutPktsPerSec",
-            "mibObject4": "inBitsPerSec",
-            "mibObject5": "ifInPauseFrames",
-            "mibObject6": "ifInPktsPerSec",
-            "function": "slotPort_ifindex",
-            "object": "ifIndex",
-            "limit": str(limit),
-            "ignoreError": "true"
-        }
+        query = self._STATISTIC_COUNTER_QUERY.replace(limit=limit)
 
-        response = self._client.get("/", params=params)
+        response = self._client.get("/", params=query.select(columns))
         return response
 
-    def statistic_collisions(self, limit: int = 200) -> ApiResult:
+    _STATISTIC_COLLISIONS_QUERY = MibQuery(
+        "alcetherStatsTable",
+        columns=[
+            "ifIndex",
+            "alcetherStatsRxCollisions",
+            "dot3StatsSingleCollisionFrames",
+            "dot3StatsMultipleCollisionFrames",
+            "dot3StatsExcessiveCollisions",
+        ],
+        function="slotPort_ifindex",
+        object="ifIndex",
+        ignore_error=True,
+    )
+
+    def statistic_collisions(self, limit: int = 200, columns: Optional[List[str]] = None) -> ApiResult:
         """
         Retrieve Ethernet collision stats using the MIB-based REST API.
 
         Args:
             limit (int): Maximum number of results to return. Defaults to 200.
+            columns (Optional[List[str]]): MIB objects to return; all of the method's objects by default.
 
         Returns:
             ApiResult: Parsed Ethernet collision statistics.
         """
-        params = {
-            "domain": "mib",
-            "urn": "alcetherStatsTable",
-            "mibObject0": "ifIndex",
-            "mibObject1": "alcetherStatsRxCollisions",
-            "mibObject2": "dot3StatsSingleCollisionFrames",
-            "mibObject3": "dot3StatsMultipleCollisionFrames",
-            "mibObject4": "dot3StatsExcessiveCollisions",
-            "function": "slotPort_ifindex",
-            "object": "ifIndex",
-            "limit": str(limit),
-            "ignoreError": "true"
-        }
+        query = self._STATISTIC_COLLISIONS_QUERY.replace(limit=limit)
 
-        response = self._client.get("/", params=params)
+        response = self._client.get("/", params=query.select(columns))
         return response
 
-    def statistic_packets_counter(self, limit: int = 200) -> ApiResult:
-        """
-        Retrieve high-capacity traffic and pause frame counters from alcetherStatsTable.
-
-        Args:
-            limit (int): Maximum number of entries to retrieve. Defaults to 200.
-
-        Returns:
-            ApiResult: Parsed traffic and pause frame statistics.
-        """
-        params = {
-            "domain": "mib",
-            "urn": "alcetherStatsTable",
-            "function": "slotPort_ifindex",
-            "object": "ifIndex",
-            "limit": str(limit),
-            "ignoreError": "true"
-        }
-
-        mib_objects = [
+    _STATISTIC_PACKETS_COUNTER_QUERY = MibQuery(
+        "alcetherStatsTable",
+        columns=[
             "ifIndex",
             "ifHCInOctets",
             "ifHCOutOctets",
@@ -313,74 +474,64 @@ class InterfaceEndpoint(BaseEndpoint):
             "ifHCInBroadcastPkts",
             "ifHCOutBroadcastPkts",
             "dot3InPauseFrames",
-            "dot3OutPauseFrames"
-        ]
-
-        for i, obj in enumerate(mib_objects):
-            params[f"mibObject{i}"] = obj
+            "dot3OutPauseFrames",
+        ],
+        function="slotPort_ifindex",
+        object="ifIndex",
+        ignore_error=True,
+    )
 
-        response = self._client.get("/", params=params)
-        return response
-
-    def statistic_errors_counter(self, limit: int = 200) -> ApiResult:
+    def statistic_packets_counter(self, limit: int = 200, columns: Optional[List[str]] = None) -> ApiResult:
         """
-        Retrieve Ethernet error statistics such as alignment errors, FCS errors, and oversized/undersized frames.
+        Retrieve high-capacity traffic and pause frame counters from alcetherStatsTable.
 
         Args:
             limit (int): Maximum number of entries to retrieve. Defaults to 200.
+            columns (Optional[List[str]]): MIB objects to return; all of the method's objects by default.
 
         Returns:
-            ApiResult: Parsed Ethernet error statistics from the switch.
+            ApiResult: Parsed traffic and pause frame statistics.
         """
-        params = {
-            "domain": "mib",
-            "urn": "alcetherStatsTable",
-            "function": "slotPort_ifindex",
-            "object": "ifIndex",
-            "limit": str(limit),
-            "ignoreError": "true"
-        }
+        query = self._STATISTIC_PACKETS_COUNTER_QUERY.replace(limit=limit)
 
-        mib_objects = [
+        response = self._client.get("/", params=query.select(columns))
+        return response
+
+    _STATISTIC_ERRORS_COUNTER_QUERY = MibQuery(
+        "alcetherStatsTable",
+        columns=[
             "ifIndex",
             "dot3StatsAlignmentErrors",
             "dot3StatsFCSErrors",
             "ifInErrors",
             "ifOutErrors",
             "alcetherStatsRxUndersizePkts",
-            "dot3StatsFrameTooLongs"
-        ]
-
-        for i, obj in enumerate(mib_objects):
-            params[f"mibObject{i}"] = obj
-
-        response = self._client.get("/", params=params)
-        return response
+            "dot3StatsFrameTooLongs",
+        ],
+        function="slotPort_ifindex",
+        object="ifIndex",
+        ignore_error=True,
+    )
 
-    def statistic_traffic(self, if_type: int = 6, limit: int = 200) -> ApiResult:
+    def statistic_errors_counter(self, limit: int = 200, columns: Optional[List[str]] = None) -> ApiResult:
         """
-        Retrieve high-capacity interface traffic statistics from ifXTable.
+        Retrieve Ethernet error statistics such as alignment errors, FCS errors, and oversized/undersized frames.
 
         Args:
-            if_type (int): Interface type to filter (default 6 for Ethernet).
-            limit (int): Max number of entries to retrieve. Defaults to 200.
+            limit (int): Maximum number of entries to retrieve. Defaults to 200.
+            columns (Optional[List[str]]): MIB objects to return; all of the method's objects by default.
 
         Returns:
-            ApiResult: Parsed traffic stats from the switch.
+            ApiResult: Parsed Ethernet error statistics from the switch.
         """
-        params = {
-            "domain": "mib",
-            "urn": "ifXTable",
-            "function": "slotPort_ifindex",
-            "object": "ifIndex",
-            "filterObject": "ifType",
-            "filterOperation": "==",
-            "filterValue": str(if_type),
-            "limit": str(limit),
-            "ignoreError": "true"
-        }
+        query = self._STATISTIC_ERRORS_COUNTER_QUERY.replace(limit=limit)
+
+        response = self._client.get("/", params=query.select(columns))
+        return response
 
-        mib_objects = [
+    _STATISTIC_TRAFFIC_QUERY = MibQuery(
+        "ifXTable",
+        columns=[
             "ifType",
             "ifIndex",
             "ifHCInUcastPkts",
@@ -390,421 +541,485 @@ class InterfaceEndpoint(BaseEndpoint):
             "ifHCOutUcastPkts",
             "ifHCOutMulticastPkts",
             "ifHCOutBroadcastPkts",
-            "ifHCOutOctets"
-        ]
+            "ifHCOutOctets",
+        ],
+        function="slotPort_ifindex",
+        object="ifIndex",
+        filter_object="ifType",
+        ignore_error=True,
+    )
+
+    def statistic_traffic(self, if_type: int = 6, limit: int = 200, columns: Optional[List[str]] = None) -> ApiResult:
+        """
+        Retrieve high-capacity interface traffic statistics from ifXTable.
+
+        Args:
+            if_type (int): Interface type to filter (default 6 for Ethernet).
+            limit (int): Max number of entries to retrieve. Defaults to 200.
+            columns (Optional[List[str]]): MIB objects to return; all of the method's objects by default.
 
-        for i, obj in enumerate(mib_objects):
-            params[f"mibObject{i}"] = obj
+        Returns:
+            ApiResult: Parsed traffic stats from the switch.
+        """
+        query = self._STATISTIC_TRAFFIC_QUERY.replace(filter_value=if_type, limit=limit)
 
-        response = self._client.get("/", params=params)
+        response = self._client.get("/", params=query.select(columns))
         return response
 
-    def globalPVR(self) -> ApiResult:
+    _GLOBAL_PVR_QUERY = MibQuery(
+        "alaPvrGlobalConfigObjects",
+        columns=[
+            "alaPvrGlobalTrapEnable",
+            "alaPvrGlobalRetryTime",
+            "alaPvrGlobalRecoveryMax",
+        ],
+    )
+
+    def globalPVR(self, columns: Optional[List[str]] = None) -> ApiResult:
         """
         Retrieve global PVR configuration values.
 
+        Args:
+            columns (Optional[List[str]]): MIB objects to return; all of the method's objects by default.
+
         Returns:
             ApiResult: Parsed global PVR configuration from the switch.
         """
-        params = {
-            "domain": "mib",
-            "urn": "alaPvrGlobalConfigObjects",
-            "mibObject0": "alaPvrGlobalTrapEnable",
-            "mibObject1": "alaPvrGlobalRetryTime",
-            "mibObject2": "alaPvrGlobalRecoveryMax"
-        }
-
-        response = self._client.get("/", params=params)
+        response = self._client.get("/", params=self._GLOBAL_PVR_QUERY.select(columns))
         return response
     
-    def recovery_port_config(self, limit: int = 200) -> ApiResult:
+    _RECOVERY_PORT_CONFIG_QUERY = MibQuery(
+        "alaPvrConfigTable",
+        columns=[
+            "ifIndex",
+            "alaPvrRecoveryMax",
+            "alaPvrRetryTime",
+            "alaPvrGlobalRetryTime",
+            "alaPvrGlobalRecoveryMax",
+        ],
+        function="slotPort_ifindex",
+        object="ifIndex",
+        ignore_error=True,
+    )
+
+    def recovery_port_config(self, limit: int = 200, columns: Optional[List[str]] = None) -> ApiResult:
         """
         Retrieve PVR configuration for each interface using MIB-based GET.
 
         Args:
             limit (int): Maximum number of entries to retrieve. Defaults to 200.
+            columns (Optional[List[str]]): MIB objects to return; all of the method's objects by default.
 
         Returns:
             ApiResult: Parsed PVR configuration data from the switch.
         """
-        params = {
-            "domain": "mib",
-            "urn": "alaPvrConfigTable",
-            "mibObject0": "ifIndex",
-            "mibObject1": "alaPvrRecoveryMax",
-            "mibObject2": "alaPvrRetryTime",
-            "mibObject3": "alaPvrGlobalRetryTime",
-            "mibObject4": "alaPvrGlobalRecoveryMax",
-            "function": "slotPort_ifindex",
-            "object": "ifIndex",
-            "limit": str(limit),
-            "ignoreError": "true"
-        }
+        query = self._RECOVERY_PORT_CONFIG_QUERY.replace(limit=limit)
 
-        response = self._client.get("/", params=params)
+        response = self._client.get("/", params=query.select(columns))
         return response
 
-    def port_violation_status(self, limit: int = 200) -> ApiResult:
+    _PORT_VIOLATION_STATUS_QUERY = MibQuery(
+        "portViolationTable",
+        columns=[
+            "portViolationIfIndex",
+            "portViolationSource",
+            "portViolationReason",
+            "portViolationAction",
+            "portViolationCfgRetryTime",
+            "portViolationCfgRecoveryMax",
+            "portViolationRetryRemain",
+            "portViolationClearPort",
+        ],
+        function="slotPort_ifindex",
+        object="portViolationIfIndex",
+        ignore_error=True,
+    )
+
+    def port_violation_status(self, limit: int = 200, columns: Optional[List[str]] = None) -> ApiResult:
         """
         Retrieve port violation events with details like reason, action, and retry status.
 
         Args:
             limit (int): Maximum number of records to retrieve. Defaults to 200.
+            columns (Optional[List[str]]): MIB objects to return; all of the method's objects by default.
 
         Returns:
             ApiResult: Parsed port violation data from the switch.
         """
-        params = {
-            "domain": "mib",
-            "urn": "portViolationTable",
-            "mibObject0": "portViolationIfIndex",
-            "mibObject1": "portViolationSource",
-            "mibObject2": "portViolationReason",
-            "mibObject3": "portViolationAction",
-            "mibObject4": "portViolationCfgRetryTime",
-            "mibObject5": "portViolationCfgRecoveryMax",
-            "mibObject6": "portViolationRetryRemain",
-            "mibObject7": "portViolationClearPort",
-            "function": "slotPort_ifindex",
-            "object": "portViolationIfIndex",
-            "limit": str(limit),
-            "ignoreError": "true"
-        }
+        query = self._PORT_VIOLATION_STATUS_QUERY.replace(limit=limit)
 
-        response = self._client.get("/", params=params)
+        response = self._client.get("/", params=query.select(columns))
         return response
     
-    def port_mirroring_sessions(self, limit: int = 200) -> ApiResult:
+    _PORT_MIRRORING_SESSIONS_QUERY = MibQuery(
+        "mirrorTable",
+        columns=[
+            "mirrorSessionNumber",
+            "mirrorStatus",
+            "mirrorUnblockedVLAN",
+            "mirrorTaggedVLAN",
+            "mirrorSessOperStatus",
+        ],
+        function="slotPort_ifindex",
+        object="mirrorSrcMirroredIf",
+        ignore_error=True,
+    )
+
+    def port_mirroring_sessions(self, limit: int = 200, columns: Optional[List[str]] = None) -> ApiResult:
         """
         Retrieve mirror session configuration and status from the switch.
 
         Args:
             limit (int): Maximum number of sessions to retrieve. Defaults to 200.
+            columns (Optional[List[str]]): MIB objects to return; all of the method's objects by default.
 
         Returns:
             ApiResult: Parsed mirror session data from the switch.
         """
-        params = {
-            "domain": "mib",
-            "urn": "mirrorTable",
-            "mibObject0": "mirrorSessionNumber",
-            "mibObject1": "mirrorStatus",
-            "mibObject2": "mirrorUnblockedVLAN",
-            "mibObject3": "mirrorTaggedVLAN",
-            "mibObject4": "mirrorSessOperStatus",
-            "function": "slotPort_ifindex",
-            "object": "mirrorSrcMirroredIf",
-            "limit": str(limit),
-            "ignoreError": "true"
-        }
+        query = self._PORT_MIRRORING_SESSIONS_QUERY.replace(limit=limit)
 
-        response = self._client.get("/", params=params)
+        response = self._client.get("/", params=query.select(columns))
         return response
 
-    def port_mirroring_source(self, limit: int = 200) -> ApiResult:
+    _PORT_MIRRORING_SOURCE_QUERY = MibQuery(
+        "mirrorSrcTable",
+        columns=[
+            "mirrorSessionNumber",
+            "mirrorSrcMirroredIf",
+            "mirrorSrcDirection",
+            "mirrorSrcStatus",
+        ],
+        function="slotPort_ifindex",
+        object="mirrorSrcMirroredIf",
+        ignore_error=True,
+    )
+
+    def port_mirroring_source(self, limit: int = 200, columns: Optional[List[str]] = None) -> ApiResult:
         """
         Retrieve source port configuration for mirror sessions.
 
         Args:
             limit (int): Maximum number of source entries to retrieve. Defaults to 200.
+            columns (Optional[List[str]]): MIB objects to return; all of the method's objects by default.
 
         Returns:
             ApiResult: Parsed mirror source port configuration from the switch.
         """
-        params = {
-            "domain": "mib",
-            "urn": "mirrorSrcTable",
-            "mibObject0": "mirrorSessionNumber",
-            "mibObject1": "mirrorSrcMirroredIf",
-            "mibObject2": "mirrorSrcDirection",
-            "mibObject3": "mirrorSrcStatus",
-            "function": "slotPort_ifindex",
-            "object": "mirrorSrcMirroredIf",
-            "limit": str(limit),
-            "ignoreError": "true"
-        }
+        query = self._PORT_MIRRORING_SOURCE_QUERY.replace(limit=limit)
 
-        response = self._client.get("/", params=params)
+        response = self._client.get("/", params=query.select(columns))
         return response
 
-    def port_mirroring_destination(self, limit: int = 200) -> ApiResult:
+    _PORT_MIRRORING_DESTINATION_QUERY = MibQuery(
+        "mirrorDstTable",
+        columns=[
+            "mirrorSessionNumber",
+            "mirrorDstMirroringIf",
+            "mirrorDstAdminStatus",
+        ],
+        function="slotPort_ifindex",
+        object="mirrorDstMirroringIf",
+        ignore_error=True,
+    )
+
+    def port_mirroring_destination(self, limit: int = 200, columns: Optional[List[str]] = None) -> ApiResult:
         """
         Retrieve mirror destination port configuration.
 
         Args:
             limit (int): Maximum number of destination entries to retrieve. Defaults to 200.
+            columns (Optional[List[str]]): MIB objects to return; all of the method's objects by default.
 
         Returns:
             ApiResult: Parsed mirror destination configuration from the switch.
         """
-        params = {
-            "domain": "mib",
-            "urn": "mirrorDstTable",
-            "mibObject0": "mirrorSessionNumber",
-            "mibObject1": "mirrorDstMirroringIf",
-            "mibObject2": "mirrorDstAdminStatus",
-            "function": "slotPort_ifindex",
-            "object": "mirrorDstMirroringIf",
-            "limit": str(limit),
-            "ignoreError": "true"
-        }
+        query = self._PORT_MIRRORING_DESTINATION_QUERY.replace(limit=limit)
 
-        response = self._client.get("/", params=params)
+        response = self._client.get("/", params=query.select(columns))
         return response
 
-    def port_monitoring_config(self, limit: int = 200) -> ApiResult:
+    _PORT_MONITORING_CONFIG_QUERY = MibQuery(
+        "monitorSrcTable",
+        columns=[
+            "monitorSessionNumber",
+            "monitorSrcIfindex",
+            "monitorSrcDirection",
+            "monitorSrcStatus",
+        ],
+        function="slotPort_ifindex",
+        object="monitorSrcIfindex",
+        ignore_error=True,
+    )
+
+    def port_monitoring_config(self, limit: int = 200, columns: Optional[List[str]] = None) -> ApiResult:
         """
         Retrieve monitor source port configuration from the switch.
 
         Args:
             limit (int): Maximum number of entries to retrieve. Defaults to 200.
+            columns (Optional[List[str]]): MIB objects to return; all of the method's objects by default.
 
         Returns:
             ApiResult: Parsed monitor source port data from the switch.
         """
-        params = {
-            "domain": "mib",
-            "urn": "monitorSrcTable",
-            "mibObject0": "monitorSessionNumber",
-            "mibObject1": "monitorSrcIfindex",
-            "mibObject2": "monitorSrcDirection",
-            "mibObject3": "monitorSrcStatus",
-            "function": "slotPort_ifindex",
-            "object": "monitorSrcIfindex",
-            "limit": str(limit),
-            "ignoreError": "true"
-        }
+        query = self._PORT_MONITORING_CONFIG_QUERY.replace(limit=limit)
 
-        response = self._client.get("/", params=params)
+        response = self._client.get("/", params=query.select(columns))
         return response
     
-    def port_monitoring_session(self, limit: int = 200) -> ApiResult:
+    _PORT_MONITORING_SESSION_QUERY = MibQuery(
+        "monitorTable",
+        columns=[
+            "monitorSessionNumber",
+            "monitorFileName",
+            "monitorFileSize",
+            "monitorFileOverWrite",
+            "monitorStatus",
+            "monitorTimeout",
+            "monitorCaptureType",
+            "monitorScreenStatus",
+            "monitorScreenLine",
+        ],
+        ignore_error=True,
+    )
+
+    def port_monitoring_session(self, limit: int = 200, columns: Optional[List[str]] = None) -> ApiResult:
         """
         Retrieve monitor session information.
 
         Args:
             limit (int): Maximum number of entries to retrieve. Defaults to 200.
+            columns (Optional[List[str]]): MIB objects to return; all of the method's objects by default.
 
         Returns:
             ApiResult: Parsed monitor session configuration from the switch.
         """
-        params = {
-            "domain": "mib",
-            "urn": "monitorTable",
-            "mibObject0": "monitorSessionNumber",
-            "mibObject1": "monitorFileName",
-            "mibObject2": "monitorFileSize",
-            "mibObject3": "monitorFileOverWrite",
-            "mibObject4": "monitorStatus",
-            "mibObject5": "monitorTimeout",
-            "mibObject6": "monitorCaptureType",
-            "mibObject7": "monitorScreenStatus",
-            "mibObject8": "monitorScreenLine",
-            "limit": str(limit),
-            "ignoreError": "true"
-        }
+        query = self._PORT_MONITORING_SESSION_QUERY.replace(limit=limit)
 
-        response = self._client.get("/", params=params)
+        response = self._client.get("/", params=query.select(columns))
         return response    
     
-    def link_monitoring_config(self, limit: int = 200) -> ApiResult:
+    _LINK_MONITORING_CONFIG_QUERY = MibQuery(
+        "alaLinkMonConfigTable",
+        columns=[
+            "ifIndex",
+            "alaLinkMonStatus",
+            "alaLinkMonTimeWindow",
+            "alaLinkMonLinkFlapThreshold",
+            "alaLinkMonLinkErrorThreshold",
+            "alaLinkMonWaitToRestoreTimer",
+            "alaLinkMonWaitToShutdownTimer",
+        ],
+        function="slotPort_ifindex",
+        object="ifIndex",
+        ignore_error=True,
+    )
+
+    def link_monitoring_config(self, limit: int = 200, columns: Optional[List[str]] = None) -> ApiResult:
         """
         Retrieve link monitoring settings per interface.
 
         Args:
             limit (int): Maximum number of entries to retrieve. Defaults to 200.
+            columns (Optional[List[str]]): MIB objects to return; all of the method's objects by default.
 
         Returns:
             ApiResult: Parsed link monitor configuration from the switch.
         """
-        params = {
-            "domain": "mib",
-            "urn": "alaLinkMonConfigTable",
-            "mibObject0": "ifIndex",
-            "mibObject1": "alaLinkMonStatus",
-            "mibObject2": "alaLinkMonTimeWindow",
-            "mibObject3": "alaLinkMonLinkFlapThreshold",
-            "mibObject4": "alaLinkMonLinkErrorThreshold",
-            "mibObject5": "alaLinkMonWaitToRestoreTimer",
-            "mibObject6": "alaLinkMonWaitToShutdownTimer",
-            "function": "slotPort_ifindex",
-            "object": "ifIndex",
-            "limit": str(limit),
-            "ignoreError": "true"
-        }
+        query = self._LINK_MONITORING_CONFIG_QUERY.replace(limit=limit)
 
-        response = self._client.get("/", params=params)
+        response = self._client.get("/", params=query.select(columns))
         return response
 
-    def link_monitoring_statistic(self, limit: int = 200) -> ApiResult:
+    _LINK_MONITORING_STATISTIC_QUERY = MibQuery(
+        "alaLinkMonStatsTable",
+        columns=[
+            "ifIndex",
+            "alaLinkMonStatsPortState",
+            "alaLinkMonStatsCurrentLinkFlaps",
+            "alaLinkMonStatsCurrentErrorFrames",
+            "alaLinkMonStatsCurrentCRCErrors",
+            "alaLinkMonStatsCurrentLostFrames",
+            "alaLinkMonStatsCurrentAlignErrors",
+            "alaLinkMonStatsCurrentLinkErrors",
+            "alaLinkMonStatsTotalLinkFlaps",
+            "alaLinkMonStatsTotalLinkErrors",
+        ],
+        function="slotPort_ifindex",
+        object="ifIndex",
+        ignore_error=True,
+    )
+
+    def link_monitoring_statistic(self, limit: int = 200, columns: Optional[List[str]] = None) -> ApiResult:
         """
         Retrieve real-time and cumulative link monitoring statistics for all interfaces.
 
         Args:
             limit (int): Maximum number of entries to retrieve. Defaults to 200.
+            columns (Optional[List[str]]): MIB objects to return; all of the method's objects by default.
 
         Returns:
             ApiResult: Parsed link monitor statistics from the switch.
         """
-        params = {
-            "domain": "mib",
-            "urn": "alaLinkMonStatsTable",
-            "mibObject0": "ifIndex",
-            "mibObject1": "alaLinkMonStatsPortState",
-            "mibObject2": "alaLinkMonStatsCurrentLinkFlaps",
-            "mibObject3": "alaLinkMonStatsCurrentErrorFrames",
-            "mibObject4": "alaLinkMonStatsCurrentCRCErrors",
-            "mibObject5": "alaLinkMonStatsCurrentLostFrames",
-            "mibObject6": "alaLinkMonStatsCurrentAlignErrors",
-            "mibObject7": "alaLinkMonStatsCurrentLinkErrors",
-            "mibObject8": "alaLinkMonStatsTotalLinkFlaps",
-            "mibObject9": "alaLinkMonStatsTotalLinkErrors",
-            "function": "slotPort_ifindex",
-            "object": "ifIndex",
-            "limit": str(limit),
-            "ignoreError": "true"
-        }
+        query = self._LINK_MONITORING_STATISTIC_QUERY.replace(limit=limit)
 
-        response = self._client.get("/", params=params)
+        response = self._client.get("/", params=query.select(columns))
         return response
 
-    def globalPTPConfig(self) -> ApiResult:
+    _GLOBAL_PTP_CONFIG_QUERY = MibQuery(
+        "alaPtpConfiguration",
+        columns=[
+            "alaPtpConfigAdminStatus",
+            "alaPtpConfigPriority",
+            "alaPtpLoopBackPort1",
+            "alaPtpLoopBackPort2",
+        ],
+    )
+
+    def globalPTPConfig(self, columns: Optional[List[str]] = None) -> ApiResult:
         """
         Retrieve the global PTP (Precision Time Protocol) configuration.
 
+        Args:
+            columns (Optional[List[str]]): MIB objects to return; all of the method's objects by default.
+
         Returns:
             ApiResult: Parsed PTP configuration data from the switch.
         """
-        params = {
-            "domain": "mib",
-            "urn": "alaPtpConfiguration",
-            "mibObject0": "alaPtpConfigAdminStatus",
-            "mibObject1": "alaPtpConfigPriority",
-            "mibObject2": "alaPtpLoopBackPort1",
-            "mibObject3": "alaPtpLoopBackPort2"
-        }
-
-        response = self._client.get("/", params=params)
+        response = self._client.get("/", params=self._GLOBAL_PTP_CONFIG_QUERY.select(columns))
         return response
 
-    def ptpPortConfig(self, limit: int = 200) -> ApiResult:
+    _PTP_PORT_CONFIG_QUERY = MibQuery(
+        "alaPtpPortTable",
+        columns=[
+            "ifIndex",
+            "alaPtpPortAdminStatus",
+        ],
+        function="slotPort_ifindex",
+        object="ifIndex",
+        ignore_error=True,
+    )
+
+    def ptpPortConfig(self, limit: int = 200, columns: Optional[List[str]] = None) -> ApiResult:
         """
         Retrieve PTP administrative status for all switch ports.
 
         Args:
             limit (int): Maximum number of entries to return. Defaults to 200.
+            columns (Optional[List[str]]): MIB objects to return; all of the method's objects by default.
 
         Returns:
             ApiResult: Parsed PTP port configuration data from the switch.
         """
-        params = {
-            "domain": "mib",
-            "urn": "alaPtpPortTable",
-            "mibObject0": "ifIndex",
-            "mibObject1": "alaPtpPortAdminStatus",
-            "function": "slotPort_ifindex",
-            "object": "ifIndex",
-            "limit": str(limit),
-            "ignoreError": "true"
-        }
+        query = self._PTP_PORT_CONFIG_QUERY.replace(limit=limit)
 
-        response = self._client.get("/", params=params)
+        response = self._client.get("/", params=query.select(columns))
         return response
 
-    def tdrStats(self, limit: int = 200) -> ApiResult:
+    _TDR_STATS_QUERY = MibQuery(
+        "esmTdrPortTable",
+        columns=[
+            "ifIndex",
+            "esmTdrPortValidPairs",
+            "esmTdrPortCableState",
+            "esmTdrPortFuzzLength",
+            "esmTdrPortPair1State",
+            "esmTdrPortPair1Length",
+            "esmTdrPortPair2State",
+            "esmTdrPortPair2Length",
+            "esmTdrPortPair3State",
+            "esmTdrPortPair3Length",
+            "esmTdrPortPair4State",
+            "esmTdrPortPair4Length",
+            "esmTdrPortResult",
+            "esmTdrPortTest",
+        ],
+        function="slotPort_ifindex",
+        object="ifIndex",
+        ignore_error=True,
+    )
+
+    def tdrStats(self, limit: int = 200, columns: Optional[List[str]] = None) -> ApiResult:
         """
         Retrieve cable diagnostics for all Ethernet switch ports.
 
         Args:
             limit (int): Maximum number of entries to return. Defaults to 200.
+            columns (Optional[List[str]]): MIB objects to return; all of the method's objects by default.
 
         Returns:
             ApiResult: Parsed TDR port diagnostics data from the switch.
         """
-        params = {
-            "domain": "mib",
-            "urn": "esmTdrPortTable",
-            "mibObject0": "ifIndex",
-            "mibObject1": "esmTdrPortValidPairs",
-            "mibObject2": "esmTdrPortCableState",
-            "mibObject3": "esmTdrPortFuzzLength",
-            "mibObject4": "esmTdrPortPair1State",
-            "mibObject5": "esmTdrPortPair1Length",
-            "mibObject6": "esmTdrPortPair2State",
-            "mibObject7": "esmTdrPortPair2Length",
-            "mibObject8": "esmTdrPortPair3State",
-            "mibObject9": "esmTdrPortPair3Length",
-            "mibObject10": "esmTdrPortPair4State",
-            "mibObject11": "esmTdrPortPair4Length",
-            "mibObject12": "esmTdrPortResult",
-            "mibObject13": "esmTdrPortTest",
-            "function": "slotPort_ifindex",
-            "object": "ifIndex",
-            "limit": str(limit),
-            "ignoreError": "true"
-        }
+        query = self._TDR_STATS_QUERY.replace(limit=limit)
 
-        response = self._client.get("/", params=params)
+        response = self._client.get("/", params=query.select(columns))
         return response
 
-    def portMappingConfig(self, limit: int = 200) -> ApiResult:
+    _PORT_MAPPING_CONFIG_QUERY = MibQuery(
+        "portMappingTable",
+        columns=[
+            "pmapSessionNumber",
+            "pmapPortIfIndex",
+            "pmapPortType",
+        ],
+        function="slotPort_ifindex",
+        object="pmapPortIfIndex",
+        ignore_error=True,
+    )
+
+    def portMappingConfig(self, limit: int = 200, columns: Optional[List[str]] = None) -> ApiResult:
         """
         Retrieve port mapping table entries.
 
         Args:
             limit (int): Maximum number of results to return. Defaults to 200.
+            columns (Optional[List[str]]): MIB objects to return; all of the method's objects by default.
 
         Returns:
             ApiResult: Parsed port mapping data.
         """
-        params = {
-            "domain": "mib",
-            "urn": "portMappingTable",
-            "mibObject0": "pmapSessionNumber",
-            "mibObject1": "pmapPortIfIndex",
-            "mibObject2": "pmapPortType",
-            "function": "slotPort_ifindex",
-            "object": "pmapPortIfIndex",
-            "limit": str(limit),
-            "ignoreError": "true"
-        }
+        query = self._PORT_MAPPING_CONFIG_QUERY.replace(limit=limit)
 
-        response = self._client.get("/", params=params)
+        response = self._client.get("/", params=query.select(columns))
         return response
 
-    def portMappingSession(self, limit: int = 200) -> ApiResult:
+    _PORT_MAPPING_SESSION_QUERY = MibQuery(
+        "portMappingSessionTable",
+        columns=[
+            "pmapSessionNumber",
+            "pmapSessionDirection",
+            "pmapSessionStatus",
+            "pmapSessionDynProxyARP",
+            "pmapSessionUnknownUnicastFloodStatus",
+        ],
+        ignore_error=True,
+    )
+
+    def portMappingSession(self, limit: int = 200, columns: Optional[List[str]] = None) -> ApiResult:
         """
         Retrieve entries from the Port Mapping Session Table.
 
         Args:
             limit (int): Maximum number of results to return. Defaults to 200.
+            columns (Optional[List[str]]): MIB objects to return; all of the method's objects by default.
 
         Returns:
             ApiResult: Parsed port mapping session data.
         """
-        params = {
-            "domain": "mib",
-            "urn": "portMappingSessionTable",
-            "mibObject0": "pmapSessionNumber",
-            "mibObject1": "pmapSessionDirection",
-            "mibObject2": "pmapSessionStatus",
-            "mibObject3": "pmapSessionDynProxyARP",
-            "mibObject4": "pmapSessionUnknownUnicastFloodStatus",
-            "limit": str(limit),
-            "ignoreError": "true"
-        }
+        query = self._PORT_MAPPING_SESSION_QUERY.replace(limit=limit)
 
-        response = self._client.get("/", params=params)
+        response = self._client.get("/", params=query.select(columns))
         return response
 
 
-    def setInterfaceAdminStatus(self, ifindex: str, admin_status: int = 1) -> ApiResult:
+    def setInterfaceAdminStatus(self, ifindex: str, admin_status: int = 1, refresh: Optional[str] = None) -> ApiResult:
         """
         Set the administrative status of a specific interface.
 
         Args:
             ifindex (str): Interface index (e.g., "1001").
             admin_status (int): Desired administrative status (1 = up, 2 = down). Defaults to 1 (down).
+            refresh (Optional[str]): "full", "row" or "none"; the client's default if None.
 
         Returns:
             ApiResult: API response indicating success or failure.
@@ -814,35 +1029,58 @@ class InterfaceEndpoint(BaseEndpoint):
             "mibObject0": f"ifIndex:|{ifindex}",
             "mibObject1": f"ifAdminStatus:{admin_status}"
         }
-        response = self._client.post(url, data=form_data)
-        if response.success:
-            result = self.list()
-            return result
-        else:
-            return response
+        return self._post_and_refresh(url, form_data, self.list, lambda: self._read_interface(ifindex), refresh)
         
-    def setInterfaceAlias(self, ifindex: str, alias: str) -> ApiResult:
+    def setInterfaceAlias(self, ifindex: str, alias: str, refresh: Optional[str] = None) -> ApiResult:
         """
         Set the Alias  of a specific interface.
 
         Args:
             ifindex (str): Interface index (e.g., "1001").
             Alias (str): Alias of the interface
+            refresh (Optional[str]): "full", "row" or "none"; the client's default if None.
 
         Returns:
             ApiResult: API response indicating success or failure.
         """
         url = "/?domain=mib&urn=ifXTable"
-        form_data = {
+        form_data = self._alias_form(ifindex, alias)
+        return self._post_and_refresh(url, form_data, self.list, lambda: self._read_interface(ifindex), refresh)
+
+    def _read_interface(self, ifindex: str) -> ApiResult:
+        """
+        Read the `list` row of one interface.
+        """
+        return self._client.get("/", params=self._LIST_QUERY.replace(filter_object="ifIndex", filter_value=ifindex))
+
+    def set_aliases(self, aliases: Dict[str, str], rows_per_request: int = 1) -> List[ApiResult]:
+        """
+        Set the alias of several interfaces, packing up to `rows_per_request` interfaces into each POST.
+
+        If the switch rejects a multi-interface request, its aliases are set one by one.
+
+        Args:
+            aliases (Dict[str, str]): Alias per interface index (e.g., {"1001": "uplink"}).
+            rows_per_request (int): Maximum number of interfaces per request.
+                Packing is off by default (1, one POST per interface): a switch may
+                accept a multi-row write without applying every row, so only
+                raise it on switches where packed writes are known to work.
+
+        Returns:
+            List[ApiResult]: The write result of each interface, in the order of `aliases`.
+        """
+        rows = [self._alias_form(ifindex, alias) for ifindex, alias in aliases.items()]
+        return self._post_rows("/?domain=mib&urn=ifXTable", rows, rows_per_request)
+
+    @staticmethod
+    def _alias_form(ifindex: str, alias: str) -> dict:
+        """
+        Build the ifXTable form fields that set an interface alias.
+        """
+        return {
             "mibObject0": f"ifIndex:|{ifindex}",
             "mibObject1": f"ifAlias:{alias}"
         }
-        response = self._client.post(url, data=form_data)
-        if response.success:
-            result = self.list()
-            return result
-        else:
-            return response        
 
 ### CLI Based
 
@@ -879,17 +1117,7 @@ class InterfaceEndpoint(BaseEndpoint):
             raise ValueError("Invalid value: choose from 'enable' or 'disable'")
 
         cmd = f"interfaces+port+{port}+{parameter}+{value}"
-        response = self._client.get(f"/cli/aos?cmd={cmd}")
-        if response.success:
-            affected_ports = self._expand_port_range(port)
-            parsed_results = []
-            for p in affected_ports:
-                show_resp = self._client.get(f"/cli/aos?cmd=show+interfaces+port+{p}")
-                if show_resp.success:
-                    parsed = parse_interface_detail(show_resp.output)
-                    parsed_results.append(parsed)
-            response.output = parsed_results
-        return response
+        return self._run_and_show(cmd, port)
 
     def set_speed(self, target: str, speed: str) -> ApiResult:
         """
@@ -920,17 +1148,7 @@ class InterfaceEndpoint(BaseEndpoint):
         else:
             cmd = f"interfaces+port+{target}+speed+{speed}"
 
-        response = self._client.get(f"/cli/aos?cmd={cmd}")
-        if response.success:
-            affected_ports = self._expand_port_range(target)
-            parsed_results = []
-            for p in affected_ports:
-                show_resp = self._client.get(f"/cli/aos?cmd=show+interfaces+port+{p}")
-                if show_resp.success:
-                    parsed = parse_interface_detail(show_resp.output)
-                    parsed_results.append(parsed)
-            response.output = parsed_results
-        return response
+        return self._run_and_show(cmd, target)
 
     def set_alias(self, port: str, alias: str) -> ApiResult:
         """
@@ -953,17 +1171,7 @@ class InterfaceEndpoint(BaseEndpoint):
         quoted_alias = f'"{alias}"'
         cmd = f"interfaces+port+{port}+alias+{quoted_alias}"
 
-        response = self._client.get(f"/cli/aos?cmd={cmd}")
-        if response.success:
-            affected_ports = self._expand_port_range(port)
-            parsed_results = []
-            for p in affected_ports:
-                show_resp = self._client.get(f"/cli/aos?cmd=show+interfaces+port+{p}")
-                if show_resp.success:
-                    parsed = parse_interface_detail(show_resp.output)
-                    parsed_results.append(parsed)
-            response.output = parsed_results
-        return response
+        return self._run_and_show(cmd, port)
 
     def set_duplex(self, target: str, mode: str) -> ApiResult:
         """
@@ -984,7 +1192,7 @@ class InterfaceEndpoint(BaseEndpoint):
             raise ValueError(f"Invalid duplex mode: {mode}. Choose from full, half, auto.")
 
         # Determine if it's a port or slot command
-        if '-' in target or target.count('/') == 2:
+        if '-' in target or target.count('/') >= 2:
             # It's a port or port range (e.g., 1/3/1 or 1/3/1-4)
             cmd = f"interfaces+port+{target}+duplex+{mode}"
         elif target.count('/') == 1:
@@ -993,18 +1201,7 @@ class InterfaceEndpoint(BaseEndpoint):
         else:
             raise ValueError("Invalid target format. Must be port (1/1/1), port range (1/1/1-2), or slot (1/1)")
 
-        response = self._client.get(f"/cli/aos?cmd={cmd}")
-        
-        if response.success and "port" in cmd:
-            affected_ports = self._expand_port_range(target) if '-' in target else [target]
-            parsed_results = []
-            for p in affected_ports:
-                show_resp = self._client.get(f"/cli/aos?cmd=show+interfaces+port+{p}")
-                if show_resp.success:
-                    parsed = parse_interface_detail(show_resp.output)
-                    parsed_results.append(parsed)
-            response.output = parsed_results
-        return response
+        return self._run_and_show(cmd, target if "port" in cmd else None)
     
     def set_max_frame_size(self, target: str, size: int) -> ApiResult:
         """
@@ -1023,7 +1220,7 @@ class InterfaceEndpoint(BaseEndpoint):
         if not (1518 <= size <= 9216):
             raise ValueError("Frame size must be between 1518 and 9216 bytes")
 
-        if '-' in target or target.count('/') == 2:
+        if '-' in target or target.count('/') >= 2:
             # Port or port range
             cmd = f"interfaces+port+{target}+max-frame-size+{size}"
         elif target.count('/') == 1:
@@ -1032,18 +1229,7 @@ class InterfaceEndpoint(BaseEndpoint):
         else:
             raise ValueError("Invalid target format. Must be port (1/3/1), port range (1/3/1-4), or slot (1/3)")
 
-        response = self._client.get(f"/cli/aos?cmd={cmd}")
-        
-        if response.success and "port" in cmd:
-            affected_ports = self._expand_port_range(target) if '-' in target else [target]
-            parsed_results = []
-            for p in affected_ports:
-                show_resp = self._client.get(f"/cli/aos?cmd=show+interfaces+port+{p}")
-                if show_resp.success:
-                    parsed = parse_interface_detail(show_resp.output)
-                    parsed_results.append(parsed)
-            response.output = parsed_results
-        return response
+        return self._run_and_show(cmd, target if "port" in cmd else None)
 
     def set_flood_limit(
         self,
@@ -1084,7 +1270,7 @@ class InterfaceEndpoint(BaseEndpoint):
             rate_mode = "cap"
 
         base_cmd = (
-            f"interfaces+{'port' if target.count('/') == 2 or '-' in target else 'slot'}+{target}+"
+            f"interfaces+{'port' if target.count('/') >= 2 or '-' in target else 'slot'}+{target}+"
             f"flood-limit+{traffic_type}+rate+{rate_mode}+{rate_value}"
         )
 
@@ -1093,18 +1279,7 @@ class InterfaceEndpoint(BaseEndpoint):
                 raise ValueError("low_threshold must be an integer")
             base_cmd += f"+low-threshold+{low_threshold}"
 
-        response = self._client.get(f"/cli/aos?cmd={base_cmd}")
-
-        if response.success and "port" in base_cmd:
-            affected_ports = self._expand_port_range(target) if '-' in target else [target]
-            parsed_results = []
-            for p in affected_ports:
-                show_resp = self._client.get(f"/cli/aos?cmd=show+interfaces+port+{p}")
-                if show_resp.success:
-                    parsed = parse_interface_detail(show_resp.output)
-                    parsed_results.append(parsed)
-            response.output = parsed_results
-        return response
+        return self._run_and_show(base_cmd, target if "port" in base_cmd else None)
 
     def set_flood_limit_action(
         self,
@@ -1134,21 +1309,10 @@ class InterfaceEndpoint(BaseEndpoint):
         if action not in valid_actions:
             raise ValueError(f"Invalid action. Must be one of {valid_actions}")
 
-        target_type = "port" if target.count("/") == 2 or "-" in target else "slot"
+        target_type = "port" if target.count("/") >= 2 or "-" in target else "slot"
         cmd = f"interfaces+{target_type}+{target}+flood-limit+{traffic_type}+action+{action}"
 
-        response = self._client.get(f"/cli/aos?cmd={cmd}")
-
-        if response.success and "port" in cmd:
-            affected_ports = self._expand_port_range(target) if '-' in target else [target]
-            parsed_results = []
-            for p in affected_ports:
-                show_resp = self._client.get(f"/cli/aos?cmd=show+interfaces+port+{p}")
-                if show_resp.success:
-                    parsed = parse_interface_detail(show_resp.output)
-                    parsed_results.append(parsed)
-            response.output = parsed_results
-        return response
+        return self._run_and_show(cmd, target if "port" in cmd else None)
     
     def set_ingress_bandwidth(
         self,
@@ -1168,7 +1332,7 @@ class InterfaceEndpoint(BaseEndpoint):
         Raises:
             ValueError: If invalid action value.
         """
-        target_type = "port" if target.count("/") == 2 or "-" in target else "slot"
+        target_type = "port" if target.count("/") >= 2 or "-" in target else "slot"
 
         if isinstance(action, str):
             if action not in {"enable", "disable"}:
@@ -1181,18 +1345,7 @@ class InterfaceEndpoint(BaseEndpoint):
         else:
             raise ValueError("Invalid action type. Must be 'enable', 'disable', or int.")
 
-        response = self._client.get(f"/cli/aos?cmd={cmd}")
-
-        if response.success and "port" in cmd:
-            affected_ports = self._expand_port_range(target) if '-' in target else [target]
-            parsed_results = []
-            for p in affected_ports:
-                show_resp = self._client.get(f"/cli/aos?cmd=show+interfaces+port+{p}")
-                if show_resp.success:
-                    parsed = parse_interface_detail(show_resp.output)
-                    parsed_results.append(parsed)
-            response.output = parsed_results
-        return response
+        return self._run_and_show(cmd, target if "port" in cmd else None)
 
     def set_link_trap(self, target: str, state: Literal["enable", "disable"]) -> ApiResult:
         """
@@ -1211,21 +1364,10 @@ class InterfaceEndpoint(BaseEndpoint):
         if state not in {"enable", "disable"}:
             raise ValueError("State must be 'enable' or 'disable'")
 
-        target_type = "port" if target.count("/") == 2 or "-" in target else "slot"
+        target_type = "port" if target.count("/") >= 2 or "-" in target else "slot"
         cmd = f"interfaces+{target_type}+{target}+link-trap+{state}"
 
-        response = self._client.get(f"/cli/aos?cmd={cmd}")
-
-        if response.success and "port" in cmd:
-            affected_ports = self._expand_port_range(target) if '-' in target else [target]
-            parsed_results = []
-            for p in affected_ports:
-                show_resp = self._client.get(f"/cli/aos?cmd=show+interfaces+port+{p}")
-                if show_resp.success:
-                    parsed = parse_interface_detail(show_resp.output)
-                    parsed_results.append(parsed)
-            response.output = parsed_results
-        return response
+        return self._run_and_show(cmd, target if "port" in cmd else None)
 
     def set_ddm_status(self, state: Literal["enable", "disable"]) -> ApiResult:
         """
@@ -1276,18 +1418,7 @@ class InterfaceEndpoint(BaseEndpoint):
         target = target.replace(" ", "+")
         cmd = f"interfaces+{target}+wait-to-restore+{value}"
 
-        response = self._client.get(f"/cli/aos?cmd={cmd}")
-
-        if response.success:
-            affected_ports = self._expand_port_range(target) if '-' in target else [target]
-            parsed_results = []
-            for p in affected_ports:
-                show_resp = self._client.get(f"/cli/aos?cmd=show+interfaces+port+{p}")
-                if show_resp.success:
-                    parsed = parse_interface_detail(show_resp.output)
-                    parsed_results.append(parsed)
-            response.output = parsed_results
-        return response
+        return self._run_and_show(cmd, target)
 
     def set_wait_to_shutdown(
         self,
@@ -1318,18 +1449,7 @@ class InterfaceEndpoint(BaseEndpoint):
         target = target.replace(" ", "+")
         cmd = f"interfaces+{target}+wait-to-shutdown+{value}"
         
-        response = self._client.get(f"/cli/aos?cmd={cmd}")
-
-        if response.success:
-            affected_ports = self._expand_port_range(target) if '-' in target else [target]
-            parsed_results = []
-            for p in affected_ports:
-                show_resp = self._client.get(f"/cli/aos?cmd=show+interfaces+port+{p}")
-                if show_resp.success:
-                    parsed = parse_interface_detail(show_resp.output)
-                    parsed_results.append(parsed)
-            response.output = parsed_results
-        return response
+        return self._run_and_show(cmd, target)
 
     def set_eee(
         self,
@@ -1358,18 +1478,7 @@ class InterfaceEndpoint(BaseEndpoint):
         target = target.replace(" ", "+")
         cmd = f"interfaces+{target}+eee+{state}"
 
-        response = self._client.get(f"/cli/aos?cmd={cmd}")
-
-        if response.success:
-            affected_ports = self._expand_port_range(target) if '-' in target else [target]
-            parsed_results = []
-            for p in affected_ports:
-                show_resp = self._client.get(f"/cli/aos?cmd=show+interfaces+port+{p}")
-                if show_resp.success:
-                    parsed = parse_interface_detail(show_resp.output)
-                    parsed_results.append(parsed)
-            response.output = parsed_results
-        return response
+        return self._run_and_show(cmd, target)
 
     def set_hybrid_mode(
         self,
@@ -1398,18 +1507,7 @@ class InterfaceEndpoint(BaseEndpoint):
         target = target.replace(" ", "+")
         cmd = f"interfaces+{target}+hybrid-mode+{mode}"
 
-        response = self._client.get(f"/cli/aos?cmd={cmd}")
-
-        if response.success:
-            affected_ports = self._expand_port_range(target) if '-' in target else [target]
-            parsed_results = []
-            for p in affected_ports:
-                show_resp = self._client.get(f"/cli/aos?cmd=show+interfaces+port+{p}")
-                if show_resp.success:
-                    parsed = parse_interface_detail(show_resp.output)
-                    parsed_results.append(parsed)
-            response.output = parsed_results
-        return response
+        return self._run_and_show(cmd, target)
     
     def set_loopback(
         self,
@@ -1431,18 +1529,7 @@ class InterfaceEndpoint(BaseEndpoint):
         port = port.replace(" ", "+")
         cmd = f"{'' if enable else 'no+'}interfaces+{port}+loopback"
 
-        response = self._client.get(f"/cli/aos?cmd={cmd}")
-
-        if response.success:
-            affected_ports = self._expand_port_range(port) if '-' in port else [port]
-            parsed_results = []
-            for p in affected_ports:
-                show_resp = self._client.get(f"/cli/aos?cmd=show+interfaces+port+{p}")
-                if show_resp.success:
-                    parsed = parse_interface_detail(show_resp.output)
-                    parsed_results.append(parsed)
-            response.output = parsed_results
-        return response
+        return self._run_and_show(cmd, port)
 
     def set_portgroup_speed(
         self,
@@ -1486,18 +1573,7 @@ class InterfaceEndpoint(BaseEndpoint):
         else:
             cmd = f"clear+violation+port+{target}"
 
-        response = self._client.get(f"/cli/aos?cmd={cmd}")
-
-        if response.success:
-            affected_ports = self._expand_port_range(target) if '-' in target else [target]
-            parsed_results = []
-            for p in affected_ports:
-                show_resp = self._client.get(f"/cli/aos?cmd=show+violation+port+{p}")
-                if show_resp.success:
-                    parsed = parse_violation_output_to_json(show_resp.output)
-                    parsed_results.append(parsed)
-            response.output = parsed_results
-        return response
+        return self._run_and_show(cmd, None if is_linkagg else target, "show+violation+port+{}", parse_violation_output_to_json)
 
     def set_violation_recovery_maximum(
         self,
@@ -1533,18 +1609,7 @@ class InterfaceEndpoint(BaseEndpoint):
         else:
             raise ValueError(f"Unknown scope: {scope}")
 
-        response = self._client.get(f"/cli/aos?cmd={cmd}")
-
-        if response.success:
-            affected_ports = self._expand_port_range(target) if '-' in target else [target]
-            parsed_results = []
-            for p in affected_ports:
-                show_resp = self._client.get(f"/cli/aos?cmd=show+violation-recovery-configuration+port+{p}")
-                if show_resp.success:
-                    parsed = parse_violation_recovery_configuration(show_resp.output)
-                    parsed_results.append(parsed)
-            response.output = parsed_results
-        return response
+        return self._run_and_show(cmd, target if scope == "port" else None, "show+violation-recovery-configuration+port+{}", parse_violation_recovery_configuration)
 
     def show_interface_capability(self, port: str) -> ApiResult:
         """
@@ -1557,19 +1622,7 @@ class InterfaceEndpoint(BaseEndpoint):
         Returns:
             A dictionary (or list of dicts) of parsed interface data, or None if request fails.
         """
-        cmd = f"show+interfaces+port+{port}+capability"
-
-        response = self._client.get(f"/cli/aos?cmd={cmd}")
-        if response.success:
-            affected_ports = self._expand_port_range(port) if '-' in port else [port]
-            parsed_results = []
-            for p in affected_ports:
-                show_resp = self._client.get(f"/cli/aos?cmd=show+interfaces+port+{p}+capability")
-                if show_resp.success:
-                    parsed = parse_interfaces_capability(show_resp.output)
-                    parsed_results.append(parsed)
-            response.output = parsed_results
-        return response
+        return self._show(port, "show+interfaces+port+{}+capability", parse_interfaces_capability)
     
     def show_interface_accounting(self, port: str) -> ApiResult:
         """
@@ -1582,19 +1635,7 @@ class InterfaceEndpoint(BaseEndpoint):
         Returns:
             A dictionary (or list of dicts) of parsed interface data, or None if request fails.
         """
-        cmd = f"show+interfaces+port+{port}+accounting"
-
-        response = self._client.get(f"/cli/aos?cmd={cmd}")
-        if response.success:
-            affected_ports = self._expand_port_range(port) if '-' in port else [port]
-            parsed_results = []
-            for p in affected_ports:
-                show_resp = self._client.get(f"/cli/aos?cmd=show+interfaces+port+{p}+accounting")
-                if show_resp.success:
-                    parsed = parse_interface_accounting(show_resp.output)
-                    parsed_results.append(parsed)
-            response.output = parsed_results
-        return response    
+        return self._show(port, "show+interfaces+port+{}+accounting", parse_interface_accounting)
     
     def show_interface_counters(self, port: str) -> ApiResult:
         """
@@ -1607,19 +1648,7 @@ class InterfaceEndpoint(BaseEndpoint):
         Returns:
             A dictionary (or list of dicts) of parsed interface data, or None if request fails.
         """
-        cmd = f"show+interfaces+port+{port}+counters"
-
-        response = self._client.get(f"/cli/aos?cmd={cmd}")
-        if response.success:
-            affected_ports = self._expand_port_range(port) if '-' in port else [port]
-            parsed_results = []
-            for p in affected_ports:
-                show_resp = self._client.get(f"/cli/aos?cmd=show+interfaces+port+{p}+counters")
-                if show_resp.success:
-                    parsed = parse_interface_counters(show_resp.output)
-                    parsed_results.append(parsed)
-            response.output = parsed_results
-        return response       
+        return self._show(port, "show+interfaces+port+{}+counters", parse_interface_counters)
 
     def show_interface_counters_errors(self, port: str) -> ApiResult:
         """
@@ -1632,19 +1661,7 @@ class InterfaceEndpoint(BaseEndpoint):
         Returns:
             A dictionary (or list of dicts) of parsed interface data, or None if request fails.
         """
-        cmd = f"show+interfaces+port+{port}+counters+errors"
-
-        response = self._client.get(f"/cli/aos?cmd={cmd}")
-        if response.success:
-            affected_ports = self._expand_port_range(port) if '-' in port else [port]
-            parsed_results = []
-            for p in affected_ports:
-                show_resp = self._client.get(f"/cli/aos?cmd=show+interfaces+port+{p}+counters+errors")
-                if show_resp.success:
-                    parsed = parse_interface_counters_errors(show_resp.output)
-                    parsed_results.append(parsed)
-            response.output = parsed_results
-        return response         
+        return self._show(port, "show+interfaces+port+{}+counters+errors", parse_interface_counters_errors)
 
     def clear_statistics(self, target: str, stat_type: str, cli_only: bool = False) -> ApiResult:
         """
@@ -1666,7 +1683,7 @@ class InterfaceEndpoint(BaseEndpoint):
         if stat_type == "tdr-statistics" and cli_only:
             raise ValueError("cli_only is not applicable for tdr-statistics")
 
-        if '-' in target or target.count('/') == 2:
+        if '-' in target or target.count('/') >= 2:
             # Port or port range
             base_cmd = f"clear+interfaces+port+{target}+{stat_type}"
         elif target.count('/') == 1:
@@ -1739,3 +1756,45 @@ class InterfaceEndpoint(BaseEndpoint):
             `ApiResult` with updated interface status.
         """
         return self.set_interface(port, "epp", "disable")
+
+
+class AsyncInterfaceEndpoint(AsyncEndpointMixin, InterfaceEndpoint):
+    """Asynchronous variant of `InterfaceEndpoint` for use with `AsyncAosApiClient`."""
+
+    async def _run_and_show(
+        self,
+        cmd: str,
+        target: Optional[str],
+        show_cmd: str = "show+interfaces+port+{}",
+        parser=parse_interface_detail
+    ) -> ApiResult:
+        commands, ports = self._port_commands(cmd, target)
+        for command in commands:
+            response = await self._client.get(f"/cli/aos?cmd={command}")
+            if not response.success:
+                return response
+        if ports is not None:
+            response.output = await self._show_ports(ports, show_cmd, parser)
+        return response
+
+    async def _show_ports(self, ports: Union[PortSet, List[str]], show_cmd: str, parser) -> list:
+        groups = self._show_groups(ports, show_cmd)
+        responses = await self._get_all([f"/cli/aos?cmd={show_cmd.format(shown)}" for shown, _ in groups])
+        outputs, missing = self._collect_outputs(groups, responses)
+        if missing:
+            retried = await self._get_all([f"/cli/aos?cmd={show_cmd.format(p)}" for p in missing])
+            outputs.update(self._collect_outputs([(p, [p]) for p in missing], retried)[0])
+        return [parser(outputs[p]) for p in ports if p in outputs]
+
+    async def _show(self, target: str, show_cmd: str, parser) -> ApiResult:
+        responses = await self._get_all([f"/cli/aos?cmd={show_cmd.format(p)}" for p in self._show_targets(target, show_cmd)])
+        return self._parsed_shows(responses, parser)
+
+    async def get_interface(self, port: str) -> Optional[dict]:
+        """
+        Async version of `InterfaceEndpoint.get_interface`.
+        """
+        response = await self._client.get(f"/cli/aos?cmd=show+interfaces+port+{port}")
+        if response.success:
+            return parse_interface_detail(response.output)
+        return None
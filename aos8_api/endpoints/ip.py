@@ -1,52 +1,49 @@
 from aos8_api.helper import parse_ip_interface_output
-from typing import Optional
-from aos8_api.endpoints.base import BaseEndpoint
+from typing import Optional, List
+from aos8_api.endpoints.base import BaseEndpoint, AsyncEndpointMixin
+from aos8_api.ifindex import IpInterfaceIndex
 from aos8_api.models import ApiResult
+from aos8_api.paging import PagingError
+from aos8_api.query import MibQuery
 
 class IPInterfaceEndpoint(BaseEndpoint):
     """
     Endpoint to manage IP interfaces on an Alcatel-Lucent OmniSwitch using CLI-based API calls.
     """
 
-    def _get_ip_ifindex(self, name: str) -> str:
-        """
-        Retrieves IP interface configuration using a MIB-based POST request.
+    # Seconds the per-client IP interface index is used before it is reloaded.
+    INDEX_TTL = 300.0
 
-        Args:
-            limit (int): Maximum number of records to return (default: 200)
+    def __init__(self, client):
+        super().__init__(client)
+        self._interfaces = IpInterfaceIndex(ttl=self.INDEX_TTL)
 
-        Returns:
-            IP Interface  - ifindex, or None if not found
+    def _get_ip_ifindex(self, name: str) -> str:
         """
-        response = self.list()
-        rows = response.data["rows"]
-        for item in rows.values():
-            slot_port = item.get("alaIpInterfaceName", "")
-            if slot_port == name:
-                return item.get("ifIndex")
-        return None
+        Resolve the name of an IP interface to its ifIndex.
 
-    def list(self, limit: int = 200) -> ApiResult:
-        """
-        Retrieve all IP interfaces using MIB-based GET with full object mapping.
+        Names are looked up in the client's IP interface index, which is loaded
+        from alaIpInterfaceTable at most once per `INDEX_TTL`. A name the index
+        does not know yet (e.g. one just created) is read on its own and added.
 
         Args:
-            limit (int): Maximum number of entries to retrieve. Defaults to 200.
+            name (str): The logical name of the interface.
 
         Returns:
-            dict: Dictionary of IP interface entries, keyed by ifIndex.
-        """
-        params = {
-            "domain": "mib",
-            "urn": "alaIpInterfaceTable",
-            "limit": str(limit),
-            "ignoreError": "true",
-            "function": "slotPort_ifindex|ifindex_slotPort|chassisSlot_vcIfIndex",
-            "object": "alaIpInterfacePortIfindex|alaIpInterfaceArpNiSlot,0,alaIpInterfaceArpNiChassis|ifindex_slotPort_1"
-        }
+            IP Interface  - ifindex, or None if not found
 
-        # Add all 33 MIB objects
-        mib_objects = [
+        Raises:
+            PagingError: If the IP interface table cannot be read.
+        """
+        if self._interfaces.expired():
+            self._interfaces.load(self._paginate(self._LIST_QUERY, 500))
+        if self._interfaces.ifindex(name) is None:
+            self._interfaces.update(self._read_interface_by_name(name))
+        return self._interfaces.ifindex(name)
+
+    _LIST_QUERY = MibQuery(
+        "alaIpInterfaceTable",
+        columns=[
             "ifIndex",
             "alaIpInterfaceName",
             "alaIpInterfaceAddress",
@@ -79,21 +76,47 @@ class IPInterfaceEndpoint(BaseEndpoint):
             "alaIpInterfaceDhcpVsiAcceptFilterString",
             "alaIpInterfaceDhcpIpRelease",
             "alaIpInterfaceDhcpIpRenew",
-            "alaIpInterfaceDhcpServerPreference"
-        ]
+            "alaIpInterfaceDhcpServerPreference",
+        ],
+        function="slotPort_ifindex|ifindex_slotPort|chassisSlot_vcIfIndex",
+        object="alaIpInterfacePortIfindex|alaIpInterfaceArpNiSlot,0,alaIpInterfaceArpNiChassis|ifindex_slotPort_1",
+        ignore_error=True,
+    )
+
+    def list(self, limit: int = 200, columns: Optional[List[str]] = None) -> ApiResult:
+        """
+        Retrieve all IP interfaces using MIB-based GET with full object mapping.
 
-        for i, obj in enumerate(mib_objects):
-            params[f"mibObject{i}"] = obj
+        Args:
+            limit (int): Maximum number of entries to retrieve. Defaults to 200.
+            columns (Optional[List[str]]): MIB objects to return; all of the method's objects by default.
 
-        response = self._client.get("/", params=params)
+        Returns:
+            dict: Dictionary of IP interface entries, keyed by ifIndex.
+        """
+        query = self._LIST_QUERY.replace(limit=limit)
+        response = self._client.get("/", params=query.select(columns))
         return response
 
-    def create_name_interface(self, name: str) -> ApiResult:
+    def _read_interface(self, ifindex: str) -> ApiResult:
+        """
+        Read the alaIpInterfaceTable row of one IP interface.
+        """
+        return self._client.get("/", params=self._LIST_QUERY.replace(filter_object="ifIndex", filter_value=ifindex))
+
+    def _read_interface_by_name(self, name: str) -> ApiResult:
+        """
+        Read the alaIpInterfaceTable row of the IP interface named `name`.
+        """
+        return self._client.get("/", params=self._LIST_QUERY.replace(filter_object="alaIpInterfaceName", filter_value=name))
+
+    def create_name_interface(self, name: str, refresh: Optional[str] = None) -> ApiResult:
         """
         Create a new IP interface with the given name.
 
         Args:
             name (str): The logical name of the interface (e.g., 'int-999').
+            refresh (Optional[str]): "full", "row" or "none"; the client's default if None.
 
         Returns:
             ApiResult: The API response.
@@ -105,12 +128,18 @@ class IPInterfaceEndpoint(BaseEndpoint):
             "mibObject1-T1": "alaIpItfConfigRowStatus:4"
         }
 
-        response = self._client.post(url, data=form_data)
-        if response.success:
-            response = self.list()
-            return response
+        response = self._post_and_refresh(url, form_data, self.list, lambda: self._read_interface_by_name(name), refresh)
+        self._track_create(name, response)
         return response
 
+    def _track_create(self, name: str, response: ApiResult):
+        """
+        Replace the index entry of a newly named interface with the rows read back, if any.
+        """
+        if response.success:
+            self._interfaces.remove(name)
+            self._interfaces.update(response)
+
     def create_IP_Interface(
         self,
         name: str,
@@ -119,6 +148,7 @@ class IPInterfaceEndpoint(BaseEndpoint):
         device: str = "Vlan",
         vlan_id: Optional[int] = None,
         encap: Optional[str] = "e2",
+        refresh: Optional[str] = None,
     ) -> ApiResult:
         """
         Create a new IP interface with specified parameters.
@@ -130,49 +160,71 @@ class IPInterfaceEndpoint(BaseEndpoint):
             vlan (Optional[int]): VLAN ID.
             service (Optional[int]): Associated service ID.
             encapsulation (Optional[str]): Encapsulation type ('e2' or 'snap').
+            refresh (Optional[str]): "full", "row" or "none"; the client's default if None.
 
         Returns:
             ApiResult: Result of the creation operation or error response.            
         """
-        ifindex = None
-        response = self.create_name_interface(name)
+        response = self.create_name_interface(name, refresh="none")
         if response.success:
+            try:
+                ifindex = self._get_ip_ifindex(name)
+            except PagingError as error:
+                return self._index_failure(error)
+            if ifindex is not None:
+                form_data = self._ip_interface_form(ifindex, address, mask, device, vlan_id, encap)
+                response = self._post_and_refresh("/?domain=mib&urn=alaIpInterfaceTable", form_data, self.list, lambda: self._read_interface(ifindex), refresh)
+                self._interfaces.update(response)
+        return response
 
-            ifindex = self._get_ip_ifindex(name)
-            url = "/?domain=mib&urn=alaIpInterfaceTable"
+    @staticmethod
+    def _index_failure(error: PagingError) -> ApiResult:
+        """
+        Turn a failed read of the IP interface table into a failed result.
+        """
+        return ApiResult(success=False, diag=error.result.diag, error=str(error))
 
-            encapsulation_map = {
-                'e2': '1',
-                'snap': '2'
-            }
-            encapsulation = encapsulation_map.get(encap, '1')
+    @staticmethod
+    def _ip_interface_form(
+        ifindex: str,
+        address: Optional[str],
+        mask: Optional[str],
+        device: str,
+        vlan_id: Optional[int],
+        encap: Optional[str],
+    ) -> dict:
+        """
+        Build the alaIpInterfaceTable form fields for a newly named IP interface.
 
-            device_type_map = {
-                'Vlan': '1',
-                'GRE': '4',
-                'IPIP': '5',           
-            }        
-            device_type = device_type_map.get(device, '1')                 
-
-            form_data = {
-                "mibObject0": f"ifIndex:{ifindex}",
-                "mibObject1": f"alaIpInterfaceAddress:{address}",
-                "mibObject2": f"alaIpInterfaceMask:{mask}",            
-                "mibObject3": f"alaIpInterfaceDeviceType:{device_type}",  
-                "mibObject4": f"alaIpInterfaceEncap:{encapsulation}",            
-                "mibObject5": f"alaIpInterfaceIpForward:1",                        
-            }
+        Returns:
+            dict: MIB form data for the POST request.
+        """
+        encapsulation_map = {
+            'e2': '1',
+            'snap': '2'
+        }
+        encapsulation = encapsulation_map.get(encap, '1')
 
-            if vlan_id is not None:
-                form_data["mibObject9"] = f"alaIpInterfaceVlanID:{str(vlan_id)}"
+        device_type_map = {
+            'Vlan': '1',
+            'GRE': '4',
+            'IPIP': '5',           
+        }        
+        device_type = device_type_map.get(device, '1')                 
 
-            if ifindex is not None:
-                response = self._client.post(url, data=form_data)
-                if response.success:
-                    response = self.list()
-                    return response
-                return response
-        return response
+        form_data = {
+            "mibObject0": f"ifIndex:{ifindex}",
+            "mibObject1": f"alaIpInterfaceAddress:{address}",
+            "mibObject2": f"alaIpInterfaceMask:{mask}",            
+            "mibObject3": f"alaIpInterfaceDeviceType:{device_type}",  
+            "mibObject4": f"alaIpInterfaceEncap:{encapsulation}",            
+            "mibObject5": f"alaIpInterfaceIpForward:1",                        
+        }
+
+        if vlan_id is not None:
+            form_data["mibObject9"] = f"alaIpInterfaceVlanID:{str(vlan_id)}"
+
+        return form_data
 
     def edit_IP_Interface(
         self,
@@ -184,7 +236,8 @@ class IPInterfaceEndpoint(BaseEndpoint):
         forward: Optional[bool] = None,
         local_proxy_arp: Optional[bool] = None,
         encapsulation: Optional[str] = None,
-        primary: Optional[bool] = None
+        primary: Optional[bool] = None,
+        refresh: Optional[str] = None
     ) -> ApiResult:
         """
         Create a new IP interface with specified parameters.
@@ -197,84 +250,104 @@ class IPInterfaceEndpoint(BaseEndpoint):
             service (Optional[int]): Associated service ID.
             encapsulation (Optional[str]): Encapsulation type ('e2' or 'snap').
             primary (Optional[bool]): Set as primary interface.
+            refresh (Optional[str]): "full", "row" or "none"; the client's default if None.
 
         Returns:
             ApiResult: Result of the creation operation or error response.            
         """
         if ifindex:
             url = "/?domain=mib&urn=alaIpInterfaceTable"
-       
-            form_data = {
-                "mibObject0": f"ifIndex:{ifindex}",
-                "mibObject1": f"alaIpInterfacePortIfindex:0",
-            }
-
-            if address is not None:
-                form_data["mibObject2"] = f"alaIpInterfaceAddress:{address}"
-
-            if mask is not None:
-                form_data["mibObject3"] = f"alaIpInterfaceMask:{mask}"   
-
-            if device is not None:
-                device_type_map = {
-                    'Vlan': '1',
-                    'GRE': '4',
-                    'IPIP': '5',            
-                }        
-                device_type_config = device_type_map.get(device, '1')                   
-                form_data["mibObject4"] = f"alaIpInterfaceDeviceType:{device_type_config}"   
-
-            if encapsulation is not None:
-                encapsulation_map = {
-                    'e2': '1',
-                    'snap': '2'
-                }
-                encapsulation_config = encapsulation_map.get(encapsulation, '1')
-                form_data["mibObject5"] = f"alaIpInterfaceEncap:{encapsulation_config}"   
-
-
-            if primary is not None:
-                primary_config_map = {
-                    False : '0',
-                    True : '1',
-                }        
-                primary_config = primary_config_map.get(primary, '0')                     
-                form_data["mibObject6"] = f"alaIpInterfacePrimCfg:{str(primary_config)}"                           
-                            
-            if vlan_id is not None:
-                form_data["mibObject7"] = f"alaIpInterfaceVlanID:{str(vlan_id)}"
-
-            if forward is not None:
-                forward_config_map = {
-                    False: '2',
-                    True: '1'
-                }        
-                forward_config = forward_config_map.get(forward, '1')                     
-                form_data["mibObject8"] = f"alaIpInterfaceIpForward:{forward_config}"   
-
-            if local_proxy_arp is not None:
-                local_proxy_arp_map = {
-                    False: '2',
-                    True: '1'
-                }        
-                local_proxy_arp_config = local_proxy_arp_map.get(local_proxy_arp, '1')                     
-                form_data["mibObject9"] = f"alaIpInterfaceLocalProxyArp:{local_proxy_arp_config}"                                  
-
-            response = self._client.post(url, data=form_data)
-            if response.success:
-                response = self.list()
-                return response
+            form_data = self._edit_form(ifindex, address, mask, device, vlan_id, forward, local_proxy_arp, encapsulation, primary)
+            response = self._post_and_refresh(url, form_data, self.list, lambda: self._read_interface(ifindex), refresh)
+            self._interfaces.update(response)
             return response
         return None
 
+    @staticmethod
+    def _edit_form(
+        ifindex: str,
+        address: Optional[str],
+        mask: Optional[str],
+        device: Optional[str],
+        vlan_id: Optional[int],
+        forward: Optional[bool],
+        local_proxy_arp: Optional[bool],
+        encapsulation: Optional[str],
+        primary: Optional[bool],
+    ) -> dict:
+        """
+        Build the alaIpInterfaceTable form fields changing an existing IP interface.
+
+        Returns:
+            dict: MIB form data for the POST request.
+        """
+        form_data = {
+            "mibObject0": f"ifIndex:{ifindex}",
+            "mibObject1": f"alaIpInterfacePortIfindex:0",
+        }
+
+        if address is not None:
+            form_data["mibObject2"] = f"alaIpInterfaceAddress:{address}"
+
+        if mask is not None:
+            form_data["mibObject3"] = f"alaIpInterfaceMask:{mask}"   
+
+        if device is not None:
+            device_type_map = {
+                'Vlan': '1',
+                'GRE': '4',
+                'IPIP': '5',            
+            }        
+            device_type_config = device_type_map.get(device, '1')                   
+            form_data["mibObject4"] = f"alaIpInterfaceDeviceType:{device_type_config}"   
+
+        if encapsulation is not None:
+            encapsulation_map = {
+                'e2': '1',
+                'snap': '2'
+            }
+            encapsulation_config = encapsulation_map.get(encapsulation, '1')
+            form_data["mibObject5"] = f"alaIpInterfaceEncap:{encapsulation_config}"   
+
+
+        if primary is not None:
+            primary_config_map = {
+                False : '0',
+                True : '1',
+            }        
+            primary_config = primary_config_map.get(primary, '0')                     
+            form_data["mibObject6"] = f"alaIpInterfacePrimCfg:{str(primary_config)}"                           
+
+        if vlan_id is not None:
+            form_data["mibObject7"] = f"alaIpInterfaceVlanID:{str(vlan_id)}"
+
+        if forward is not None:
+            forward_config_map = {
+                False: '2',
+                True: '1'
+            }        
+            forward_config = forward_config_map.get(forward, '1')                     
+            form_data["mibObject8"] = f"alaIpInterfaceIpForward:{forward_config}"   
+
+        if local_proxy_arp is not None:
+            local_proxy_arp_map = {
+                False: '2',
+                True: '1'
+            }        
+            local_proxy_arp_config = local_proxy_arp_map.get(local_proxy_arp, '1')                     
+            form_data["mibObject9"] = f"alaIpInterfaceLocalProxyArp:{local_proxy_arp_config}"
+
+        return form_data
+
    
 
-    def delete(self, name: str) -> ApiResult:
+    def delete(self, name: str, refresh: Optional[str] = None) -> ApiResult:
         """
         Delete an existing IP interface.
 
         Args:
             name (str): The logical name of the interface (e.g., 'int-999').
+            refresh (Optional[str]): "full", "row" or "none"; the client's default if None.
 
         Returns:
             ApiResult: Result of the deletion operation or error response.
@@ -286,9 +359,91 @@ class IPInterfaceEndpoint(BaseEndpoint):
             "mibObject1-T1": "alaIpItfConfigRowStatus:6"
         }
 
-        response = self._client.post(url, data=form_data)
+        response = self._post_and_refresh(url, form_data, self.list, lambda: self._read_interface_by_name(name), refresh)
         if response.success:
-            response = self.list()
-            return response
+            self._interfaces.remove(name)
+        return response
+
+
+class AsyncIPInterfaceEndpoint(AsyncEndpointMixin, IPInterfaceEndpoint):
+    """Asynchronous variant of `IPInterfaceEndpoint` for use with `AsyncAosApiClient`."""
+
+    async def _get_ip_ifindex(self, name: str) -> str:
+        if self._interfaces.expired():
+            self._interfaces.load([row async for row in self._paginate(self._LIST_QUERY, 500)])
+        if self._interfaces.ifindex(name) is None:
+            self._interfaces.update(await self._read_interface_by_name(name))
+        return self._interfaces.ifindex(name)
+
+    async def create_name_interface(self, name: str, refresh: Optional[str] = None) -> ApiResult:
+        """
+        Async version of `IPInterfaceEndpoint.create_name_interface`.
+        """
+        form_data = {
+            "mibObject0-T1": f"alaIpItfConfigName:{name}",
+            "mibObject1-T1": "alaIpItfConfigRowStatus:4"
+        }
+        response = await self._post_and_refresh("/?domain=mib&urn=alaIpItfConfigTable", form_data, self.list, lambda: self._read_interface_by_name(name), refresh)
+        self._track_create(name, response)
+        return response
+
+    async def create_IP_Interface(
+        self,
+        name: str,
+        address: Optional[str] = None,
+        mask: Optional[str] = None,
+        device: str = "Vlan",
+        vlan_id: Optional[int] = None,
+        encap: Optional[str] = "e2",
+        refresh: Optional[str] = None,
+    ) -> ApiResult:
+        """
+        Async version of `IPInterfaceEndpoint.create_IP_Interface`.
+        """
+        response = await self.create_name_interface(name, refresh="none")
+        if response.success:
+            try:
+                ifindex = await self._get_ip_ifindex(name)
+            except PagingError as error:
+                return self._index_failure(error)
+            if ifindex is not None:
+                form_data = self._ip_interface_form(ifindex, address, mask, device, vlan_id, encap)
+                response = await self._post_and_refresh("/?domain=mib&urn=alaIpInterfaceTable", form_data, self.list, lambda: self._read_interface(ifindex), refresh)
+                self._interfaces.update(response)
         return response
 
+    async def edit_IP_Interface(
+        self,
+        ifindex: str,
+        address: Optional[str] = None,
+        mask: Optional[str] = None,
+        device: Optional[str] = None,
+        vlan_id: Optional[int] = None,
+        forward: Optional[bool] = None,
+        local_proxy_arp: Optional[bool] = None,
+        encapsulation: Optional[str] = None,
+        primary: Optional[bool] = None,
+        refresh: Optional[str] = None
+    ) -> ApiResult:
+        """
+        Async version of `IPInterfaceEndpoint.edit_IP_Interface`.
+        """
+        if ifindex:
+            form_data = self._edit_form(ifindex, address, mask, device, vlan_id, forward, local_proxy_arp, encapsulation, primary)
+            response = await self._post_and_refresh("/?domain=mib&urn=alaIpInterfaceTable", form_data, self.list, lambda: self._read_interface(ifindex), refresh)
+            self._interfaces.update(response)
+            return response
+        return None
+
+    async def delete(self, name: str, refresh: Optional[str] = None) -> ApiResult:
+        """
+        Async version of `IPInterfaceEndpoint.delete`.
+        """
+        form_data = {
+            "mibObject0-T1": f"alaIpItfConfigName:{name}",
+            "mibObject1-T1": "alaIpItfConfigRowStatus:6"
+        }
+        response = await self._post_and_refresh("/?domain=mib&urn=alaIpItfConfigTable", form_data, self.list, lambda: self._read_interface_by_name(name), refresh)
+        if response.success:
+            self._interfaces.remove(name)
+        return response
@@ -1,77 +1,105 @@
 from aos8_api.helper import parse_output_json
-from aos8_api.endpoints.base import BaseEndpoint
+from typing import List, Optional
+from aos8_api.endpoints.base import BaseEndpoint, AsyncEndpointMixin
 from aos8_api.models import ApiResult
+from aos8_api.query import MibQuery
 
 class MacLearningEndpoint(BaseEndpoint):
     """Endpoint for managing MVRP configuration."""
 
-    def globalMacLearning(self) -> ApiResult:
+    _GLOBAL_MAC_LEARNING_QUERY = MibQuery(
+        "slMacAddressAgingTable",
+        columns=[
+            "slMacAgingValue",
+        ],
+    )
+
+    def globalMacLearning(self, columns: Optional[List[str]] = None) -> ApiResult:
         """
         Retrieves the system MAC address aging value.
 
+        Args:
+            columns (Optional[List[str]]): MIB objects to return; all of the method's objects by default.
+
         Returns:
             ApiResult: Contains the `slMacAgingValue` if successful.
         """
-        params = {
-            "domain": "mib",
-            "urn": "slMacAddressAgingTable",
-            "mibObject0": "slMacAgingValue"
-        }
-
-        response = self._client.get("/", params=params)
+        response = self._client.get("/", params=self._GLOBAL_MAC_LEARNING_QUERY.select(columns))
         return response
     
-    def macPortConfiguration(self, limit: int = 200) -> ApiResult:
+    _MAC_PORT_CONFIGURATION_QUERY = MibQuery(
+        "slMacLearningControlTable",
+        columns=[
+            "ifIndex",
+            "slMacLearningControlStatus",
+        ],
+        function="slotPort_ifindex",
+        object="ifIndex",
+        ignore_error=True,
+    )
+
+    def macPortConfiguration(self, limit: int = 200, columns: Optional[List[str]] = None) -> ApiResult:
         """
         Retrieve MAC learning control status per interface.
 
         Args:
             limit (int): Maximum number of results to return.
+            columns (Optional[List[str]]): MIB objects to return; all of the method's objects by default.
 
         Returns:
             ApiResult: Parsed response containing interface MAC learning control statuses.
         """
-        params = {
-            "domain": "mib",
-            "urn": "slMacLearningControlTable",
-            "mibObject0": "ifIndex",
-            "mibObject1": "slMacLearningControlStatus",
-            "function": "slotPort_ifindex",
-            "object": "ifIndex",
-            "limit": str(limit),
-            "ignoreError": "true"
-        }
-        return self._client.get("/", params=params)    
+        query = self._MAC_PORT_CONFIGURATION_QUERY.replace(limit=limit)
+        return self._client.get("/", params=query.select(columns))    
     
-    def showMacAddress(self, limit: int = 200) -> ApiResult:
+    _MAC_ADDRESS_QUERY = MibQuery(
+        "alaSlMacAddressGlobalTable",
+        columns=[
+            "slMacDomain",
+            "slLocaleType",
+            "slOriginId",
+            "slServiceId",
+            "slSubId",
+            "slMacAddressGbl",
+            "slMacAddressGblManagement",
+            "slMacAddressGblDisposition",
+            "slMacAddressGblProtocol",
+            "slMacAddressGblGroupField",
+            "slSvcISID",
+            "slVxLanVnID",
+            "slL2GreVpnID",
+        ],
+        function="slotPort_ifindex",
+        object="slOriginId",
+    )
+
+    def showMacAddress(self, limit: int = 200, columns: Optional[List[str]] = None) -> ApiResult:
         """
         Retrieve global MAC address records.
 
         Args:
             limit (int): Maximum number of results to return.
+            columns (Optional[List[str]]): MIB objects to return; all of the method's objects by default.
 
         Returns:
             ApiResult: Contains parsed global MAC address entries.
         """
-        params = {
-            "domain": "mib",
-            "urn": "alaSlMacAddressGlobalTable",
-            "mibObject0": "slMacDomain",
-            "mibObject1": "slLocaleType",
-            "mibObject2": "slOriginId",
-            "mibObject3": "slServiceId",
-            "mibObject4": "slSubId",
-            "mibObject5": "slMacAddressGbl",
-            "mibObject6": "slMacAddressGblManagement",
-            "mibObject7": "slMacAddressGblDisposition",
-            "mibObject8": "slMacAddressGblProtocol",
-            "mibObject9": "slMacAddressGblGroupField",
-            "mibObject10": "slSvcISID",
-            "mibObject11": "slVxLanVnID",
-            "mibObject12": "slL2GreVpnID",
-            "function": "slotPort_ifindex",
-            "object": "slOriginId",
-            "limit": str(limit),
-        }
-
-        return self._client.get("/", params=params)
\ No newline at end of file
+        return self._client.get("/", params=self._MAC_ADDRESS_QUERY.replace(limit=limit).select(columns))
+
+    def iter_mac_addresses(self, page_size: int = 200):
+        """
+        Iterate over every global MAC address record, one page at a time.
+
+        Unlike `showMacAddress`, large MAC tables are streamed instead of truncated.
+
+        Args:
+            page_size (int): Number of rows requested per page.
+
+        Returns:
+            Iterator of (index, row) pairs.
+        """
+        return self._paginate(self._MAC_ADDRESS_QUERY, page_size)
+
+
+class AsyncMacLearningEndpoint(AsyncEndpointMixin, MacLearningEndpoint):
+    """Asynchronous variant of `MacLearningEndpoint` for use with `AsyncAosApiClient`."""
@@ -1,122 +1,148 @@
 from aos8_api.helper import parse_output_json
-from aos8_api.endpoints.base import BaseEndpoint
+from typing import List, Optional
+from aos8_api.endpoints.base import BaseEndpoint, AsyncEndpointMixin
 from aos8_api.models import ApiResult
+from aos8_api.query import MibQuery
 
 class MvrpEndpoint(BaseEndpoint):
     """Endpoint for managing MVRP configuration."""
 
-    def globalMVRP(self) -> ApiResult:
+    _GLOBAL_MVRP_QUERY = MibQuery(
+        "alcatelIND1MVRPMIBObjects",
+        columns=[
+            "alaMvrpGlobalStatus",
+            "alaMvrpMaxVlanLimit",
+        ],
+    )
+
+    def globalMVRP(self, columns: Optional[List[str]] = None) -> ApiResult:
         """
         Retrieve global MVRP configuration settings.
 
+        Args:
+            columns (Optional[List[str]]): MIB objects to return; all of the method's objects by default.
+
         Returns:
             ApiResult: MVRP global status and VLAN limit configuration.
         """
-        params = {
-            "domain": "mib",
-            "urn": "alcatelIND1MVRPMIBObjects",
-            "mibObject0": "alaMvrpGlobalStatus",
-            "mibObject1": "alaMvrpMaxVlanLimit"
-        }
-
-        response = self._client.get("/", params=params)
+        response = self._client.get("/", params=self._GLOBAL_MVRP_QUERY.select(columns))
         return response
     
-    def mvrpPortConfig(self, limit: int = 200) -> ApiResult:
+    _PORT_CONFIG_QUERY = MibQuery(
+        "alaMvrpPortConfigTable",
+        columns=[
+            "alaMvrpPortConfigIfIndex",
+            "alaMvrpPortStatus",
+            "alaMvrpPortConfigRegistrarMode",
+            "alaMvrpPortConfigApplicantMode",
+            "alaMvrpPortConfigJoinTimer",
+            "alaMvrpPortConfigLeaveTimer",
+            "alaMvrpPortConfigLeaveAllTimer",
+            "alaMvrpPortConfigPeriodicTimer",
+            "alaMvrpPortConfigPeriodicTransmissionStatus",
+        ],
+        function="slotPort_ifindex",
+        object="alaMvrpPortConfigIfIndex",
+        ignore_error=True,
+    )
+
+    def mvrpPortConfig(self, limit: int = 200, columns: Optional[List[str]] = None) -> ApiResult:
         """
         Retrieve MVRP port configuration table.
 
         Args:
             limit (int): Maximum number of rows to return (default is 200).
+            columns (Optional[List[str]]): MIB objects to return; all of the method's objects by default.
 
         Returns:
             ApiResult: The MVRP port configuration per interface.
         """
-        params = {
-            "domain": "mib",
-            "urn": "alaMvrpPortConfigTable",
-            "mibObject0": "alaMvrpPortConfigIfIndex",
-            "mibObject1": "alaMvrpPortStatus",
-            "mibObject2": "alaMvrpPortConfigRegistrarMode",
-            "mibObject3": "alaMvrpPortConfigApplicantMode",
-            "mibObject4": "alaMvrpPortConfigJoinTimer",
-            "mibObject5": "alaMvrpPortConfigLeaveTimer",
-            "mibObject6": "alaMvrpPortConfigLeaveAllTimer",
-            "mibObject7": "alaMvrpPortConfigPeriodicTimer",
-            "mibObject8": "alaMvrpPortConfigPeriodicTransmissionStatus",
-            "function": "slotPort_ifindex",
-            "object": "alaMvrpPortConfigIfIndex",
-            "limit": str(limit),
-            "ignoreError": "true"
-        }
-
-        response = self._client.get("/", params=params)
-        return response   
-
-    def mvrp_stats(self, port_status: int = 1, limit: int = 200) -> ApiResult:
+        return self._client.get("/", params=self._PORT_CONFIG_QUERY.replace(limit=limit).select(columns))
+
+    def iter_port_config(self, page_size: int = 200):
+        """
+        Iterate over the MVRP port configuration of every port, one page at a time.
+
+        Args:
+            page_size (int): Number of rows requested per page.
+
+        Returns:
+            Iterator of (index, row) pairs.
+        """
+        return self._paginate(self._PORT_CONFIG_QUERY, page_size)
+
+    _MVRP_STATS_QUERY = MibQuery(
+        "alaMvrpPortStatsTable",
+        columns=[
+            "alaMvrpPortStatsIfIndex",
+            "alaMvrpPortStatsNewReceived",
+            "alaMvrpPortStatsJoinInReceived",
+            "alaMvrpPortStatsJoinEmptyReceived",
+            "alaMvrpPortStatsLeaveReceived",
+            "alaMvrpPortStatsInReceived",
+            "alaMvrpPortStatsEmptyReceived",
+            "alaMvrpPortStatsLeaveAllReceived",
+            "alaMvrpPortStatsTotalPDUReceived",
+            "alaMvrpPortStatsTotalMsgsReceived",
+            "alaMvrpPortStatsInvalidMsgsReceived",
+            "alaMvrpPortFailedRegistrations",
+            "alaMvrpPortLastPduOrigin",
+        ],
+        function="slotPort_ifindex",
+        object="alaMvrpPortStatsIfIndex",
+        filter_object="alaMvrpPortStatus",
+        ignore_error=True,
+    )
+
+    def mvrp_stats(self, port_status: int = 1, limit: int = 200, columns: Optional[List[str]] = None) -> ApiResult:
         """
         Retrieve MVRP port statistics with an optional port status filter.
 
         Args:
             port_status (int): Filter for `alaMvrpPortStatus` (default is 1).
             limit (int): Max number of rows to retrieve (default is 200).
+            columns (Optional[List[str]]): MIB objects to return; all of the method's objects by default.
 
         Returns:
             ApiResult: Parsed MVRP port statistics.
         """
-        params = {
-            "domain": "mib",
-            "urn": "alaMvrpPortStatsTable",
-            "mibObject0": "alaMvrpPortStatsIfIndex",
-            "mibObject1": "alaMvrpPortStatsNewReceived",
-            "mibObject2": "alaMvrpPortStatsJoinInReceived",
-            "mibObject3": "alaMvrpPortStatsJoinEmptyReceived",
-            "mibObject4": "alaMvrpPortStatsLeaveReceived",
-            "mibObject5": "alaMvrpPortStatsInReceived",
-            "mibObject6": "alaMvrpPortStatsEmptyReceived",
-            "mibObject7": "alaMvrpPortStatsLeaveAllReceived",
-            "mibObject8": "alaMvrpPortStatsTotalPDUReceived",
-            "mibObject9": "alaMvrpPortStatsTotalMsgsReceived",
-            "mibObject10": "alaMvrpPortStatsInvalidMsgsReceived",
-            "mibObject11": "alaMvrpPortFailedRegistrations",
-            "mibObject12": "alaMvrpPortLastPduOrigin",
-            "function": "slotPort_ifindex",
-            "object": "alaMvrpPortStatsIfIndex",
-            "filterObject": "alaMvrpPortStatus",
-            "filterOperation": "==",
-            "filterValue": str(port_status),
-            "limit": str(limit),
-            "ignoreError": "true"
-        }
-
-        response = self._client.get("/", params=params)
+        query = self._MVRP_STATS_QUERY.replace(filter_value=port_status, limit=limit)
+
+        response = self._client.get("/", params=query.select(columns))
         return response     
     
 
-    def mvrp_Vlan_Restriction(self, limit: int = 200) -> ApiResult:
+    _MVRP_VLAN_RESTRICTION_QUERY = MibQuery(
+        "alaMvrpPortRestrictVlanConfigTable",
+        columns=[
+            "alaMvrpPortRestrictVlanIfIndex",
+            "alaMvrpPortRestrictVlanID",
+            "alaMvrpPortVlanRestrictions",
+        ],
+        function="slotPort_ifindex",
+        object="alaMvrpPortRestrictVlanIfIndex",
+        filter_object="alaMvrpPortVlanRestrictions",
+        filter_operation="!=",
+        filter_value="00",
+        ignore_error=True,
+    )
+
+    def mvrp_Vlan_Restriction(self, limit: int = 200, columns: Optional[List[str]] = None) -> ApiResult:
         """
         Retrieve MVRP VLAN restriction configuration entries where restrictions are set.
 
         Args:
             limit (int): Maximum number of rows to retrieve (default 200).
+            columns (Optional[List[str]]): MIB objects to return; all of the method's objects by default.
 
         Returns:
             ApiResult: Parsed data with restricted VLANs.
         """
-        params = {
-            "domain": "mib",
-            "urn": "alaMvrpPortRestrictVlanConfigTable",
-            "mibObject0": "alaMvrpPortRestrictVlanIfIndex",
-            "mibObject1": "alaMvrpPortRestrictVlanID",
-            "mibObject2": "alaMvrpPortVlanRestrictions",
-            "function": "slotPort_ifindex",
-            "object": "alaMvrpPortRestrictVlanIfIndex",
-            "filterObject": "alaMvrpPortVlanRestrictions",
-            "filterOperation": "!=",
-            "filterValue": "00",
-            "limit": str(limit),
-            "ignoreError": "true"
-        }
-
-        response = self._client.get("/", params=params)
-        return response    
\ No newline at end of file
+        query = self._MVRP_VLAN_RESTRICTION_QUERY.replace(limit=limit)
+
+        response = self._client.get("/", params=query.select(columns))
+        return response
+
+
+class AsyncMvrpEndpoint(AsyncEndpointMixin, MvrpEndpoint):
+    """Asynchronous variant of `MvrpEndpoint` for use with `AsyncAosApiClient`."""
@@ -1,7 +1,8 @@
 from aos8_api.helper import parse_system_output_json
-from typing import Optional
-from aos8_api.endpoints.base import BaseEndpoint
+from typing import Optional, List
+from aos8_api.endpoints.base import BaseEndpoint, AsyncEndpointMixin
 from aos8_api.models import ApiResult
+from aos8_api.query import MibQuery
 
 class SystemEndpoint(BaseEndpoint):
     """
@@ -9,60 +10,67 @@ class SystemEndpoint(BaseEndpoint):
     """
 
 
-    def keepAlive(self) -> ApiResult:
+    _KEEP_ALIVE_QUERY = MibQuery(
+        "trapCount",
+        domain="sqliteQuery",
+    )
+
+    def keepAlive(self, columns: Optional[List[str]] = None) -> ApiResult:
         """
         Retrieve current trap count from the switch.
 
+        Args:
+            columns (Optional[List[str]]): MIB objects to return; all of the method's objects by default.
+
         Returns:
             ApiResult: Parsed trap count data.
         """
-        params = {
-            "domain": "sqliteQuery",
-            "urn": "trapCount"
-        }
-
-        return self._client.get("/", params=params)
-
-    def getSystemInformation(self) -> ApiResult:
+        return self._client.get("/", params=self._KEEP_ALIVE_QUERY.select(columns))
+
+    _GET_SYSTEM_INFORMATION_QUERY = MibQuery(
+        "system|systemServices|systemBlueToothServices|systemServicesBluetoothTable|systemFips|alaAaaAuthConfig",
+        columns=[
+            "sysDescr",
+            "sysObjectID",
+            "sysUpTime",
+            "sysContact",
+            "sysName",
+            "sysLocation",
+            "systemServicesTimezone",
+            "systemServicesEnableDST",
+            "systemServicesTime",
+            "systemServicesDate",
+            "systemServicesUsbEnable",
+            "systemServicesUsbAutoCopyEnable",
+            "systemServicesUsbCopyConfig",
+            "systemServicesUsbBackupAdminState",
+            "systemServicesUsbBackupKey",
+            "systemServicesUsbBackupHashkey",
+            "systemServicesAction",
+            "systemServicesArg1",
+            "systemServicesBluetoothStatus",
+            "systemServicesBluetoothEnable",
+            "systemServicesBluetoothTxPower",
+            "systemServicesBluetoothStatus",
+            "systemServicesBluetoothChassisId",
+            "systemFipsAdminState",
+            "systemFipsOperState",
+            "alaAaaUbootAuthenticationPassword",
+            "alaAaaUbootAccess",
+        ],
+    )
+
+    def getSystemInformation(self, columns: Optional[List[str]] = None) -> ApiResult:
         """
         Retrieve system and system service configuration data.
 
+        Args:
+            columns (Optional[List[str]]): MIB objects to return; all of the method's objects by default.
+
         Returns:
             ApiResult: Parsed response from the switch.
         """
-        params = {
-            "domain": "mib",
-            "urn": "system|systemServices|systemBlueToothServices|systemServicesBluetoothTable|systemFips|alaAaaAuthConfig",
-            "mibObject0": "sysDescr",
-            "mibObject1": "sysObjectID",
-            "mibObject2": "sysUpTime",
-            "mibObject3": "sysContact",
-            "mibObject4": "sysName",
-            "mibObject5": "sysLocation",
-            "mibObject6": "systemServicesTimezone",
-            "mibObject7": "systemServicesEnableDST",
-            "mibObject8": "systemServicesTime",
-            "mibObject9": "systemServicesDate",
-            "mibObject10": "systemServicesUsbEnable",
-            "mibObject11": "systemServicesUsbAutoCopyEnable",
-            "mibObject12": "systemServicesUsbCopyConfig",
-            "mibObject13": "systemServicesUsbBackupAdminState",
-            "mibObject14": "systemServicesUsbBackupKey",
-            "mibObject15": "systemServicesUsbBackupHashkey",
-            "mibObject16": "systemServicesAction",
-            "mibObject17": "systemServicesArg1",
-            "mibObject18": "systemServicesBluetoothStatus",
-            "mibObject19": "systemServicesBluetoothEnable",
-            "mibObject20": "systemServicesBluetoothTxPower",
-            "mibObject21": "systemServicesBluetoothStatus",  # Duplicated in original, left as-is
-            "mibObject22": "systemServicesBluetoothChassisId",
-            "mibObject23": "systemFipsAdminState",
-            "mibObject24": "systemFipsOperState",
-            "mibObject25": "alaAaaUbootAuthenticationPassword",
-            "mibObject26": "alaAaaUbootAccess",
-        }
-
-        return self._client.get("/", params=params)
+        return self._client.get("/", params=self._GET_SYSTEM_INFORMATION_QUERY.select(columns))
     
 
     def setSystem(self, contact: Optional[str] = None, name: Optional[str] = None, location: Optional[str] = None) -> ApiResult:
@@ -116,5 +124,8 @@ class SystemEndpoint(BaseEndpoint):
         if timezone is not None:
             form_data["mibObject2-T1"] = f"systemServicesTimezone:{timezone}"            
 
-        return self._client.post(url, data=form_data)    
+        return self._client.post(url, data=form_data)
+
 
+class AsyncSystemEndpoint(AsyncEndpointMixin, SystemEndpoint):
+    """Asynchronous variant of `SystemEndpoint` for use with `AsyncAosApiClient`."""
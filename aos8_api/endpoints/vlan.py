@@ -1,53 +1,102 @@
 from aos8_api.helper import parse_vlan_output_json
-from typing import Optional
-from aos8_api.endpoints.base import BaseEndpoint
+from typing import Iterable, Optional, List, Union
+from aos8_api.endpoints.base import BaseEndpoint, AsyncEndpointMixin
 from aos8_api.models import ApiResult
+from aos8_api.query import MibQuery
 
 class VlanEndpoint(BaseEndpoint):
     """Endpoint for managing VLAN configuration via the AOS RESTFUL API."""
 
 
-    def list(self, vlan_type: int = 5, limit: int = 200):
+    _LIST_QUERY = MibQuery(
+        "vlanTable",
+        columns=[
+            "vlanNumber",
+            "vlanDescription",
+            "vlanAdmStatus",
+            "vlanType",
+            "vlanOperStatus",
+            "vlanMtu",
+            "vlanRouterStatus",
+            "vlanSrcLearningStatus",
+        ],
+        filter_object="vlanType",
+        ignore_error=True,
+    )
+
+    def list(self, vlan_type: int = 5, limit: int = 200, columns: Optional[List[str]] = None):
         """
         Retrieve the list of VLANs using the MIB-based REST API.
 
         Args:
             vlan_type (int): VLAN type filter (default 5 for Ethernet VLAN).
             limit (int): Maximum number of results to return.
+            columns (Optional[List[str]]): MIB objects to return; all of the method's objects by default.
 
         Returns:
             ApiResult: Parsed VLAN data from the switch.
         """
-        params = {
-            "domain": "mib",
-            "urn": "vlanTable",
-            "mibObject0": "vlanNumber",
-            "mibObject1": "vlanDescription",
-            "mibObject2": "vlanAdmStatus",
-            "mibObject3": "vlanType",
-            "mibObject4": "vlanOperStatus",
-            "mibObject5": "vlanMtu",
-            "mibObject6": "vlanRouterStatus",
-            "mibObject7": "vlanSrcLearningStatus",
-            "filterObject": "vlanType",
-            "filterOperation": "==",
-            "filterValue": str(vlan_type),
-            "limit": str(limit),
-            "ignoreError": "true"
-        }
+        return self._client.get("/", params=self._LIST_QUERY.replace(filter_value=vlan_type, limit=limit).select(columns))
 
-        response = self._client.get("/", params=params)
-        return response
+    def iter_list(self, vlan_type: int = 5, page_size: int = 200):
+        """
+        Iterate over every VLAN of a type, one page at a time.
+
+        Args:
+            vlan_type (int): VLAN type filter (default 5 for Ethernet VLAN).
+            page_size (int): Number of rows requested per page.
+
+        Returns:
+            Iterator of (index, row) pairs.
+        """
+        return self._paginate(self._LIST_QUERY.replace(filter_value=vlan_type), page_size)
 
-    def create(self, vlan_id: int, description: Optional[str] = None, mtu: int = 1500, AdmStatus = 1, vlanSrcLearningStatus = 1) -> ApiResult:
+    def create(self, vlan_id: int, description: Optional[str] = None, mtu: int = 1500, AdmStatus = 1, vlanSrcLearningStatus = 1, refresh: Optional[str] = None) -> ApiResult:
         """
         Create VLAN info using a POST request with specific MIB object filters.
 
+        Args:
+            refresh (Optional[str]): "full", "row" or "none"; the client's default if None.
+
         Returns:
             ApiResult: VLAN data from the switch.
         """
         url = "/?domain=mib&urn=vlanTable"
-        form_data = {
+        form_data = self._create_form(vlan_id, description, mtu, AdmStatus, vlanSrcLearningStatus)
+        return self._post_and_refresh(url, form_data, self.list, lambda: self._read_vlan(vlan_id), refresh)
+
+    def _read_vlan(self, vlan_id: int) -> ApiResult:
+        """
+        Read the vlanTable row of one VLAN.
+        """
+        return self._client.get("/", params=self._LIST_QUERY.replace(filter_object="vlanNumber", filter_value=vlan_id))
+
+    def create_many(self, vlans: Iterable[Union[int, dict]], rows_per_request: int = 1) -> List[ApiResult]:
+        """
+        Create several VLANs, packing up to `rows_per_request` VLANs into each POST.
+
+        If the switch rejects a multi-VLAN request, its VLANs are created one by one.
+
+        Args:
+            vlans (Iterable[Union[int, dict]]): VLAN IDs, or dicts of `create` arguments
+                (e.g. {"vlan_id": 10, "description": "users"}).
+            rows_per_request (int): Maximum number of VLANs per request.
+                Packing is off by default (1, one POST per VLAN): a switch may
+                accept a multi-row write without applying every row, so only
+                raise it on switches where packed writes are known to work.
+
+        Returns:
+            List[ApiResult]: The write result of each VLAN, in order.
+        """
+        rows = [self._create_form(**(vlan if isinstance(vlan, dict) else {"vlan_id": vlan})) for vlan in vlans]
+        return self._post_rows("/?domain=mib&urn=vlanTable", rows, rows_per_request)
+
+    @staticmethod
+    def _create_form(vlan_id: int, description: Optional[str] = None, mtu: int = 1500, AdmStatus = 1, vlanSrcLearningStatus = 1) -> dict:
+        """
+        Build the vlanTable form fields that create a VLAN.
+        """
+        return {
             "mibObject0": f"vlanNumber:|{str(vlan_id)}",
             "mibObject1": f"vlanDescription:{description}",
             "mibObject2": f"vlanAdmStatus:{str(AdmStatus)}",
@@ -56,15 +105,13 @@ class VlanEndpoint(BaseEndpoint):
             "mibObject5": "vlanStatus:4"
         }
 
-        response = self._client.post(url, data=form_data)
-        if response.success:
-            return self.list()
-        return response
-
-    def edit(self, vlan_id: int, description: Optional[str] = None, mtu: int = 1500, AdmStatus = 1, vlanSrcLearningStatus = 1) -> ApiResult:
+    def edit(self, vlan_id: int, description: Optional[str] = None, mtu: int = 1500, AdmStatus = 1, vlanSrcLearningStatus = 1, refresh: Optional[str] = None) -> ApiResult:
         """
         Edit VLAN info using a POST request with specific MIB object filters.
 
+        Args:
+            refresh (Optional[str]): "full", "row" or "none"; the client's default if None.
+
         Returns:
             ApiResult: VLAN data from the switch.
         """
@@ -77,15 +124,15 @@ class VlanEndpoint(BaseEndpoint):
             "mibObject4": f"vlanSrcLearningStatus:{str(vlanSrcLearningStatus)}",
         }
 
-        response = self._client.post(url, data=form_data)
-        if response.success:
-            return self.list()
-        return response
+        return self._post_and_refresh(url, form_data, self.list, lambda: self._read_vlan(vlan_id), refresh)
 
-    def delete(self, vlan_id: int) -> ApiResult:
+    def delete(self, vlan_id: int, refresh: Optional[str] = None) -> ApiResult:
         """
         Delete VLAN using a POST request with specific MIB object filters.
 
+        Args:
+            refresh (Optional[str]): "full", "row" or "none"; the client's default if None.
+
         Returns:
             ApiResult: VLAN data from the switch.
         """
@@ -95,7 +142,8 @@ class VlanEndpoint(BaseEndpoint):
             "mibObject1": "vlanStatus:6"
         }
 
-        response = self._client.post(url, data=form_data)
-        if response.success:
-            return self.list()
-        return response
+        return self._post_and_refresh(url, form_data, self.list, lambda: self._read_vlan(vlan_id), refresh)
+
+
+class AsyncVlanEndpoint(AsyncEndpointMixin, VlanEndpoint):
+    """Asynchronous variant of `VlanEndpoint` for use with `AsyncAosApiClient`."""
@@ -1,78 +1,152 @@
 from aos8_api.helper import parse_output_json
-from aos8_api.endpoints.base import BaseEndpoint
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from aos8_api.endpoints.base import BaseEndpoint, AsyncEndpointMixin
+from aos8_api.ifindex import PortIndexResolver
 from aos8_api.models import ApiResult
+from aos8_api.paging import PagingError
+from aos8_api.query import MibQuery
 
 class VlanPortAssociation(BaseEndpoint):
     """Endpoint for managing VLAN-port associations via the AOS CLI API."""
 
+    def __init__(self, client):
+        super().__init__(client)
+        self._ports = PortIndexResolver()
+
     def _get_port_index(self, port_id: str) -> str:
         """
-        Retrieves MVRP port configuration using a MIB-based POST request.
+        Resolve a port identifier to its ifIndex.
+
+        The ifIndex is computed locally. The port table is read only once per
+        client to verify the encoding, and again only for unknown ports if the
+        switch numbers its ports differently. If a page of the port table
+        cannot be read, the rows already received are used.
 
         Args:
-            limit (int): Maximum number of records to return (default: 200)
+            port_id (str): Port identifier (e.g., "1/1/22").
 
         Returns:
-            ApiResult: Parsed MVRP port configuration data from the switch.
-        """
-        params = {
-            "domain": "mib",
-            "urn": "alaMvrpPortConfigTable",
-            "mibObject0": "alaMvrpPortConfigIfIndex",
-            "mibObject1": "alaMvrpPortStatus",
-            "mibObject2": "alaMvrpPortConfigRegistrarMode",
-            "mibObject3": "alaMvrpPortConfigApplicantMode",
-            "mibObject4": "alaMvrpPortConfigJoinTimer",
-            "mibObject5": "alaMvrpPortConfigLeaveTimer",
-            "mibObject6": "alaMvrpPortConfigLeaveAllTimer",
-            "mibObject7": "alaMvrpPortConfigPeriodicTimer",
-            "mibObject8": "alaMvrpPortConfigPeriodicTransmissionStatus",
-            "function": "slotPort_ifindex",
-            "object": "alaMvrpPortConfigIfIndex",
-            "limit": str(200),
-            "ignoreError": "true"
-        }
+            str: The matching ifIndex, or None if not found or no page of the port table can be read.
+        """
+        if self._ports.needs_table(port_id):
+            rows = []
+            try:
+                for row in self._paginate(self._PORT_INDEXES_QUERY, 500):
+                    rows.append(row)
+            except PagingError:
+                if not rows:
+                    return None
+            self._ports.load(self._port_pairs(rows))
+        return self._ports.resolve(port_id)
 
-        response = self._client.get("/", params=params)
+    _PORT_INDEXES_QUERY = MibQuery(
+        "alaMvrpPortConfigTable",
+        columns=[
+            "alaMvrpPortConfigIfIndex",
+        ],
+        function="slotPort_ifindex",
+        object="alaMvrpPortConfigIfIndex",
+        ignore_error=True,
+    )
 
-        rows = response.data["rows"]
-        for item in rows.values():
+    @staticmethod
+    def _port_pairs(rows: Iterable[Tuple[str, dict]]) -> Iterator[Tuple[str, str]]:
+        """
+        Yield the (port identifier, ifIndex) pair of each alaMvrpPortConfigTable row.
+        """
+        for _, item in rows:
             # Decode escaped port ID (e.g., '1\/1\/22' becomes '1/1/22')
-            slot_port = item.get("slotPort_ifindex_0", "").replace("\\/", "/")
-            if slot_port == port_id:
-                return item.get("alaMvrpPortConfigIfIndex")
-        return None
+            yield item.get("slotPort_ifindex_0", "").replace("\\/", "/"), item.get("alaMvrpPortConfigIfIndex")
 
     
-    def list_by_vlan(self,vlan_id:str):
+    _VLAN_QUERY = MibQuery(
+        "vpaTable",
+        columns=[
+            "vpaVlanNumber",
+            "vpaIfIndex",
+            "vpaState",
+            "vpaType",
+        ],
+        function="slotPort_ifindex",
+        object="vpaIfIndex",
+        filter_object="vpaVlanNumber",
+        ignore_error=True,
+    )
+
+    def list_by_vlan(self,vlan_id:str, columns: Optional[List[str]] = None):
         """
         Retrieve all port associations for a given VLAN using a GET request.
 
         Args:
             vlan_id (int): VLAN ID to filter the VPA table.
+            columns (Optional[List[str]]): MIB objects to return; all of the method's objects by default.
 
         Returns:
             ApiResult: Parsed data from the VPA table for the specified VLAN.
         """
-        params = {
-            "domain": "mib",
-            "urn": "vpaTable",
-            "mibObject0": "vpaVlanNumber",
-            "mibObject1": "vpaIfIndex",
-            "mibObject2": "vpaState",
-            "mibObject3": "vpaType",
-            "function": "slotPort_ifindex",
-            "object": "vpaIfIndex",
-            "filterObject": "vpaVlanNumber",
-            "filterOperation": "==",
-            "filterValue": str(vlan_id),
-            "ignoreError": "true"
+        return self._client.get("/", params=self._VLAN_QUERY.replace(filter_value=vlan_id).select(columns))
+
+    def iter_by_vlan(self, vlan_id: str, page_size: int = 200):
+        """
+        Iterate over every port association of a VLAN, one page at a time.
+
+        Args:
+            vlan_id (int): VLAN ID to filter the VPA table.
+            page_size (int): Number of rows requested per page.
+
+        Returns:
+            Iterator of (index, row) pairs.
+        """
+        return self._paginate(self._VLAN_QUERY.replace(filter_value=vlan_id), page_size)
+
+    def _read_port(self, ifindex: str) -> ApiResult:
+        """
+        Read the vpaTable rows of one port.
+        """
+        return self._client.get("/", params=self._VLAN_QUERY.replace(filter_object="vpaIfIndex", filter_value=ifindex))
+
+    @staticmethod
+    def _association_form(vlan_id: str, ifindex: str, mode: str) -> dict:
+        """
+        Build the vpaTable form fields that create or update a port association.
+
+        Args:
+            vlan_id (str): VLAN ID.
+            ifindex (str): ifIndex of the port.
+            mode (str): "untagged" or "tagged".
+
+        Returns:
+            dict: MIB form data for the POST request.
+        """
+        # Determine vpaType: 1 = untagged, 2 = tagged
+        vpa_type = 1 if mode.lower() == "untagged" else 2
+
+        return {
+            "mibObject0": f"vpaVlanNumber:|{str(vlan_id)}",
+            "mibObject1": f"vpaIfIndex:|{ifindex}",
+            "mibObject2": f"vpaType:{str(vpa_type)}",
+            "mibObject3": "vpaStatus:4"  # Create/activate entry
         }
 
-        response = self._client.get("/", params=params)
-        return response        
+    @staticmethod
+    def _removal_form(vlan_id: str, ifindex: str) -> dict:
+        """
+        Build the vpaTable form fields that remove a port association.
+
+        Args:
+            vlan_id (str): VLAN ID.
+            ifindex (str): ifIndex of the port.
+
+        Returns:
+            dict: MIB form data for the POST request.
+        """
+        return {
+            "mibObject0": f"vpaVlanNumber:|{str(vlan_id)}",
+            "mibObject1": f"vpaIfIndex:|{ifindex}",
+            "mibObject2": "vpaStatus:6"
+        }
 
-    def create(self, port_id: str, vlan_id: str, mode: str = "untagged") -> ApiResult:
+    def create(self, port_id: str, vlan_id: str, mode: str = "untagged", refresh: Optional[str] = None) -> ApiResult:
         """
         Add a port to a VLAN with the specified tagging mode via MIB POST API.
 
@@ -80,6 +154,7 @@ class VlanPortAssociation(BaseEndpoint):
             port_id (str): Port identifier (e.g., "1/1/22").
             vlan_id (str): VLAN ID to associate with the port.
             mode (str, optional): "untagged" or "tagged". Defaults to "untagged".
+            refresh (Optional[str]): "full", "row" or "none"; the client's default if None.
 
         Returns:
             ApiResult: Retrieve all port associations for a given VLAN using a GET request.
@@ -90,28 +165,68 @@ class VlanPortAssociation(BaseEndpoint):
         if ifindex is None:
             return None  # Optionally raise an exception here
 
-        # Determine vpaType: 1 = untagged, 2 = tagged
-        vpa_type = 1 if mode.lower() == "untagged" else 2
+        form_data = self._association_form(vlan_id, ifindex, mode)
+        return self._post_and_refresh(url, form_data, lambda: self.list_by_vlan(vlan_id), lambda: self._read_port(ifindex), refresh)
 
-        form_data = {
-            "mibObject0": f"vpaVlanNumber:|{str(vlan_id)}",
-            "mibObject1": f"vpaIfIndex:|{ifindex}",
-            "mibObject2": f"vpaType:{str(vpa_type)}",
-            "mibObject3": "vpaStatus:4"  # Create/activate entry
-        }
+    def create_many(self, associations: Iterable[Tuple[str, ...]], rows_per_request: int = 1) -> List[ApiResult]:
+        """
+        Add several ports to VLANs, packing up to `rows_per_request` associations into each POST.
+
+        If the switch rejects a multi-association request, its associations are
+        created one by one.
+
+        Args:
+            associations (Iterable[Tuple[str, ...]]): (port_id, vlan_id) or
+                (port_id, vlan_id, mode) tuples, e.g. ("1/1/22", "10", "tagged").
+            rows_per_request (int): Maximum number of associations per request.
+                Packing is off by default (1, one POST per association): a switch may
+                accept a multi-row write without applying every row, so only
+                raise it on switches where packed writes are known to work.
+
+        Returns:
+            List[ApiResult]: The write result of each association, in order; a
+            failed result for ports that do not exist.
+        """
+        associations = list(associations)
+        indexes = {port_id: self._get_port_index(port_id) for port_id, *_ in associations}
+        rows, results = self._association_rows(indexes, associations)
+        return self._fill_results(results, self._post_rows("/?domain=mib&urn=vpaTable", rows, rows_per_request))
+
+    @classmethod
+    def _association_rows(cls, indexes: Dict[str, Optional[str]], associations: List[Tuple[str, ...]]):
+        """
+        Build the form of each association whose port has an ifIndex in `indexes`.
+
+        Returns:
+            Tuple of the forms to post and the result list, holding a failed
+            result for each unknown port and None for each form, in order.
+        """
+        rows, results = [], []
+        for port_id, vlan_id, *mode in associations:
+            ifindex = indexes.get(port_id)
+            if ifindex is None:
+                results.append(ApiResult(success=False, diag=0, error=f"Port {port_id} not found"))
+            else:
+                rows.append(cls._association_form(vlan_id, ifindex, mode[0] if mode else "untagged"))
+                results.append(None)
+        return rows, results
 
-        response = self._client.post(url, data=form_data)
-        if response.success:
-            response = self.list_by_vlan(vlan_id)
-        return response
+    @staticmethod
+    def _fill_results(results: List[Optional[ApiResult]], outcomes: List[ApiResult]) -> List[ApiResult]:
+        """
+        Replace the None entries of `results` with `outcomes`, in order.
+        """
+        outcomes = iter(outcomes)
+        return [result if result is not None else next(outcomes) for result in results]
 
-    def edit(self, port_id: str, vlan_id: str, mode: str = "untagged") -> ApiResult:
+    def edit(self, port_id: str, vlan_id: str, mode: str = "untagged", refresh: Optional[str] = None) -> ApiResult:
         """Modify a port's tagging mode in a VLAN.
 
         Args:
             port_id (str): Port identifier.
             vlan_id (str): VLAN ID.
             mode (str, optional): New tagging mode ("untagged" or "tagged"). Defaults to "untagged".
+            refresh (Optional[str]): "full", "row" or "none"; the client's default if None.
 
         Returns:
             ApiResult: Retrieve all port associations for a given VLAN using a GET request.
@@ -122,27 +237,16 @@ class VlanPortAssociation(BaseEndpoint):
         if ifindex is None:
             return None  # Optionally raise an exception here
 
-        # Determine vpaType: 1 = untagged, 2 = tagged
-        vpa_type = 1 if mode.lower() == "untagged" else 2
+        form_data = self._association_form(vlan_id, ifindex, mode)
+        return self._post_and_refresh(url, form_data, lambda: self.list_by_vlan(vlan_id), lambda: self._read_port(ifindex), refresh)
 
-        form_data = {
-            "mibObject0": f"vpaVlanNumber:|{str(vlan_id)}",
-            "mibObject1": f"vpaIfIndex:|{ifindex}",
-            "mibObject2": f"vpaType:{str(vpa_type)}",
-            "mibObject3": "vpaStatus:4"  # Create/activate entry
-        }
-
-        response = self._client.post(url, data=form_data)
-        if response.success:
-            response = self.list_by_vlan(vlan_id)
-        return response
-
-    def delete(self, port_id: str, vlan_id: int) -> ApiResult:
+    def delete(self, port_id: str, vlan_id: int, refresh: Optional[str] = None) -> ApiResult:
         """Remove a port from a VLAN.
 
         Args:
             port_id (str): Port identifier.
             vlan_id (str): VLAN ID to disassociate from the port.
+            refresh (Optional[str]): "full", "row" or "none"; the client's default if None.
 
         Returns:
             ApiResult: Retrieve all port associations for a given VLAN using a GET request.
@@ -152,15 +256,64 @@ class VlanPortAssociation(BaseEndpoint):
         ifindex = self._get_port_index(port_id)
 
         if ifindex:
-            form_data = {
-                "mibObject0": f"vpaVlanNumber:|{str(vlan_id)}",
-                "mibObject1": f"vpaIfIndex:|{ifindex}",
-                "mibObject2": "vpaStatus:6"
-            }
-
-            response = self._client.post(url, data=form_data)
-            if response.success:
-                response = self.list_by_vlan(vlan_id)
-                return response
-            return response
+            form_data = self._removal_form(vlan_id, ifindex)
+            return self._post_and_refresh(url, form_data, lambda: self.list_by_vlan(vlan_id), lambda: self._read_port(ifindex), refresh)
         return None
+
+
+class AsyncVlanPortAssociation(AsyncEndpointMixin, VlanPortAssociation):
+    """Asynchronous variant of `VlanPortAssociation` for use with `AsyncAosApiClient`."""
+
+    async def _get_port_index(self, port_id: str) -> str:
+        if self._ports.needs_table(port_id):
+            rows = []
+            try:
+                async for row in self._paginate(self._PORT_INDEXES_QUERY, 500):
+                    rows.append(row)
+            except PagingError:
+                if not rows:
+                    return None
+            self._ports.load(self._port_pairs(rows))
+        return self._ports.resolve(port_id)
+
+    async def create(self, port_id: str, vlan_id: str, mode: str = "untagged", refresh: Optional[str] = None) -> ApiResult:
+        """
+        Async version of `VlanPortAssociation.create`.
+        """
+        ifindex = await self._get_port_index(port_id)
+        if ifindex is None:
+            return None
+
+        form_data = self._association_form(vlan_id, ifindex, mode)
+        return await self._post_and_refresh("/?domain=mib&urn=vpaTable", form_data, lambda: self.list_by_vlan(vlan_id), lambda: self._read_port(ifindex), refresh)
+
+    async def create_many(self, associations: Iterable[Tuple[str, ...]], rows_per_request: int = 1) -> List[ApiResult]:
+        """
+        Async version of `VlanPortAssociation.create_many`.
+        """
+        associations = list(associations)
+        indexes = {port_id: await self._get_port_index(port_id) for port_id, *_ in associations}
+        rows, results = self._association_rows(indexes, associations)
+        return self._fill_results(results, await self._post_rows("/?domain=mib&urn=vpaTable", rows, rows_per_request))
+
+    async def edit(self, port_id: str, vlan_id: str, mode: str = "untagged", refresh: Optional[str] = None) -> ApiResult:
+        """
+        Async version of `VlanPortAssociation.edit`.
+        """
+        ifindex = await self._get_port_index(port_id)
+        if ifindex is None:
+            return None
+
+        form_data = self._association_form(vlan_id, ifindex, mode)
+        return await self._post_and_refresh("/?domain=mib&urn=vpaTable", form_data, lambda: self.list_by_vlan(vlan_id), lambda: self._read_port(ifindex), refresh)
+
+    async def delete(self, port_id: str, vlan_id: int, refresh: Optional[str] = None) -> ApiResult:
+        """
+        Async version of `VlanPortAssociation.delete`.
+        """
+        ifindex = await self._get_port_index(port_id)
+        if not ifindex:
+            return None
+
+        form_data = self._removal_form(vlan_id, ifindex)
+        return await self._post_and_refresh("/?domain=mib&urn=vpaTable", form_data, lambda: self.list_by_vlan(vlan_id), lambda: self._read_port(ifindex), refresh)
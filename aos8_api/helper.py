@@ -1,5 +1,15 @@
 import re
-from typing import List, Dict, Union, Any
+from typing import List, Dict, Optional, Tuple, Union, Any
+
+# Patterns shared by the parsers, compiled once at import.
+_COLUMN_GAP = re.compile(r"\s{2,}")
+_PORT_PREFIX = re.compile(r"\s*\d+/\d+/\d+")
+# "name = value" counters, one per comma-separated field of a line, found in one scan of the output.
+_COUNTER = re.compile(r"(?:^|,)\s*([^,\n]+?)=[^\S\n]*(\d+)", re.MULTILINE)
+_ERROR_COUNTER = re.compile(r"(?:^|,)\s*([^,\n]+?)[^\S\n]*=[^\S\n]*([\d.Ee+-]+)", re.MULTILINE)
+# Dashed line under a table header, e.g. "------+-------+----" or "-----  ----".
+_TABLE_SEPARATOR = re.compile(r"\s*-+(?:[\s+]+-+)*\s*")
+_DASH_RUN = re.compile(r"-+")
 
 
 def parse_system_output_json(cli_output: str) -> Dict[str, Union[str, dict]]:
@@ -13,12 +23,10 @@ def parse_system_output_json(cli_output: str) -> Dict[str, Union[str, dict]]:
     current_section = None
     section_indent = None
 
-    lines = cli_output.strip().splitlines()
-
-    for line in lines:
-        indent_match = re.match(r'^(\s+)', line)
-        indent = len(indent_match.group(1)) if indent_match else 0
-        line = line.strip().rstrip(',')
+    for line in cli_output.strip().splitlines():
+        stripped = line.lstrip()
+        indent = len(line) - len(stripped)
+        line = stripped.rstrip().rstrip(',')
 
         if line.endswith(':') and ':' not in line[:-1]:
             section_name = line[:-1].strip()
@@ -39,22 +47,89 @@ def parse_system_output_json(cli_output: str) -> Dict[str, Union[str, dict]]:
     return data
 
 
+def table_columns(separator: str) -> List[Tuple[int, Optional[int]]]:
+    """
+    Derives the column boundaries of a fixed-width table from its dashed separator line.
+
+    Each run of dashes is a column. A column starts at the gap before its dashes
+    and ends where the next one starts, so a cell may run into the gap after its
+    dashes; the last column runs to the end of the line.
+
+    :param separator: Separator line, e.g. "------+-------+----"
+    :return: (start, end) offsets per column, end being None for the last column
+    """
+    starts = [max(run.start() - 1, 0) for run in _DASH_RUN.finditer(separator)]
+    if starts:
+        starts[0] = 0
+    return list(zip(starts, starts[1:] + [None]))
+
+
+def parse_fixed_width_table(cli_output: str) -> Tuple[List[str], List[List[str]]]:
+    """
+    Parses a CLI table by column position, using the dashed line under its header.
+
+    Rows are sliced at the offsets found by `table_columns`, so blank cells come
+    back as empty strings and cells containing several spaces stay whole. A row
+    with a cell running past its column into the next one is split on runs of
+    two or more spaces instead, padded with empty cells. The header is the line
+    directly above the separator. Blank lines and further separator lines are
+    skipped.
+
+    :param cli_output: Raw CLI output as a string
+    :return: Header names and the cells of each row; two empty lists if the output has no separator line
+    """
+    lines = cli_output.splitlines()
+    separator = _TABLE_SEPARATOR.fullmatch
+    for position, line in enumerate(lines):
+        if "--" in line and separator(line):
+            break
+    else:
+        return [], []
+
+    columns = table_columns(lines[position])
+    header = lines[position - 1] if position else ""
+    headers = [header[start:end].strip() for start, end in columns]
+    # Matches a row with non-space characters on both sides of a column boundary.
+    overflow = re.compile("|".join(f".{{{start - 1}}}\\S\\S" for start, _ in columns[1:]) or "(?!)").match
+    split = _COLUMN_GAP.split
+    rows = []
+    for line in lines[position + 1:]:
+        if not line.strip() or ("--" in line and separator(line)):
+            continue
+        if overflow(line):
+            # A cell overflows into the next column: fall back to splitting on gaps.
+            cells = split(line.strip())[:len(columns)]
+            rows.append(cells + [""] * (len(columns) - len(cells)))
+            continue
+        rows.append([line[start:end].strip() for start, end in columns])
+
+    return headers, rows
+
+
 def parse_output_json(output: str) -> List[Dict[str, str]]:
     """
     Parses CLI table output with headers and fixed-format rows.
 
+    Tables with a dashed line under the header are parsed by column position
+    (see `parse_fixed_width_table`); blank cells map to empty strings. Other
+    tables are split on runs of two or more spaces.
+
     :param output: Raw CLI output as a string
     :return: List of dictionaries mapping headers to values
     """
+    headers, rows = parse_fixed_width_table(output)
+    if headers:
+        return [dict(zip(headers, row)) for row in rows]
+
     lines = output.strip().splitlines()
-    headers = re.split(r"\s{2,}", lines[0].strip())
+    split = _COLUMN_GAP.split
+    headers = split(lines[0].strip())
     vlan_list = []
 
     for line in lines[2:]:
-        if not line.strip():
-            continue
-        parts = re.split(r"\s{2,}", line.strip())
-        vlan_list.append(dict(zip(headers, parts)))
+        line = line.strip()
+        if line:
+            vlan_list.append(dict(zip(headers, split(line))))
 
     return vlan_list
 
@@ -76,19 +151,17 @@ def parse_interface_status(cli_output: str) -> List[Dict[str, str]]:
     :param cli_output: Raw CLI output as a string
     :return: List of dictionaries per interface row
     """
-    lines = cli_output.strip().splitlines()
-    data_lines = []
+    split = _COLUMN_GAP.split
+    parsed = []
     in_data = False
 
-    for line in lines:
-        if re.match(r"^\s*\d+/\d+/\d+", line):
+    # Rows start at the first port line; everything after it is table data.
+    for line in cli_output.strip().splitlines():
+        if not in_data:
+            if not _PORT_PREFIX.match(line):
+                continue
             in_data = True
-        if in_data:
-            data_lines.append(line.strip())
-
-    parsed = []
-    for line in data_lines:
-        parts = re.split(r'\s{2,}', line)
+        parts = split(line.strip())
         if len(parts) < 13:
             continue
         parsed.append({
@@ -120,40 +193,32 @@ def parse_interface_detail(cli_output: str) -> Dict[str, Union[str, Dict[str, st
     data = {}
     rx_section = {}
     tx_section = {}
+    section = data
 
-    lines = cli_output.strip().splitlines()
-    current_section = "general"
-
-    for line in lines:
+    for line in cli_output.strip().splitlines():
         line = line.strip()
         if line.startswith("ACSW"):
             continue
         if line.startswith("Rx"):
-            current_section = "rx"
+            section = rx_section
             continue
         elif line.startswith("Tx"):
-            current_section = "tx"
+            section = tx_section
             continue
 
-        if ":" in line:
-            parts = line.split(":")
-            key = parts[0].strip()
-            value = ":".join(parts[1:]).strip().rstrip(",")
+        key, colon, value = line.partition(":")
+        if colon:
+            key = key.strip()
+            value = value.strip().rstrip(",")
 
             if "," in value:
-                sub_parts = [v.strip() for v in value.split(",")]
-                for sub_part in sub_parts:
-                    if ":" in sub_part:
-                        sub_key, sub_val = map(str.strip, sub_part.split(":", 1))
-                        key = f"{key} / {sub_key}"
-                        value = sub_val
-
-            if current_section == "rx":
-                rx_section[key] = value
-            elif current_section == "tx":
-                tx_section[key] = value
-            else:
-                data[key] = value
+                for sub_part in value.split(","):
+                    sub_key, sub_colon, sub_val = sub_part.partition(":")
+                    if sub_colon:
+                        key = f"{key} / {sub_key.strip()}"
+                        value = sub_val.strip()
+
+            section[key] = value
 
     if rx_section:
         data["Rx"] = rx_section
@@ -163,6 +228,25 @@ def parse_interface_detail(cli_output: str) -> Dict[str, Union[str, Dict[str, st
     return data
 
 
+# First line of each port's block in 'show interfaces port' output, e.g. "Chassis/Slot/Port : 1/1/1,".
+_PORT_BLOCK_HEADER = re.compile(r"^\s*(?:Chassis/)?Slot/Port\s*:\s*([^\s,]+)", re.MULTILINE)
+
+
+def split_interface_detail(cli_output: str) -> Dict[str, str]:
+    """
+    Splits multi-port 'show interfaces port <range>' output into the output of each port.
+
+    :param cli_output: Raw CLI output as a string
+    :return: Dictionary of each port's output, keyed by port identifier, in output order
+    """
+    headers = list(_PORT_BLOCK_HEADER.finditer(cli_output))
+    blocks = {}
+    for header, following in zip(headers, headers[1:] + [None]):
+        end = following.start() if following is not None else len(cli_output)
+        blocks[header.group(1)] = cli_output[header.start():end]
+    return blocks
+
+
 def parse_ip_interface_output(cli_output: str) -> List[Dict[str, str]]:
     """
     Parses the 'show ip interface' CLI output into a list of dictionaries.
@@ -170,45 +254,34 @@ def parse_ip_interface_output(cli_output: str) -> List[Dict[str, str]]:
     :param cli_output: Raw CLI output as a string
     :return: List of dictionaries with parsed interface data
     """
-    lines = cli_output.strip().splitlines()
-    data_lines = []
-    start_parsing = False
+    interfaces = []
 
-    for line in lines:
-        if re.match(r'-{10,}', line):
-            start_parsing = True
+    # Rows follow the dashed line under the header; columns are sliced by position.
+    _, rows = parse_fixed_width_table(cli_output)
+    for cells in rows:
+        if len(cells) < 5 or not cells[0]:
             continue
-        if start_parsing and line.strip():
-            data_lines.append(line.strip())
-
-    interfaces = []
-    for line in data_lines:
-        parts = re.split(r'\s{2,}', line)
-        if len(parts) >= 5:
-            interfaces.append({
-                "name": parts[0],
-                "ip_address": parts[1],
-                "subnet_mask": parts[2],
-                "status": parts[3],
-                "forward": parts[4],
-                "device": parts[5] if len(parts) > 5 else None
-            })
+        interfaces.append({
+            "name": cells[0],
+            "ip_address": cells[1],
+            "subnet_mask": cells[2],
+            "status": cells[3],
+            "forward": cells[4],
+            "device": (cells[5] or None) if len(cells) > 5 else None
+        })
 
     return interfaces
 
 def parse_violation_output_to_json(output: str) -> List[Dict]:
-    lines = output.strip().splitlines()
-
-    # Skip header and find data lines
-    data_lines = [
-        line.strip() for line in lines
-        if re.match(r"^\d+/\d+/\d+", line.strip())  # Matches lines starting with port format
-    ]
-
+    split = _COLUMN_GAP.split
     parsed = []
-    for line in data_lines:
+    for line in output.strip().splitlines():
+        # Skip header lines: data lines start with a port (e.g. "1/1/23")
+        line = line.strip()
+        if not _PORT_PREFIX.match(line):
+            continue
         # Example: "1/1/23    AG         admin down          lps shutdown    0     300         10/1 0"
-        parts = re.split(r'\s{2,}', line.strip())
+        parts = split(line)
         if len(parts) < 7:
             continue  # Skip if line is malformed
 
@@ -236,36 +309,38 @@ def parse_violation_output_to_json(output: str) -> List[Dict]:
 
     return parsed
 
+_GLOBAL_TRAP = re.compile(r"Global Violation Trap\s*:\s*(\w+)")
+_GLOBAL_RECOVERY_MAXIMUM = re.compile(r"Global Recovery Maximum\s*:\s*(\d+)")
+_GLOBAL_RECOVERY_TIME = re.compile(r"Global Recovery Time\s*:\s*(\d+)")
+_RECOVERY_PORT_HEADER = re.compile(r"\s*Port\s+Recovery Max\s+Recovery Time")
+
+
 def parse_violation_recovery_configuration(cli_output: str) -> Dict[str, Any]:
     result = {
         "global": {},
         "ports": []
     }
 
-    lines = cli_output.strip().splitlines()
-
-    # Parse global values
-    for line in lines:
+    # Global values may appear anywhere; port rows follow the port table header.
+    port_data_started = False
+    for line in cli_output.strip().splitlines():
         if "Global Violation Trap" in line:
-            match = re.search(r"Global Violation Trap\s*:\s*(\w+)", line)
+            match = _GLOBAL_TRAP.search(line)
             if match:
                 result["global"]["trap"] = match.group(1)
         elif "Global Recovery Maximum" in line:
-            match = re.search(r"Global Recovery Maximum\s*:\s*(\d+)", line)
+            match = _GLOBAL_RECOVERY_MAXIMUM.search(line)
             if match:
                 result["global"]["recovery_maximum"] = int(match.group(1))
         elif "Global Recovery Time" in line:
-            match = re.search(r"Global Recovery Time\s*:\s*(\d+)", line)
+            match = _GLOBAL_RECOVERY_TIME.search(line)
             if match:
                 result["global"]["recovery_time"] = int(match.group(1))
 
-    # Parse port-specific values
-    port_data_started = False
-    for line in lines:
-        if re.match(r"^\s*Port\s+Recovery Max\s+Recovery Time", line):
+        if _RECOVERY_PORT_HEADER.match(line):
             port_data_started = True
             continue
-        if port_data_started and re.match(r"^\s*\d+/\d+/\d+", line):
+        if port_data_started and _PORT_PREFIX.match(line):
             parts = line.strip().split()
             if len(parts) >= 3:
                 port_entry = {
@@ -277,20 +352,16 @@ def parse_violation_recovery_configuration(cli_output: str) -> Dict[str, Any]:
 
     return result
 
-import re
-from typing import List, Dict
+_CAPABILITY_HEADER = re.compile(r"^\s*Ch/Slot/Port\s+AutoNeg\s+Pause\s+Crossover", re.IGNORECASE)
+
 
 def parse_interfaces_capability(cli_output: str) -> List[Dict[str, str]]:
-    lines = cli_output.strip().splitlines()
-    result = []
-    
-    # Skip headers
-    header_regex = re.compile(r"^\s*Ch/Slot/Port\s+AutoNeg\s+Pause\s+Crossover", re.IGNORECASE)
     cap_entries = {}
-    
-    for line in lines:
+
+    for line in cli_output.strip().splitlines():
         line = line.strip()
-        if not line or header_regex.match(line):
+        # Skip headers
+        if not line or _CAPABILITY_HEADER.match(line):
             continue
 
         parts = line.split()
@@ -334,22 +405,11 @@ def parse_interface_accounting(output: str) -> Dict[str, int]:
     Returns:
         Dictionary mapping each metric to its integer value.
     """
-    metrics = {}
-    lines = output.splitlines()
-
     # Skip the port line (e.g., "1/1/2:")
-    for line in lines[1:]:
-        # Normalize line: remove trailing commas and split on commas
-        parts = [p.strip().rstrip(',') for p in line.strip().split(',') if p.strip()]
-        for part in parts:
-            # Match patterns like: "Rx Undersize             =                    0"
-            match = re.match(r"(.+?)=\s*(\d+)", part)
-            if match:
-                key = match.group(1).strip().replace(" ", "_")
-                value = int(match.group(2))
-                metrics[key] = value
+    _, _, counters = output.partition("\n")
 
-    return metrics
+    # Match patterns like: "Rx Undersize             =                    0"
+    return {key.strip().replace(" ", "_"): int(value) for key, value in _COUNTER.findall(counters)}
 
 def parse_interface_counters(output: str) -> Dict[str, int]:
     """
@@ -361,20 +421,7 @@ def parse_interface_counters(output: str) -> Dict[str, int]:
     Returns:
         Dictionary of counters with their values.
     """
-    counters = {}
-    lines = output.splitlines()
-
-    for line in lines:
-        # Remove trailing commas, split by commas, and clean up
-        parts = [p.strip().rstrip(',') for p in line.strip().split(',') if p.strip()]
-        for part in parts:
-            match = re.match(r"(.+?)=\s*([\d]+)", part)
-            if match:
-                key = match.group(1).strip().replace(" ", "_")
-                value = int(match.group(2))
-                counters[key] = value
-
-    return counters
+    return {key.strip().replace(" ", "_"): int(value) for key, value in _COUNTER.findall(output)}
 
 def parse_interface_counters_errors(output: str) -> Dict[str, float]:
     """
@@ -387,18 +434,10 @@ def parse_interface_counters_errors(output: str) -> Dict[str, float]:
         Dictionary with error counter names and numeric values (float or int).
     """
     errors = {}
-    lines = output.splitlines()
 
-    for line in lines:
-        # Split on commas
-        parts = [part.strip() for part in line.split(',') if part.strip()]
-        for part in parts:
-            match = re.match(r"(.+?)\s*=\s*([\d.Ee+-]+)", part)
-            if match:
-                key = match.group(1).strip().replace(" ", "_")
-                value_str = match.group(2)
-                value = float(value_str) if 'e' in value_str.lower() or '.' in value_str else int(value_str)
-                errors[key] = value
+    for key, value_str in _ERROR_COUNTER.findall(output):
+        value = float(value_str) if 'e' in value_str.lower() or '.' in value_str else int(value_str)
+        errors[key.strip().replace(" ", "_")] = value
 
     return errors
 
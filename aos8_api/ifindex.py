@@ -0,0 +1,198 @@
+import threading
+import time
+from typing import Dict, Iterable, Optional, Tuple
+
+from aos8_api.models import ApiResult
+
+# AOS8 ifIndex layout: physical ports are ((chassis - 1) * CHASSIS_STRIDE
+# + slot * SLOT_STRIDE + port), link aggregates are LINKAGG_BASE + aggregate ID.
+CHASSIS_STRIDE = 100000
+SLOT_STRIDE = 1000
+LINKAGG_BASE = 40000000
+MAX_CHASSIS = 8
+
+
+def port_to_ifindex(port_id: str) -> str:
+    """
+    Encode a port identifier as its AOS8 ifIndex.
+
+    Args:
+        port_id: "chassis/slot/port" (e.g., "1/1/22"), "slot/port" on a
+            standalone switch (e.g., "1/22"), or "0/<id>" for a link aggregate.
+
+    Returns:
+        str: The ifIndex (e.g., "1022", "101005" for "2/1/5", "40000003" for "0/3").
+
+    Raises:
+        ValueError: If `port_id` is not a valid port identifier.
+    """
+    try:
+        parts = [int(part) for part in port_id.strip().split("/")]
+    except ValueError:
+        raise ValueError(f"Invalid port identifier: {port_id!r}") from None
+    if len(parts) == 2 and parts[0] == 0 and 0 < parts[1] < SLOT_STRIDE:
+        return str(LINKAGG_BASE + parts[1])
+    if len(parts) == 2:
+        parts.insert(0, 1)
+    if len(parts) != 3:
+        raise ValueError(f"Invalid port identifier: {port_id!r}")
+    chassis, slot, port = parts
+    if not (1 <= chassis <= MAX_CHASSIS and 1 <= slot < CHASSIS_STRIDE // SLOT_STRIDE and 1 <= port < SLOT_STRIDE):
+        raise ValueError(f"Invalid port identifier: {port_id!r}")
+    return str((chassis - 1) * CHASSIS_STRIDE + slot * SLOT_STRIDE + port)
+
+
+def ifindex_to_port(ifindex) -> str:
+    """
+    Decode an AOS8 ifIndex into its port identifier.
+
+    Args:
+        ifindex: ifIndex of a physical port or link aggregate (str or int).
+
+    Returns:
+        str: "chassis/slot/port" for physical ports, "0/<id>" for link aggregates.
+
+    Raises:
+        ValueError: If `ifindex` is not the ifIndex of a port or link aggregate.
+    """
+    try:
+        value = int(ifindex)
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid ifIndex: {ifindex!r}") from None
+    if LINKAGG_BASE < value < LINKAGG_BASE + SLOT_STRIDE:
+        return f"0/{value - LINKAGG_BASE}"
+    chassis, rest = divmod(value, CHASSIS_STRIDE)
+    slot, port = divmod(rest, SLOT_STRIDE)
+    if not (chassis < MAX_CHASSIS and slot >= 1 and port >= 1):
+        raise ValueError(f"Invalid ifIndex: {ifindex!r}")
+    return f"{chassis + 1}/{slot}/{port}"
+
+
+class PortIndexResolver:
+    """
+    Per-client translation of port identifiers to ifIndexes.
+
+    Ports are encoded with `port_to_ifindex`. The first translation loads a
+    port table (port identifier and ifIndex of every port) from the switch to
+    verify the encoding. If the table contradicts it, the switch's own
+    ifIndexes are used instead; the table is then reloaded only for ports it
+    does not list yet.
+    """
+
+    def __init__(self):
+        self.verified: Optional[bool] = None
+        self._indexes: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def needs_table(self, port_id: str) -> bool:
+        """
+        Return True if the port table must be loaded before `port_id` can be resolved.
+        """
+        if self.verified is None:
+            return True
+        return not self.verified and port_id not in self._indexes
+
+    def load(self, ports: Iterable[Tuple[str, str]]):
+        """
+        Record the (port identifier, ifIndex) pairs read from the switch and verify the encoding against them.
+
+        Ports whose identifier cannot be encoded do not count against the encoding.
+        """
+        indexes = {port_id: str(ifindex) for port_id, ifindex in ports if port_id and ifindex}
+        consistent = True
+        for port_id, ifindex in indexes.items():
+            try:
+                if port_to_ifindex(port_id) != ifindex:
+                    consistent = False
+                    break
+            except ValueError:
+                continue
+        with self._lock:
+            self._indexes.update(indexes)
+            if self.verified is None or not consistent:
+                self.verified = consistent
+
+    def resolve(self, port_id: str) -> Optional[str]:
+        """
+        Return the ifIndex of `port_id`, or None if it is unknown.
+        """
+        if self.verified:
+            try:
+                return port_to_ifindex(port_id)
+            except ValueError:
+                pass
+        return self._indexes.get(port_id)
+
+
+class IpInterfaceIndex:
+    """
+    Per-client index of a switch's IP interfaces, from name to ifIndex.
+
+    The index is loaded from a full alaIpInterfaceTable read and expires after
+    `ttl` seconds. In between, writes keep it current: interfaces in rows read
+    back after a write are added, and deleted interfaces are removed.
+    """
+
+    def __init__(self, ttl: float = 300.0):
+        """
+        Args:
+            ttl: Seconds after which the index must be reloaded from the switch.
+        """
+        self.ttl = ttl
+        self._names: Dict[str, str] = {}
+        self._loaded_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def expired(self) -> bool:
+        """
+        Return True if the index was never loaded or is older than its TTL.
+        """
+        return self._loaded_at is None or time.monotonic() - self._loaded_at >= self.ttl
+
+    def load(self, rows: Iterable[Tuple[str, dict]]):
+        """
+        Replace the index with the (index, row) pairs of a full alaIpInterfaceTable read.
+        """
+        names = {}
+        for _, row in rows:
+            self._add(row, names)
+        with self._lock:
+            self._names = names
+            self._loaded_at = time.monotonic()
+
+    def update(self, result: ApiResult):
+        """
+        Record the interfaces in the alaIpInterfaceTable rows of a read, e.g. the one returned by a write.
+        """
+        rows = (result.data or {}).get("rows") if result.success and isinstance(result.data, dict) else None
+        if isinstance(rows, dict):
+            with self._lock:
+                for row in rows.values():
+                    self._add(row, self._names)
+
+    def remove(self, name: str):
+        """
+        Forget the interface named `name`.
+        """
+        with self._lock:
+            self._names.pop(name, None)
+
+    def invalidate(self):
+        """
+        Drop the whole index; it is reloaded on next use.
+        """
+        with self._lock:
+            self._names = {}
+            self._loaded_at = None
+
+    def ifindex(self, name: str) -> Optional[str]:
+        """
+        Return the ifIndex of the interface named `name`, or None if it is unknown.
+        """
+        return self._names.get(name)
+
+    @staticmethod
+    def _add(row: dict, names: Dict[str, str]):
+        ifindex, name = row.get("ifIndex"), row.get("alaIpInterfaceName")
+        if ifindex is not None and name:
+            names[name] = str(ifindex)
@@ -0,0 +1,219 @@
+import asyncio
+import logging
+import random
+import threading
+import time
+from typing import Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class _KeepWarmSchedule:
+    """
+    Decide when each client's session needs a keep-alive ping.
+
+    A ping is due once a client has been idle for a fraction of its session
+    lifetime: the lifetime learned by the client's session tracker, capped at
+    `default_timeout`, or `default_timeout` until one has been observed. Each
+    client gets a fixed random offset within `jitter` so that a fleet is not
+    pinged in lockstep.
+    """
+
+    def __init__(self, clients: Iterable, default_timeout: float, margin: float, jitter: float, retry_interval: float):
+        if not 0 < margin <= 1:
+            raise ValueError("margin must be in (0, 1]")
+        if not 0 <= jitter < margin:
+            raise ValueError("jitter must be in [0, margin)")
+        self.default_timeout = default_timeout
+        self.margin = margin
+        self.jitter = jitter
+        self.retry_interval = retry_interval
+        self.clients = []
+        self._offsets: Dict[int, float] = {}
+        self._attempts: Dict[int, float] = {}
+        for client in clients:
+            self.add(client)
+
+    def add(self, client):
+        """
+        Start keeping `client`'s session warm.
+        """
+        if id(client) not in self._offsets:
+            self.clients.append(client)
+            self._offsets[id(client)] = random.uniform(0, self.jitter)
+
+    def remove(self, client):
+        """
+        Stop keeping `client`'s session warm.
+        """
+        if self._offsets.pop(id(client), None) is not None:
+            self.clients.remove(client)
+            self._attempts.pop(id(client), None)
+
+    def _due(self, client) -> Optional[float]:
+        """
+        Return the time at which `client` should be pinged, or None if it has no session yet.
+        """
+        session = client._session
+        if session.last_used is None:
+            return None
+        lifetime = min(session.lifetime or self.default_timeout, self.default_timeout)
+        due = session.last_used + lifetime * (self.margin - self._offsets[id(client)])
+        # Do not hammer a switch whose pings keep failing.
+        return max(due, self._attempts.get(id(client), 0.0) + self.retry_interval)
+
+    def _next_wake(self, now: float, max_wait: float) -> float:
+        """
+        Return how long to sleep before the next ping is due, at most `max_wait`.
+
+        The cap lets clients added or used meanwhile be picked up.
+        """
+        dues = [due for due in map(self._due, list(self.clients)) if due is not None]
+        return min(max(min(dues, default=now + max_wait) - now, 0.0), max_wait)
+
+    def _due_clients(self, now: float) -> list:
+        due_clients = []
+        for client in list(self.clients):
+            due = self._due(client)
+            if due is not None and due <= now:
+                self._attempts[id(client)] = now
+                due_clients.append(client)
+        return due_clients
+
+    @staticmethod
+    def _log_ping(client, outcome):
+        """
+        Log a keep-alive ping that raised or returned an unsuccessful result.
+        """
+        if isinstance(outcome, BaseException):
+            logger.warning("Keep-alive ping to %s failed: %r", client.base_url, outcome)
+        elif outcome is not None and not getattr(outcome, "success", True):
+            logger.warning("Keep-alive ping to %s failed (%s): %s", client.base_url, outcome.diag, outcome.error)
+
+
+class KeepWarm(_KeepWarmSchedule):
+    """
+    Background thread that keeps `AosApiClient` sessions from expiring.
+
+    Idle clients are pinged with `system.keepAlive()` shortly before their
+    session would time out, so regular requests do not pay for a 401, a login
+    and a retry. Clients that are in use are not pinged. Clients that have not
+    authenticated yet (e.g. lazy clients) are skipped until their first request.
+
+    Example:
+        with KeepWarm(clients):
+            ...
+    """
+
+    def __init__(self, clients: Iterable = (), default_timeout: float = 240.0, margin: float = 0.8,
+                 jitter: float = 0.1, retry_interval: float = 10.0):
+        """
+        Args:
+            clients: Clients to keep warm; more can be added later with `add()`.
+            default_timeout: Assumed session timeout in seconds until one is learned, and
+                the longest session timeout pings are scheduled for.
+            margin: Fraction of the session timeout after which an idle client is pinged.
+            jitter: Maximum random fraction subtracted from `margin`, per client.
+            retry_interval: Minimum number of seconds between two pings of a client.
+        """
+        super().__init__(clients, default_timeout, margin, jitter, retry_interval)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> 'KeepWarm':
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def start(self):
+        """
+        Start the background thread.
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="aos8-keepwarm", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        Stop the background thread and wait for it to exit.
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.is_set():
+            for client in self._due_clients(time.time()):
+                try:
+                    outcome = client.system.keepAlive()
+                except Exception as error:
+                    outcome = error
+                self._log_ping(client, outcome)
+            self._stop.wait(self._next_wake(time.time(), self.retry_interval))
+
+
+class AsyncKeepWarm(_KeepWarmSchedule):
+    """
+    Asyncio task that keeps `AsyncAosApiClient` sessions from expiring.
+
+    Same policy as `KeepWarm`; due clients are pinged concurrently.
+
+    Example:
+        async with AsyncKeepWarm(fleet.clients):
+            ...
+    """
+
+    def __init__(self, clients: Iterable = (), default_timeout: float = 240.0, margin: float = 0.8,
+                 jitter: float = 0.1, retry_interval: float = 10.0):
+        """
+        Args:
+            clients: Clients to keep warm; more can be added later with `add()`.
+            default_timeout: Assumed session timeout in seconds until one is learned, and
+                the longest session timeout pings are scheduled for.
+            margin: Fraction of the session timeout after which an idle client is pinged.
+            jitter: Maximum random fraction subtracted from `margin`, per client.
+            retry_interval: Minimum number of seconds between two pings of a client.
+        """
+        super().__init__(clients, default_timeout, margin, jitter, retry_interval)
+        self._task: Optional[asyncio.Task] = None
+
+    async def __aenter__(self) -> 'AsyncKeepWarm':
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.stop()
+
+    def start(self):
+        """
+        Start the background task on the running event loop.
+        """
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._run())
+
+    async def stop(self):
+        """
+        Cancel the background task and wait for it to exit.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        while True:
+            due_clients = self._due_clients(time.time())
+            if due_clients:
+                outcomes = await asyncio.gather(*(client.system.keepAlive() for client in due_clients),
+                                                return_exceptions=True)
+                for client, outcome in zip(due_clients, outcomes):
+                    self._log_ping(client, outcome)
+            await asyncio.sleep(self._next_wake(time.time(), self.retry_interval))
@@ -1,3 +1,5 @@
+import dataclasses
+from copy import deepcopy
 from dataclasses import dataclass
 from typing import Any, List, Optional, Union
 
@@ -13,9 +15,21 @@ class ApiResult:
         error (Optional[Union[str, List[str]]]): Error message(s), if any.
         output (Optional[str]): Raw output from the operation, if applicable.
         data (Any): Parsed or structured result data.
+        age (Optional[float]): Seconds since the data was read from the switch, for
+            results served from a read cache; None for results read just now.
     """
     success: bool
     diag: int
     error: Optional[Union[str, List[str]]] = None
     output: Optional[str] = None
     data: Any = None
+    age: Optional[float] = None
+
+    def copy(self, **changes) -> "ApiResult":
+        """
+        Return a copy of the result with its own deep copy of `data`.
+
+        Args:
+            **changes: Fields to change in the copy, e.g. ``age=1.5``.
+        """
+        return dataclasses.replace(self, **{"data": deepcopy(self.data), **changes})
@@ -0,0 +1,120 @@
+import warnings
+from typing import AsyncIterator, Dict, Iterator, Mapping, Optional, Tuple
+
+from aos8_api.models import ApiResult
+from aos8_api.query import MibQuery
+
+# Query parameter asking the switch for the rows following a given row index.
+CURSOR_PARAM = "startIndex"
+
+# Row limit of the single read used when a switch does not page a table.
+FALLBACK_LIMIT = 10000
+
+Row = Tuple[str, Dict]
+
+
+class PagingError(Exception):
+    """
+    Raised when a page of a MIB table cannot be read.
+
+    Attributes:
+        result: The `ApiResult` of the page.
+    """
+
+    def __init__(self, result: ApiResult, message: Optional[str] = None):
+        super().__init__(message or f"Reading MIB table page failed ({result.diag}): {result.error}")
+        self.result = result
+
+
+class _Pager:
+    """
+    Keyset pagination state over a MIB table query.
+
+    Each page is requested with ``limit`` set to the page size and, after the
+    first one, `CURSOR_PARAM` set to the index of the last row received. Paging
+    stops at the first short page. Rows already received on the previous page
+    are skipped. A full page without new rows means the switch ignored the
+    cursor; rather than looping or silently returning a truncated table, the
+    pager warns and reads the table once more without a cursor and with
+    ``limit`` set to `FALLBACK_LIMIT`, skipping the rows already returned.
+
+    `MibQuery` pages are derived with `MibQuery.replace`; plain parameter
+    dicts are copied.
+    """
+
+    def __init__(self, params: Mapping, page_size: int):
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+        self.params = params
+        self.page_size = page_size
+        self.cursor: Optional[str] = None
+        self.done = False
+        self.fallback = False
+        self._previous = set()
+
+    def next_params(self) -> Mapping:
+        limit = FALLBACK_LIMIT if self.fallback else self.page_size
+        if isinstance(self.params, MibQuery):
+            if self.cursor is None:
+                return self.params.replace(limit=limit)
+            return self.params.replace(limit=limit, extra={**self.params.extra, CURSOR_PARAM: self.cursor})
+        params = {key: value for key, value in self.params.items() if key != CURSOR_PARAM}
+        params["limit"] = str(limit)
+        if self.cursor is not None:
+            params[CURSOR_PARAM] = self.cursor
+        return params
+
+    def rows(self, result: ApiResult) -> list:
+        """
+        Return the new rows of a page and advance the cursor.
+        """
+        if not result.success:
+            raise PagingError(result)
+        rows = (result.data or {}).get("rows") or {}
+        new_rows = [(index, row) for index, row in rows.items() if index not in self._previous]
+        if self.fallback or len(rows) < self.page_size:
+            self.done = True
+        elif not new_rows:
+            # The first page was returned again, so only its rows were yielded so far.
+            warnings.warn(f"Switch ignored the {CURSOR_PARAM} paging cursor; reading up to {FALLBACK_LIMIT} rows "
+                          "in a single request instead", RuntimeWarning, stacklevel=3)
+            self.fallback = True
+            self.cursor = None
+        else:
+            self.cursor = next(reversed(list(rows)))
+            self._previous = set(rows)
+        return new_rows
+
+
+def iter_mib_rows(client, params: Mapping, page_size: int = 200) -> Iterator[Row]:
+    """
+    Iterate over every row of a MIB table query, one page at a time.
+
+    Only one page is held in memory, so arbitrarily large tables (MAC tables,
+    virtual chassis port tables) can be streamed.
+
+    Args:
+        client: An `AosApiClient`.
+        params: A `MibQuery`, or MIB query parameters (domain, urn, mibObjects,
+            filters); any ``limit`` is replaced by `page_size`.
+        page_size: Number of rows requested per page.
+
+    Yields:
+        (index, row) pairs, where index is the row index returned by the switch.
+
+    Raises:
+        PagingError: If a page cannot be read.
+    """
+    pager = _Pager(params, page_size)
+    while not pager.done:
+        yield from pager.rows(client.get("/", params=pager.next_params()))
+
+
+async def aiter_mib_rows(client, params: Mapping, page_size: int = 200) -> AsyncIterator[Row]:
+    """
+    Async version of `iter_mib_rows` for an `AsyncAosApiClient`.
+    """
+    pager = _Pager(params, page_size)
+    while not pager.done:
+        for row in pager.rows(await client.get("/", params=pager.next_params())):
+            yield row
@@ -0,0 +1,186 @@
+import re
+from typing import FrozenSet, Iterable, Iterator, List, Optional, Tuple, Union
+
+from aos8_api.ifindex import CHASSIS_STRIDE, MAX_CHASSIS, SLOT_STRIDE, port_to_ifindex
+
+# (chassis, slot, port) of a physical port; (0, 0, id) of a link aggregate.
+_Port = Tuple[int, int, int]
+
+# Separators between the tokens of a port list.
+_SEPARATORS = re.compile(r"[,\s]+")
+
+
+def _parse_port(text: str) -> _Port:
+    """Parse one port identifier ("c/s/p", "s/p" or "0/<linkagg id>")."""
+    try:
+        parts = [int(part) for part in text.split("/")]
+    except ValueError:
+        raise ValueError(f"Invalid port identifier: {text!r}") from None
+    if len(parts) == 2 and parts[0] == 0:
+        port = (0, 0, parts[1])
+    elif len(parts) == 2:
+        port = (1, parts[0], parts[1])
+    elif len(parts) == 3:
+        port = (parts[0], parts[1], parts[2])
+    else:
+        raise ValueError(f"Invalid port identifier: {text!r}")
+    chassis, slot, number = port
+    valid_chassis = chassis == 0 or (1 <= chassis <= MAX_CHASSIS and 1 <= slot < CHASSIS_STRIDE // SLOT_STRIDE)
+    if not (valid_chassis and 1 <= number < SLOT_STRIDE):
+        raise ValueError(f"Invalid port identifier: {text!r}")
+    return port
+
+
+def _parse_token(token: str) -> Iterator[_Port]:
+    """Yield the ports of one token: a port, "c/s/a-b" or "c/s/a-c/s/b"."""
+    first, _, last = token.partition("-")
+    start = _parse_port(first)
+    if not last:
+        yield start
+        return
+    end = _parse_port(last) if "/" in last else _parse_port("/".join([*first.split("/")[:-1], last]))
+    if end[:2] != start[:2]:
+        raise ValueError(f"Port range {token!r} must stay within one slot; list each slot's range instead")
+    if end[2] < start[2]:
+        raise ValueError(f"Port range {token!r} ends before it starts")
+    for number in range(start[2], end[2] + 1):
+        yield start[0], start[1], number
+
+
+def _format(port: _Port) -> str:
+    chassis, slot, number = port
+    return f"0/{number}" if chassis == 0 else f"{chassis}/{slot}/{number}"
+
+
+PortsLike = Union[str, Iterable[str], "PortSet"]
+
+
+class PortSet:
+    """
+    Immutable set of AOS8 ports.
+
+    A port set is built from a port list as written on the CLI, e.g.
+    ``"1/1/1-24,1/2/1-4 2/1/5"``: tokens are separated by commas or spaces,
+    and each token is a port ("1/1/5"), a range within one slot ("1/1/1-24"
+    or "1/1/1-1/1/24"), a port of a standalone switch ("1/5", chassis 1) or a
+    link aggregate ("0/3", "0/1-4"). An iterable of such lists is accepted too.
+
+    Port sets support the set operators ``|``, ``&``, ``-`` and ``^``, iterate
+    over their ports in chassis/slot/port order and are compressed back into
+    the fewest CLI range tokens with `ranges`.
+
+    Example:
+        ports = PortSet("1/1/1-24") - PortSet("1/1/10,1/1/11")
+        ports.ranges()     # ["1/1/1-9", "1/1/12-24"]
+        ports.ifindexes()  # ["1001", ..., "1024"]
+    """
+
+    __slots__ = ("_ports",)
+
+    def __init__(self, ports: Optional[PortsLike] = None):
+        """
+        Args:
+            ports: Port list, iterable of port lists, or another `PortSet`; empty if None.
+
+        Raises:
+            ValueError: If a port or range is invalid, or a range spans several slots.
+        """
+        if isinstance(ports, PortSet):
+            self._ports: FrozenSet[_Port] = ports._ports
+            return
+        if ports is None:
+            items: Iterable[str] = ()
+        elif isinstance(ports, str):
+            items = (ports,)
+        else:
+            items = ports
+        self._ports = frozenset(
+            port for item in items for token in _SEPARATORS.split(item.strip()) if token
+            for port in _parse_token(token)
+        )
+
+    @classmethod
+    def _of(cls, ports: FrozenSet[_Port]) -> "PortSet":
+        port_set = cls.__new__(cls)
+        port_set._ports = ports
+        return port_set
+
+    def __iter__(self) -> Iterator[str]:
+        return (_format(port) for port in sorted(self._ports))
+
+    def __len__(self) -> int:
+        return len(self._ports)
+
+    def __contains__(self, port) -> bool:
+        try:
+            return _parse_port(str(port)) in self._ports
+        except ValueError:
+            return False
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, PortSet):
+            return self._ports == other._ports
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self._ports)
+
+    def __str__(self) -> str:
+        return ",".join(self.ranges())
+
+    def __repr__(self) -> str:
+        return f"PortSet({str(self)!r})"
+
+    def union(self, other: PortsLike) -> "PortSet":
+        """
+        Return the ports in this set or in `other`.
+        """
+        return self._of(self._ports | PortSet(other)._ports)
+
+    def intersection(self, other: PortsLike) -> "PortSet":
+        """
+        Return the ports in both this set and `other`.
+        """
+        return self._of(self._ports & PortSet(other)._ports)
+
+    def difference(self, other: PortsLike) -> "PortSet":
+        """
+        Return the ports in this set but not in `other`.
+        """
+        return self._of(self._ports - PortSet(other)._ports)
+
+    def symmetric_difference(self, other: PortsLike) -> "PortSet":
+        """
+        Return the ports in exactly one of this set and `other`.
+        """
+        return self._of(self._ports ^ PortSet(other)._ports)
+
+    __or__ = union
+    __and__ = intersection
+    __sub__ = difference
+    __xor__ = symmetric_difference
+
+    def ranges(self) -> List[str]:
+        """
+        Compress the set into the fewest CLI port tokens.
+
+        Consecutive ports of one slot become one "c/s/a-b" range, e.g.
+        ["1/1/1-24", "1/2/1-4", "2/1/5"].
+
+        Returns:
+            List[str]: Port and range tokens, in chassis/slot/port order.
+        """
+        runs: List[List[_Port]] = []
+        for port in sorted(self._ports):
+            last = runs[-1][-1] if runs else None
+            if last is not None and last[:2] == port[:2] and last[2] + 1 == port[2]:
+                runs[-1].append(port)
+            else:
+                runs.append([port])
+        return [_format(run[0]) if len(run) == 1 else f"{_format(run[0])}-{run[-1][2]}" for run in runs]
+
+    def ifindexes(self) -> List[str]:
+        """
+        Return the ifIndex of each port, in chassis/slot/port order (see `port_to_ifindex`).
+        """
+        return [port_to_ifindex(port) for port in self]
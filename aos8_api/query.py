@@ -0,0 +1,207 @@
+import threading
+from collections.abc import Mapping
+from typing import Dict, Hashable, Iterable, Iterator, Optional, Sequence, Tuple
+
+import httpx
+
+
+def _freeze(value) -> Hashable:
+    """Return a hashable equivalent of a MibQuery constructor argument."""
+    if isinstance(value, dict):
+        return tuple((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(value)
+    return value
+
+
+class MibQuery(Mapping):
+    """
+    Declarative, reusable read of one or more MIB tables.
+
+    A query describes the table (urn), the objects to return, the webview
+    transform functions applied to them, an optional filter and the row limit.
+    Its parameters and query string are built once, when the query is
+    created, so endpoints keep their queries as class constants. Variants
+    with another limit, filter value or column selection are derived with
+    `replace` and `select` and memoized on the query they were derived from.
+
+    A query is a read-only mapping of its request parameters and is passed as
+    ``params`` to the clients' ``get``, which then sends the pre-encoded query
+    string. Its `key` identifies the query for coalescing and caching.
+
+    Example:
+        TEMPERATURE = MibQuery(
+            "chasEntTemperatureTable",
+            columns=["chasEntTempCurrent", "chasEntTempThreshold"],
+            function="chassisSlotWithType_entPhysicalIndex",
+            object="index",
+        )
+        client.get("/", params=TEMPERATURE.replace(limit=50).select(["chasEntTempCurrent"]))
+    """
+
+    # Number of derived queries memoized per query.
+    MAX_VARIANTS = 32
+
+    def __init__(self, urn: str, columns: Sequence[str] = (), table_columns: Optional[Dict[str, Sequence[str]]] = None,
+                 joins: Optional[Dict[str, Sequence[str]]] = None, function: Optional[str] = None,
+                 object: Optional[str] = None, filter_object: Optional[str] = None, filter_operation: str = "==",
+                 filter_value=None, limit=None, ignore_error: bool = False, extra: Optional[Dict[str, str]] = None,
+                 domain: str = "mib"):
+        """
+        Args:
+            urn: MIB table, or several tables joined with "|".
+            columns: Objects to return (``mibObjectN``).
+            table_columns: Objects to return per table of a multi-table read (``<table>-mibObjectN``).
+            joins: Objects of other tables joined on a key, keyed by "<table>-<key>" (``<table>-<key>-N``).
+            function: Webview transform functions, joined with "|".
+            object: Arguments of the transform functions, joined with "|".
+            filter_object: Object the rows are filtered on, or None for no filter.
+            filter_operation: Filter comparison, e.g. "==".
+            filter_value: Value the filter object is compared with.
+            limit: Maximum number of rows, or None for the switch default.
+            ignore_error: Whether the switch should skip rows it cannot read.
+            extra: Additional request parameters.
+            domain: Request domain, e.g. "sqliteQuery" for the switch's own tables.
+        """
+        self.urn = urn
+        self.columns = tuple(columns)
+        self.table_columns = {table: tuple(objects) for table, objects in (table_columns or {}).items()}
+        self.joins = {join: tuple(objects) for join, objects in (joins or {}).items()}
+        self.function = function
+        self.object = object
+        self.filter_object = filter_object
+        self.filter_operation = filter_operation
+        self.filter_value = filter_value
+        self.limit = limit
+        self.ignore_error = ignore_error
+        self.extra = dict(extra or {})
+        self.domain = domain
+
+        params = {"domain": domain, "urn": urn}
+        for table, objects in self.table_columns.items():
+            for i, obj in enumerate(objects):
+                params[f"{table}-mibObject{i}"] = obj
+        for i, obj in enumerate(self.columns):
+            params[f"mibObject{i}"] = obj
+        for join, objects in self.joins.items():
+            for i, obj in enumerate(objects):
+                params[f"{join}-{i}"] = obj
+        if function is not None:
+            params["function"] = function
+            params["object"] = object or ""
+        if filter_object is not None:
+            params["filterObject"] = filter_object
+            params["filterOperation"] = filter_operation
+            params["filterValue"] = str(filter_value)
+        if limit is not None:
+            params["limit"] = str(limit)
+        if ignore_error:
+            params["ignoreError"] = "true"
+        params.update(self.extra)
+
+        query = httpx.QueryParams(params)
+        self._params = params
+        self.encoded = str(query)
+        self.key: Hashable = tuple(sorted(query.multi_items()))
+        self.urns: Tuple[str, ...] = tuple(urn.split("|"))
+        self._variants: Dict[Hashable, "MibQuery"] = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, name: str) -> str:
+        return self._params[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._params)
+
+    def __len__(self) -> int:
+        return len(self._params)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, MibQuery):
+            return self.key == other.key
+        return super().__eq__(other)
+
+    def __hash__(self) -> int:
+        return hash(self.key)
+
+    def __repr__(self) -> str:
+        return f"MibQuery({self.encoded})"
+
+    def url(self, path: str = "/") -> str:
+        """
+        Return `path` with the pre-encoded query string appended.
+        """
+        return f"{path}?{self.encoded}"
+
+    def _spec(self) -> dict:
+        return {
+            "urn": self.urn, "columns": self.columns, "table_columns": self.table_columns, "joins": self.joins,
+            "function": self.function, "object": self.object, "filter_object": self.filter_object,
+            "filter_operation": self.filter_operation, "filter_value": self.filter_value, "limit": self.limit,
+            "ignore_error": self.ignore_error, "extra": self.extra, "domain": self.domain,
+        }
+
+    def _variant(self, key: Hashable, build) -> "MibQuery":
+        variant = self._variants.get(key)
+        if variant is None:
+            variant = build()
+            with self._lock:
+                if len(self._variants) >= self.MAX_VARIANTS:
+                    self._variants.clear()
+                self._variants[key] = variant
+        return variant
+
+    def replace(self, **changes) -> "MibQuery":
+        """
+        Return a copy of the query with some of its constructor arguments changed.
+
+        Copies are memoized, except those changing `extra` (e.g. paging cursors),
+        so asking again for the same variant returns the already encoded query.
+
+        Args:
+            **changes: Constructor arguments to change, e.g. ``limit=50``.
+
+        Returns:
+            MibQuery: The changed query, or this query if nothing changes.
+        """
+        if "extra" in changes:
+            return MibQuery(**{**self._spec(), **changes})
+        key = tuple(sorted((name, _freeze(value)) for name, value in changes.items()))
+        variant = self._variants.get(key)
+        if variant is not None:
+            return variant
+        spec = self._spec()
+        if all(_freeze(spec[name]) == value for name, value in key):
+            return self
+        return self._variant(key, lambda: MibQuery(**{**spec, **changes}))
+
+    def select(self, columns: Optional[Iterable[str]]) -> "MibQuery":
+        """
+        Restrict the query to the given columns.
+
+        The query keeps only the requested objects, plus the objects its
+        transform functions and filter need. Objects that are not part of the
+        query are added to its own table's columns. Join objects are unchanged.
+
+        Args:
+            columns: MIB objects to return, or None to keep the query unchanged.
+
+        Returns:
+            MibQuery: The projected query.
+        """
+        if columns is None:
+            return self
+        wanted = tuple(columns)
+
+        def build():
+            needed = set(wanted)
+            needed.update((self.object or "").replace(",", "|").split("|"))
+            needed.add(self.filter_object)
+            kept = [obj for obj in self.columns if obj in needed]
+            known = set(self.columns).union(*self.table_columns.values())
+            kept += [obj for obj in wanted if obj not in known]
+            table_columns = {table: [obj for obj in objects if obj in needed]
+                             for table, objects in self.table_columns.items()}
+            return MibQuery(**{**self._spec(), "columns": kept, "table_columns": table_columns})
+
+        return self._variant(("select", wanted), build)
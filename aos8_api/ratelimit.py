@@ -0,0 +1,166 @@
+import asyncio
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+
+@dataclass
+class RateLimitStats:
+    """
+    Counters of one rate budget.
+
+    Attributes:
+        requests (int): Requests that went through the budget.
+        delayed (int): Requests that had to wait for a token or an in-flight slot.
+        wait_time (float): Total seconds spent waiting.
+        max_wait (float): Longest single wait in seconds.
+    """
+    requests: int = 0
+    delayed: int = 0
+    wait_time: float = 0.0
+    max_wait: float = 0.0
+
+
+class RateBudget:
+    """
+    Token bucket plus in-flight limit for one class of requests to one switch.
+
+    Up to `burst` requests may start back to back; after that requests start at
+    `rate` per second. At most `max_in_flight` requests run at the same time.
+    Either limit can be left as None to disable it.
+    """
+
+    def __init__(self, rate: Optional[float] = None, burst: Optional[int] = None, max_in_flight: Optional[int] = None):
+        """
+        Args:
+            rate: Sustained requests per second, or None for no rate limit.
+            burst: Bucket size; defaults to one second worth of requests (at least 1).
+            max_in_flight: Maximum concurrent requests, or None for no limit.
+        """
+        if rate is not None and rate <= 0:
+            raise ValueError("rate must be positive")
+        if max_in_flight is not None and max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1, int(rate or 1))
+        self.max_in_flight = max_in_flight
+        self.stats = RateLimitStats()
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_in_flight) if max_in_flight else None
+        self._async_slots: Optional[asyncio.Semaphore] = None
+
+    def _reserve(self) -> float:
+        """
+        Take a token and return how long to wait before it becomes valid.
+
+        The bucket may go into debt, so concurrent callers queue up in order.
+        """
+        if self.rate is None:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+    def _record(self, waited: float):
+        with self._lock:
+            self.stats.requests += 1
+            if waited > 0.001:
+                self.stats.delayed += 1
+                self.stats.wait_time += waited
+                self.stats.max_wait = max(self.stats.max_wait, waited)
+
+    @contextmanager
+    def acquire(self):
+        """
+        Block until a request may start, and hold an in-flight slot while it runs.
+        """
+        start = time.monotonic()
+        if self._slots is not None:
+            self._slots.acquire()
+        try:
+            delay = self._reserve()
+            if delay > 0:
+                time.sleep(delay)
+            self._record(time.monotonic() - start)
+            yield
+        finally:
+            if self._slots is not None:
+                self._slots.release()
+
+    @asynccontextmanager
+    async def acquire_async(self):
+        """
+        Async version of `acquire`.
+
+        In-flight slots of asyncio callers are counted separately from threads.
+        """
+        if self._async_slots is None and self.max_in_flight:
+            self._async_slots = asyncio.Semaphore(self.max_in_flight)
+        start = time.monotonic()
+        if self._async_slots is not None:
+            await self._async_slots.acquire()
+        try:
+            delay = self._reserve()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._record(time.monotonic() - start)
+            yield
+        finally:
+            if self._async_slots is not None:
+                self._async_slots.release()
+
+
+class RateLimiter:
+    """
+    Per-switch limiter protecting the management CPU of an OmniSwitch.
+
+    MIB requests and ``/cli/aos`` commands are limited by separate budgets, since
+    CLI commands are much more expensive for the switch. Every request also
+    updates the budget's `RateLimitStats`, available through `stats()`.
+
+    Example:
+        limiter = RateLimiter(
+            mib=RateBudget(rate=10, max_in_flight=4),
+            cli=RateBudget(rate=1, max_in_flight=1),
+        )
+    """
+
+    def __init__(self, mib: Optional[RateBudget] = None, cli: Optional[RateBudget] = None):
+        """
+        Args:
+            mib: Budget for MIB domain requests; unlimited if None.
+            cli: Budget for ``/cli/aos`` requests; unlimited if None.
+        """
+        self.mib = mib or RateBudget()
+        self.cli = cli or RateBudget()
+
+    def budget(self, path: str) -> RateBudget:
+        """
+        Return the budget that applies to a request path.
+        """
+        return self.cli if path.startswith("/cli/aos") else self.mib
+
+    def limit(self, path: str):
+        """
+        Context manager holding a request to `path` until its budget allows it.
+        """
+        return self.budget(path).acquire()
+
+    def limit_async(self, path: str):
+        """
+        Async context manager version of `limit`.
+        """
+        return self.budget(path).acquire_async()
+
+    def stats(self) -> Dict[str, RateLimitStats]:
+        """
+        Return the counters of each budget, keyed by "mib" and "cli".
+        """
+        return {"mib": self.mib.stats, "cli": self.cli.stats}
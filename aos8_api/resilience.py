@@ -0,0 +1,173 @@
+import random
+import threading
+import time
+from typing import Iterable, Optional
+
+import httpx
+
+
+class CircuitOpenError(httpx.TransportError):
+    """
+    Raised instead of sending a request to a switch whose circuit breaker is open.
+
+    It derives from `httpx.TransportError` so code that already handles an
+    unreachable switch handles a known-down switch the same way.
+    """
+
+
+class RetryPolicy:
+    """
+    Decide which failed requests are retried and how long to wait in between.
+
+    A request is retried when it raised a transport error (connection failure,
+    timeout, ...) or returned one of `statuses`, as long as its method is listed
+    in `methods` and fewer than `attempts` attempts were made. By default only
+    GET requests, which are idempotent on AOS, are retried. CLI commands other
+    than ``show`` are sent with GET too but may change the configuration; a
+    command that timed out may already have been applied, so they are not
+    retried unless `cli_commands` is set.
+
+    Delays grow exponentially from `backoff` up to `max_backoff` and use "full
+    jitter" (a random delay between zero and the exponential bound), so clients
+    that failed together do not retry together.
+    """
+
+    def __init__(self, attempts: int = 3, backoff: float = 0.5, max_backoff: float = 8.0,
+                 methods: Iterable[str] = ("GET",), statuses: Iterable[int] = (502, 503, 504),
+                 cli_commands: bool = False):
+        """
+        Args:
+            attempts: Maximum number of attempts per request, including the first one.
+            backoff: Upper bound of the first delay in seconds.
+            max_backoff: Upper bound of any delay in seconds.
+            methods: HTTP methods that may be retried.
+            statuses: HTTP status codes that are retried.
+            cli_commands: Whether CLI commands other than ``show`` may be retried.
+        """
+        if attempts < 1:
+            raise ValueError("attempts must be at least 1")
+        self.attempts = attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.methods = frozenset(m.upper() for m in methods)
+        self.statuses = frozenset(statuses)
+        self.cli_commands = cli_commands
+
+    def should_retry(self, method: str, attempt: int, status: Optional[int] = None, path: str = "",
+                     params=None) -> bool:
+        """
+        Return whether a failed attempt should be retried.
+
+        Args:
+            method: HTTP method of the request.
+            attempt: Number of attempts made so far.
+            status: Response status code, or None if the attempt raised a transport error.
+            path: Request path, e.g. "/cli/aos?cmd=show+vlan".
+            params: Query parameters sent with `path`.
+        """
+        if attempt >= self.attempts or method.upper() not in self.methods:
+            return False
+        if not self.cli_commands and self._is_cli_change(path, params):
+            return False
+        return status is None or status in self.statuses
+
+    @staticmethod
+    def _is_cli_change(path: str, params=None) -> bool:
+        """Return True for a CLI command other than ``show``."""
+        if not path.startswith("/cli/"):
+            return False
+        command = httpx.URL(path).params.merge(httpx.QueryParams(params)).get("cmd", "")
+        return not command.strip().lower().startswith("show")
+
+    def delay(self, attempt: int) -> float:
+        """
+        Return the number of seconds to wait before the next attempt.
+
+        Args:
+            attempt: Number of attempts made so far.
+        """
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** (attempt - 1)))
+
+
+class CircuitBreaker:
+    """
+    Fail fast while a switch is known to be down.
+
+    The breaker opens after `failure_threshold` consecutive transport errors.
+    While open, requests raise `CircuitOpenError` without touching the network.
+    After `reset_timeout` seconds a single probe request is let through
+    (half-open): if it succeeds the breaker closes, otherwise it opens again.
+
+    One breaker guards one switch. Clients talking to the same base URL may
+    share a breaker instance.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """
+        Args:
+            failure_threshold: Consecutive transport errors that open the breaker.
+            reset_timeout: Seconds to wait in the open state before probing the switch.
+        """
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """
+        Return whether a request may be sent now.
+
+        In the open state, the first call after `reset_timeout` moves the breaker
+        to half-open and is allowed as the probe; other calls are refused until
+        the probe completes.
+        """
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                return True
+            return False
+
+    def check(self, base_url: str):
+        """
+        Raise `CircuitOpenError` unless a request to `base_url` may be sent now.
+        """
+        if not self.allow():
+            raise CircuitOpenError(f"Circuit breaker open for {base_url}, not sending request")
+
+    def record_success(self):
+        """
+        Record a response from the switch, whatever its status code.
+        """
+        with self._lock:
+            self.failures = 0
+            self.state = self.CLOSED
+
+    def record_failure(self):
+        """
+        Record a transport error.
+        """
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+
+    def record_abandoned(self):
+        """
+        Record a request that ended without a verdict, e.g. because it was cancelled.
+
+        An abandoned probe puts the breaker back to open so the next caller probes instead.
+        """
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                self.state = self.OPEN
@@ -0,0 +1,245 @@
+import json
+import os
+from abc import ABC, abstractmethod
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+
+import httpx
+
+SESSION_COOKIE = "wv_sess"
+
+
+class SessionStore(ABC):
+    """
+    Base class for persistent stores of AOS web sessions.
+
+    A store keeps one record per (base_url, username) pair so that a new client
+    can reuse the ``wv_sess`` cookie of a previous process instead of logging in.
+    Records are plain dictionaries with the keys ``cookie``, ``domain``, ``path``,
+    ``login_time``, ``last_used`` and ``lifetime``.
+
+    Subclasses must implement `load`, `save` and `delete`.
+    """
+
+    @abstractmethod
+    def load(self, base_url: str, username: str) -> Optional[Dict]:
+        """
+        Return the stored session record, or None if there is none.
+        """
+
+    @abstractmethod
+    def save(self, base_url: str, username: str, record: Dict):
+        """
+        Store or replace the session record.
+        """
+
+    @abstractmethod
+    def delete(self, base_url: str, username: str):
+        """
+        Remove the session record if present.
+        """
+
+
+class FileSessionStore(SessionStore):
+    """
+    Session store backed by a single JSON file.
+
+    The file is rewritten atomically on every change, which suits the small
+    number of switches a cron job or CLI invocation talks to.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: Location of the JSON file. It is created on first save.
+        """
+        self.path = os.path.expanduser(path)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(base_url: str, username: str) -> str:
+        return f"{username}@{base_url}"
+
+    def _read(self) -> Dict[str, Dict]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def _write(self, records: Dict[str, Dict]):
+        tmp = f"{self.path}.tmp"
+        # Session cookies grant switch access, keep the file private to the user.
+        with open(os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "w", encoding="utf-8") as f:
+            json.dump(records, f)
+        os.replace(tmp, self.path)
+
+    def load(self, base_url: str, username: str) -> Optional[Dict]:
+        with self._lock:
+            return self._read().get(self._key(base_url, username))
+
+    def save(self, base_url: str, username: str, record: Dict):
+        with self._lock:
+            records = self._read()
+            records[self._key(base_url, username)] = record
+            self._write(records)
+
+    def delete(self, base_url: str, username: str):
+        with self._lock:
+            records = self._read()
+            if records.pop(self._key(base_url, username), None) is not None:
+                self._write(records)
+
+
+class SqliteSessionStore(SessionStore):
+    """
+    Session store backed by a SQLite database.
+
+    Suited to large fleets or several processes sharing one cache.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: Location of the SQLite database. It is created if missing.
+        """
+        self.path = os.path.expanduser(path)
+        self._lock = threading.Lock()
+        with self._connect() as db:
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS aos_sessions ("
+                "base_url TEXT NOT NULL, username TEXT NOT NULL, record TEXT NOT NULL, "
+                "PRIMARY KEY (base_url, username))"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=10)
+
+    def load(self, base_url: str, username: str) -> Optional[Dict]:
+        with self._lock, self._connect() as db:
+            row = db.execute(
+                "SELECT record FROM aos_sessions WHERE base_url = ? AND username = ?",
+                (base_url, username),
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def save(self, base_url: str, username: str, record: Dict):
+        with self._lock, self._connect() as db:
+            db.execute(
+                "INSERT OR REPLACE INTO aos_sessions (base_url, username, record) VALUES (?, ?, ?)",
+                (base_url, username, json.dumps(record)),
+            )
+
+    def delete(self, base_url: str, username: str):
+        with self._lock, self._connect() as db:
+            db.execute(
+                "DELETE FROM aos_sessions WHERE base_url = ? AND username = ?",
+                (base_url, username),
+            )
+
+
+class SessionTracker:
+    """
+    Track the lifetime of a client's web session and persist it to a store.
+
+    The tracker records when the session was created and last used. When a
+    request is rejected with 401, the idle time since the last successful
+    request is an upper bound of the session lifetime: the lifetime learned is
+    the smallest such bound seen, never more than `DEFAULT_LIFETIME` nor less
+    than `MIN_LIFETIME`. Later runs use it to tell whether a cached cookie is
+    still worth trying.
+
+    While requests succeed, the last use is saved to the store at most every
+    `SAVE_INTERVAL` seconds, so a process that exits without closing its
+    client leaves a recent timestamp behind.
+    """
+
+    # Session timeout assumed until a shorter one is observed.
+    DEFAULT_LIFETIME = 240.0
+    MIN_LIFETIME = 30.0
+    SAVE_INTERVAL = 60.0
+
+    def __init__(self, base_url: str, username: str, store: Optional[SessionStore] = None):
+        self.base_url = base_url
+        self.username = username
+        self.store = store
+        self.login_time: Optional[float] = None
+        self.last_used: Optional[float] = None
+        self.lifetime: Optional[float] = None
+        self._saved_at = 0.0
+
+    @classmethod
+    def _bounded(cls, lifetime: float) -> float:
+        return min(max(lifetime, cls.MIN_LIFETIME), cls.DEFAULT_LIFETIME)
+
+    def restore(self, cookies: httpx.Cookies) -> bool:
+        """
+        Load a cached session cookie into `cookies`.
+
+        Returns:
+            True if a cookie that is not known to be expired was restored.
+        """
+        if self.store is None:
+            return False
+        record = self.store.load(self.base_url, self.username)
+        if not record:
+            return False
+
+        lifetime = record.get("lifetime")
+        self.lifetime = self._bounded(lifetime) if lifetime is not None else None
+        last_used = record.get("last_used") or record.get("login_time")
+        if last_used is None or time.time() - last_used >= (self.lifetime or self.DEFAULT_LIFETIME):
+            return False
+
+        cookies.set(SESSION_COOKIE, record["cookie"], domain=record.get("domain", ""), path=record.get("path", "/"))
+        self.login_time = record.get("login_time")
+        self.last_used = last_used
+        return True
+
+    def logged_in(self, cookies: httpx.Cookies):
+        """
+        Record a fresh login and persist its cookie.
+        """
+        self.login_time = self.last_used = time.time()
+        self.save(cookies)
+
+    def used(self, cookies: Optional[httpx.Cookies] = None):
+        """
+        Record a successful request on the current session.
+
+        Args:
+            cookies: The client's cookies; when given, the session is saved if
+                it was last saved more than `SAVE_INTERVAL` seconds ago.
+        """
+        self.last_used = time.time()
+        if cookies is not None and self.store is not None and self.last_used - self._saved_at >= self.SAVE_INTERVAL:
+            self.save(cookies)
+
+    def expired(self):
+        """
+        Record that the server rejected the current session.
+        """
+        if self.last_used is not None:
+            idle = self._bounded(time.time() - self.last_used)
+            self.lifetime = idle if self.lifetime is None else min(self.lifetime, idle)
+
+    def save(self, cookies: httpx.Cookies):
+        """
+        Persist the current session cookie and timings, if a store is configured.
+        """
+        if self.store is None:
+            return
+        cookie = next((c for c in cookies.jar if c.name == SESSION_COOKIE), None)
+        if cookie is None:
+            return
+        self._saved_at = time.time()
+        self.store.save(self.base_url, self.username, {
+            "cookie": cookie.value,
+            "domain": cookie.domain,
+            "path": cookie.path,
+            "login_time": self.login_time,
+            "last_used": self.last_used,
+            "lifetime": self.lifetime,
+        })
@@ -0,0 +1,146 @@
+"""
+Benchmark of the CLI output parsers in `aos8_api.helper`.
+
+Each parser is run on a large synthetic output (e.g. 400-port
+``show interfaces status``) and the best time per call is reported.
+
+Usage:
+    python benchmarks/bench_parsers.py [--ports 400] [--repeat 5] [--output bench_output.txt]
+"""
+import argparse
+import os
+import sys
+import timeit
+
+# Run from a checkout: make the repository root importable.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aos8_api import helper
+
+
+def interfaces_status(ports: int) -> str:
+    lines = [
+        " Chas/       Admin   Auto    Detected Speed (Mbps)   Configured Speed (Mbps)   Trap  EEE",
+        " Slot/Port   Status  Nego    Speed Duplex Pause FEC  Speed Duplex Pause FEC    Link  ",
+        "-----------+--------+------+------+------+------+----+------+------+------+----+-----+----",
+    ]
+    for i in range(ports):
+        port = f"1/{i // 48 + 1}/{i % 48 + 1}"
+        lines.append(f" {port:<10}  en      en      1000    Full    -       DIS     Auto    Auto    -       DIS    dis    dis")
+    return "\n".join(lines)
+
+
+def interface_detail(ports: int) -> str:
+    blocks = []
+    for i in range(ports):
+        port = f"1/{i // 48 + 1}/{i % 48 + 1}"
+        blocks.append(f"""Chassis/Slot/Port  : {port}
+ Operational Status     : up,
+ Last Time Link Changed : Mon Jan  6 10:00:00 2025,
+ Number of Status Change: 3,
+ Type                   : Ethernet,
+ SFP/XFP                : N/A,
+ EPP                    : Disabled,
+ Link-Quality           : N/A,
+ MAC address            : 2c:fa:a2:00:00:{i % 256:02x},
+ BandWidth (Megabits)   :     1000,            Duplex           : Full,
+ Autonegotiation        :   1  [ 1000-F 100-F 100-H 10-F 10-H ],
+ Long Frame Size(Bytes) : 9216,                Runt Size(Bytes) : 64,
+ Rx              :
+  Bytes Received  :            {i * 1000}, Unicast Frames :              {i},
+  Broadcast Frames:                     0, M-cast Frames  :                     0,
+  UnderSize Frames:                     0, OverSize Frames:                     0,
+ Tx              :
+  Bytes Xmitted   :            {i * 2000}, Unicast Frames :              {i},
+  Broadcast Frames:                     0, M-cast Frames  :                     0,
+""")
+    return "".join(blocks)
+
+
+def counters(ports: int) -> str:
+    lines = []
+    for i in range(ports):
+        lines.append(f"{1}/{i // 48 + 1}/{i % 48 + 1},")
+        lines.append(f"  InOctets      =        {i * 1000}, OutOctets      =        {i * 2000},")
+        lines.append(f"  InUcastPkts   =        {i}, OutUcastPkts   =        {i},")
+        lines.append("  InMcastPkts   =        0, OutMcastPkts   =        0,")
+        lines.append("  InBcastPkts   =        0, OutBcastPkts   =        0,")
+        lines.append("  InPauseFrames =        0, OutPauseFrames =        0,")
+    return "\n".join(lines)
+
+
+def counters_errors(ports: int) -> str:
+    lines = []
+    for i in range(ports):
+        lines.append(f"{1}/{i // 48 + 1}/{i % 48 + 1},")
+        lines.append("  IfInErrors    =        0, Undersize      =        0,")
+        lines.append("  Oversize      =        0, IfInErrorRate  =   1.5e-3,")
+    return "\n".join(lines)
+
+
+def violations(ports: int) -> str:
+    lines = [
+        "Port      Source    Action          Reason          WTR   Time        Max/Remain",
+        "--------+---------+---------------+---------------+-----+-----------+----------",
+    ]
+    for i in range(ports):
+        port = f"1/{i // 48 + 1}/{i % 48 + 1}"
+        lines.append(f"{port:<9} AG         admin down          lps shutdown    0     300         10/1")
+    return "\n".join(lines)
+
+
+def output_table(rows: int) -> str:
+    lines = [
+        " vlan    type   admin   oper    ip    mtu          name",
+        "------+-------+-------+------+------+------+------------------",
+    ]
+    for i in range(rows):
+        lines.append(f" {i + 1:<6}  std    Ena     Ena     Dis   1500    VLAN {i + 1}")
+    return "\n".join(lines)
+
+
+def ip_interfaces(rows: int) -> str:
+    lines = [
+        f"Total {rows} interfaces",
+        " Name                 IP Address      Subnet Mask     Status Forward  Device",
+        "--------------------+---------------+---------------+------+-------+---------",
+    ]
+    for i in range(rows):
+        address = f"10.{i // 250}.{i % 250}.1"
+        lines.append(f"{'vlan ' + str(i + 1):<21}{address:<16}255.255.255.0       UP      NO vlan {i + 1}")
+    return "\n".join(lines)
+
+
+CASES = [
+    ("parse_interface_status", helper.parse_interface_status, interfaces_status),
+    ("parse_interface_detail", helper.parse_interface_detail, interface_detail),
+    ("parse_interface_counters", helper.parse_interface_counters, counters),
+    ("parse_interface_counters_errors", helper.parse_interface_counters_errors, counters_errors),
+    ("parse_violation_output_to_json", helper.parse_violation_output_to_json, violations),
+    ("parse_output_json", helper.parse_output_json, output_table),
+    ("parse_ip_interface_output", helper.parse_ip_interface_output, ip_interfaces),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--ports", type=int, default=400, help="ports (rows) per synthetic output")
+    parser.add_argument("--repeat", type=int, default=5, help="timing runs per parser; the best is reported")
+    parser.add_argument("--output", help="also write the report to this file")
+    args = parser.parse_args()
+
+    report = [f"{'parser':<34} {'ms/call':>9}  ({args.ports} ports)"]
+    for name, parse, generate in CASES:
+        text = generate(args.ports)
+        number = max(1, 2000 // args.ports)
+        best = min(timeit.repeat(lambda: parse(text), number=number, repeat=args.repeat)) / number
+        report.append(f"{name:<34} {best * 1000:>9.3f}")
+
+    print("\n".join(report))
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write("\n".join(report) + "\n")
+
+
+if __name__ == "__main__":
+    main()
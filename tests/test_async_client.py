@@ -0,0 +1,153 @@
+import asyncio
+
+import httpx
+
+from aos8_api.AsyncApiClient import AsyncAosApiClient
+
+PORTS = {str(n): {"alaMvrpPortConfigIfIndex": str(1000 + n), "slotPort_ifindex_0": f"1\\/1\\/{n}"} for n in range(1, 5)}
+
+
+def detail(port: str) -> str:
+    return (f"Chassis/Slot/Port  : {port}\n"
+            " Operational Status     : up,\n"
+            " Type                   : Ethernet,\n")
+
+
+class FakeSwitch:
+    """In-memory switch answering the requests of an `AsyncAosApiClient`."""
+
+    def __init__(self):
+        self.cookie = "s1"
+        self.logins = 0
+        self.requests = []
+        self.vpa = {}
+        self.ip_interfaces = {}
+
+    def expire_session(self):
+        self.cookie = None
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path.startswith("/auth"):
+            self.logins += 1
+            self.cookie = f"s{self.logins}"
+            return httpx.Response(200, json={}, headers={"set-cookie": f"wv_sess={self.cookie}; Path=/"})
+        if self.cookie is None or request.headers.get("cookie") != f"wv_sess={self.cookie}":
+            return httpx.Response(401, json={})
+        self.requests.append((request.method, request.url.params.get("urn") or request.url.params.get("cmd")))
+        if request.url.path.startswith("/cli/"):
+            return self.cli(request.url.params["cmd"])
+        return self.mib(request)
+
+    def cli(self, cmd: str) -> httpx.Response:
+        output = ""
+        if cmd.startswith("show interfaces port "):
+            first, _, last = cmd.split()[3].rpartition("/")[2].partition("-")
+            ports = range(int(first), int(last or first) + 1)
+            output = "".join(detail(f"1/1/{port}") for port in ports)
+        return httpx.Response(200, json={"result": {"diag": 200, "output": output}})
+
+    def mib(self, request: httpx.Request) -> httpx.Response:
+        urn = request.url.params.get("urn")
+        if request.method == "POST":
+            form = dict(httpx.QueryParams(request.content.decode()))
+            if urn == "vpaTable":
+                ifindex = form["mibObject1"].split("|")[1]
+                if form.get("mibObject2") == "vpaStatus:6":
+                    self.vpa.pop(ifindex, None)
+                else:
+                    self.vpa[ifindex] = {"vpaIfIndex": ifindex, "vpaVlanNumber": form["mibObject0"].split("|")[1]}
+            elif urn == "alaIpItfConfigTable":
+                name = form["mibObject0-T1"].split(":", 1)[1]
+                ifindex = str(13600000 + len(self.ip_interfaces) + 1)
+                self.ip_interfaces[ifindex] = {"ifIndex": ifindex, "alaIpInterfaceName": name}
+            elif urn == "alaIpInterfaceTable":
+                ifindex = form["mibObject0"].split(":", 1)[1]
+                self.ip_interfaces[ifindex]["alaIpInterfaceAddress"] = form["mibObject1"].split(":", 1)[1]
+            return self.rows({})
+        if urn == "alaMvrpPortConfigTable":
+            return self.rows(PORTS)
+        if urn == "vpaTable":
+            return self.rows(self.vpa)
+        if urn == "alaIpInterfaceTable":
+            return self.rows(self.ip_interfaces)
+        return self.rows({})
+
+    @staticmethod
+    def rows(rows: dict) -> httpx.Response:
+        return httpx.Response(200, json={"result": {"diag": 200, "data": {"rows": dict(rows)}}})
+
+
+def run(switch: FakeSwitch, scenario):
+    async def main():
+        client = AsyncAosApiClient("admin", "switch", "https://switch.lab", lazy=True)
+        client._http = httpx.AsyncClient(base_url=client.base_url, transport=httpx.MockTransport(switch.handler))
+        async with client:
+            return await scenario(client)
+
+    return asyncio.run(main())
+
+
+def test_login_then_read():
+    switch = FakeSwitch()
+
+    async def scenario(client):
+        return await client.get("/?domain=mib&urn=vlanTable")
+
+    assert run(switch, scenario).success
+    assert switch.logins == 1
+
+
+def test_expired_session_logs_in_again():
+    switch = FakeSwitch()
+
+    async def scenario(client):
+        await client.get("/?domain=mib&urn=vlanTable")
+        switch.expire_session()
+        return await asyncio.gather(*(client.get(f"/?domain=mib&urn=vlanTable&limit={n}") for n in range(3)))
+
+    results = run(switch, scenario)
+    assert all(result.success for result in results)
+    assert switch.logins == 2
+    assert len(switch.requests) == 4
+
+
+def test_vpa_create_and_delete_read_back_the_vlan():
+    switch = FakeSwitch()
+
+    async def scenario(client):
+        created = await client.vpa.create("1/1/2", "10")
+        deleted = await client.vpa.delete("1/1/2", "10")
+        return created, deleted
+
+    created, deleted = run(switch, scenario)
+    assert created.success and deleted.success
+    assert list(created.data["rows"]) == ["1002"]
+    assert deleted.data["rows"] == {}
+    assert switch.requests[-4:] == [("POST", "vpaTable"), ("GET", "vpaTable"), ("POST", "vpaTable"), ("GET", "vpaTable")]
+
+
+def test_ip_create_writes_the_interface_found_by_name():
+    switch = FakeSwitch()
+
+    async def scenario(client):
+        return await client.ip.create_IP_Interface("int-10", "10.0.10.1", "255.255.255.0", vlan_id=10)
+
+    result = run(switch, scenario)
+    assert result.success
+    assert switch.ip_interfaces["13600001"]["alaIpInterfaceAddress"] == "10.0.10.1"
+    assert [row["alaIpInterfaceName"] for row in result.data["rows"].values()] == ["int-10"]
+
+
+def test_interface_setter_reads_back_each_port():
+    switch = FakeSwitch()
+
+    async def scenario(client):
+        return await client.interface.set_interface("1/1/1-3", "admin-state", "disable")
+
+    result = run(switch, scenario)
+    assert result.success
+    assert [port["Chassis/Slot/Port"] for port in result.output] == ["1/1/1", "1/1/2", "1/1/3"]
+    assert switch.requests == [
+        ("GET", "interfaces port 1/1/1-3 admin-state disable"),
+        ("GET", "show interfaces port 1/1/1-3"),
+    ]
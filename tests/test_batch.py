@@ -0,0 +1,85 @@
+import httpx
+
+from aos8_api.ApiClient import AosApiClient
+
+TABLE_SIZE = 5
+
+
+class MultiTableSwitch:
+    """Answers multi-urn reads with `TABLE_SIZE` rows per table holding the requested columns."""
+
+    def __init__(self, diag=200):
+        self.diag = diag
+        self.reads = []
+
+    def handler(self, request):
+        if request.url.path.startswith("/auth"):
+            return httpx.Response(200, json={}, headers={"set-cookie": "wv_sess=abc; Path=/"})
+        params = request.url.params
+        self.reads.append(params)
+        if self.diag != 200:
+            return httpx.Response(200, json={"result": {"diag": self.diag, "error": "Table not available"}})
+        limit = int(params.get("limit", TABLE_SIZE))
+        tables = {}
+        for urn in params["urn"].split("|"):
+            prefix = f"{urn}-mibObject" if f"{urn}-mibObject0" in params else "mibObject"
+            columns = [value for key, value in params.multi_items() if key.startswith(prefix)]
+            rows = {str(i): {column: f"{column}.{i}" for column in columns} for i in range(1, min(limit, TABLE_SIZE) + 1)}
+            tables[urn] = {"rows": rows}
+        data = tables if "|" in params["urn"] else tables[params["urn"]]
+        return httpx.Response(200, json={"result": {"diag": 200, "data": data}})
+
+    def client(self):
+        client = AosApiClient("admin", "switch", "https://switch.lab", lazy=True)
+        client._http = httpx.Client(base_url=client.base_url, transport=httpx.MockTransport(self.handler))
+        return client
+
+
+def read(urn, *columns, limit=None):
+    params = {"domain": "mib", "urn": urn, **{f"mibObject{i}": column for i, column in enumerate(columns)}}
+    if limit is not None:
+        params["limit"] = str(limit)
+    return lambda c: c.get("/", params=params)
+
+
+def test_reads_of_different_tables_are_merged_and_split_back():
+    switch = MultiTableSwitch()
+    temperature, fans = switch.client().batch(
+        read("chasEntTempTable", "chasEntTempCurrent"),
+        read("alaChasEntPhysFanTable", "alaChasEntPhysFanStatus"),
+    )
+    assert len(switch.reads) == 1
+    assert switch.reads[0]["urn"] == "chasEntTempTable|alaChasEntPhysFanTable"
+    assert temperature.data["rows"]["1"] == {"chasEntTempCurrent": "chasEntTempCurrent.1"}
+    assert fans.data["rows"]["1"] == {"alaChasEntPhysFanStatus": "alaChasEntPhysFanStatus.1"}
+
+
+def test_reads_of_the_same_table_get_their_own_columns_and_limit():
+    switch = MultiTableSwitch()
+    names, states, everything = switch.client().batch(
+        read("vlanTable", "vlanNumber", "vlanDescription", limit=2),
+        read("vlanTable", "vlanNumber", "vlanAdmStatus", limit=4),
+        read("chasEntTempTable", "chasEntTempCurrent"),
+    )
+    assert len(switch.reads) == 1
+    sent = switch.reads[0]
+    assert sent.get_list("limit") == []
+    assert [sent[f"vlanTable-mibObject{i}"] for i in range(3)] == ["vlanNumber", "vlanDescription", "vlanAdmStatus"]
+    assert list(names.data["rows"]) == ["1", "2"]
+    assert names.data["rows"]["1"] == {"vlanNumber": "vlanNumber.1", "vlanDescription": "vlanDescription.1"}
+    assert list(states.data["rows"]) == ["1", "2", "3", "4"]
+    assert states.data["rows"]["4"] == {"vlanNumber": "vlanNumber.4", "vlanAdmStatus": "vlanAdmStatus.4"}
+    assert len(everything.data["rows"]) == TABLE_SIZE
+
+
+def test_largest_limit_is_sent_when_every_read_has_one():
+    switch = MultiTableSwitch()
+    switch.client().batch(read("vlanTable", "vlanNumber", limit=2), read("vlanTable", "vlanAdmStatus", limit=3))
+    assert switch.reads[0]["limit"] == "3"
+
+
+def test_failed_merged_request_fails_every_read():
+    switch = MultiTableSwitch(diag=400)
+    results = switch.client().batch(read("vlanTable", "vlanNumber"), read("chasEntTempTable", "chasEntTempCurrent"))
+    assert len(switch.reads) == 1
+    assert [(result.success, result.diag, result.error) for result in results] == [(False, 400, "Table not available")] * 2
@@ -0,0 +1,28 @@
+from aos8_api.endpoints.vlan import VlanEndpoint
+from aos8_api.models import ApiResult
+
+
+class WriteClient:
+    def __init__(self):
+        self.posts = []
+
+    def post(self, path, data=None, **kwargs):
+        self.posts.append(data)
+        return ApiResult(success=True, diag=200, data={"written": len(data)})
+
+
+def test_rows_are_written_one_per_request_by_default():
+    client = WriteClient()
+    results = VlanEndpoint(client).create_many([10, 20, 30])
+    assert len(client.posts) == 3
+    assert all(result.success for result in results)
+
+
+def test_packed_rows_get_their_own_results():
+    client = WriteClient()
+    results = VlanEndpoint(client).create_many([10, 20, 30], rows_per_request=3)
+    assert len(client.posts) == 1
+    assert len(results) == 3
+    assert len({id(result) for result in results}) == 3
+    results[0].data["written"] = 0
+    assert results[1].data["written"] != 0
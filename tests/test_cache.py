@@ -0,0 +1,173 @@
+import threading
+import time
+
+import httpx
+import pytest
+
+from aos8_api import cache as cache_module
+from aos8_api.ApiClient import AosApiClient
+from aos8_api.cache import ReadCache
+from aos8_api.models import ApiResult
+from aos8_api.resilience import RetryPolicy
+
+VLANS = "/?domain=mib&urn=vlanTable&mibObject0=vlanDescription"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(cache_module, "time", fake)
+    return fake
+
+
+def switch(base_url, cache, reads):
+    def handler(request):
+        if request.url.path.startswith("/auth"):
+            return httpx.Response(200, json={}, headers={"set-cookie": "wv_sess=abc; Path=/"})
+        if request.method == "GET":
+            reads.append(str(request.url))
+        rows = {"1": {"vlanDescription": base_url}}
+        return httpx.Response(200, json={"result": {"diag": 200, "data": {"rows": rows}}})
+
+    client = AosApiClient("admin", "switch", base_url, lazy=True, cache=cache)
+    client._http = httpx.Client(base_url=client.base_url, transport=httpx.MockTransport(handler))
+    return client
+
+
+def test_entries_expire_after_their_ttl(clock):
+    cache = ReadCache(ttl=30)
+    key = cache.key(VLANS, {}, "https://switch.lab")
+    cache.put(key, ApiResult(success=True, diag=200, data={"rows": {}}), cache.generation)
+    clock.now += 29
+    assert cache.get(key).age == 29
+    clock.now += 1
+    assert cache.get(key) is None
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+    assert cache.urn_stats["vlanTable"].hits == 1
+
+
+def test_cached_data_cannot_be_modified_by_callers():
+    cache = ReadCache()
+    key = cache.key(VLANS, {}, "https://switch.lab")
+    result = ApiResult(success=True, diag=200, data={"rows": {"1": {"vlanDescription": "default"}}})
+    cache.put(key, result, cache.generation)
+    result.data["rows"]["1"]["vlanDescription"] = "changed"
+    cache.get(key).data["rows"].clear()
+    assert cache.get(key).data == {"rows": {"1": {"vlanDescription": "default"}}}
+
+
+def test_switches_sharing_a_cache_do_not_share_entries():
+    cache = ReadCache()
+    reads = []
+    first, second = switch("https://sw1.lab", cache, reads), switch("https://sw2.lab", cache, reads)
+
+    assert first.get(VLANS).data["rows"]["1"]["vlanDescription"] == "https://sw1.lab"
+    assert second.get(VLANS).data["rows"]["1"]["vlanDescription"] == "https://sw2.lab"
+    assert first.get(VLANS).data["rows"]["1"]["vlanDescription"] == "https://sw1.lab"
+    assert len(reads) == 2
+    assert (cache.stats.hits, cache.stats.misses) == (1, 2)
+
+
+def test_write_invalidates_the_table_on_that_switch_only():
+    cache = ReadCache()
+    reads = []
+    first, second = switch("https://sw1.lab", cache, reads), switch("https://sw2.lab", cache, reads)
+    first.get(VLANS)
+    second.get(VLANS)
+
+    first.post("/?domain=mib&urn=vlanTable", data={"mibObject0": "vlanNumber:|10"})
+    first.get(VLANS)
+    second.get(VLANS)
+
+    assert [read.split("/?")[0] for read in reads] == ["https://sw1.lab", "https://sw2.lab", "https://sw1.lab"]
+    assert cache.stats.invalidations == 1
+    assert cache.urn_stats["vlanTable"].invalidations == 1
+
+
+class SlowSwitch:
+    """Serves vlanTable with a description that can be changed, delayed or made to fail."""
+
+    def __init__(self):
+        self.description = "v1"
+        self.reads = 0
+        self.fail = False
+        self.release = threading.Event()
+        self.release.set()
+
+    def handler(self, request):
+        if request.url.path.startswith("/auth"):
+            return httpx.Response(200, json={}, headers={"set-cookie": "wv_sess=abc; Path=/"})
+        self.reads += 1
+        self.release.wait()
+        if self.fail:
+            raise httpx.ConnectError("switch unreachable", request=request)
+        rows = {"1": {"vlanDescription": self.description}}
+        return httpx.Response(200, json={"result": {"diag": 200, "data": {"rows": rows}}})
+
+    def client(self, cache):
+        client = AosApiClient("admin", "switch", "https://switch.lab", lazy=True, cache=cache,
+                              retry_policy=RetryPolicy(attempts=1))
+        client._http = httpx.Client(base_url=client.base_url, transport=httpx.MockTransport(self.handler))
+        return client
+
+
+def description(result):
+    return result.data["rows"]["1"]["vlanDescription"]
+
+
+def wait_for_refreshes(cache):
+    deadline = time.monotonic() + 5
+    while cache._refreshing and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def test_stale_entry_is_served_while_one_refresh_runs(clock):
+    cache = ReadCache(ttl=10, stale_while_revalidate=60)
+    switch = SlowSwitch()
+    client = switch.client(cache)
+    client.get(VLANS)
+
+    clock.now += 15
+    switch.description = "v2"
+    switch.release.clear()
+    stale = [client.get(VLANS) for _ in range(3)]
+    assert [(description(result), result.age) for result in stale] == [("v1", 15)] * 3
+    assert cache.stats.refreshes == 1
+    assert cache.stats.stale_hits == 3
+
+    switch.release.set()
+    wait_for_refreshes(cache)
+    fresh = client.get(VLANS)
+    assert (description(fresh), fresh.age) == ("v2", 0)
+    assert switch.reads == 2
+
+
+def test_failed_refresh_keeps_serving_stale_entry_until_the_window_ends(clock):
+    cache = ReadCache(ttl=10, stale_while_revalidate=60)
+    switch = SlowSwitch()
+    client = switch.client(cache)
+    client.get(VLANS)
+
+    clock.now += 15
+    switch.fail = True
+    assert description(client.get(VLANS)) == "v1"
+    wait_for_refreshes(cache)
+    # The failed refresh released its claim, so the next stale hit tries again.
+    assert description(client.get(VLANS)) == "v1"
+    wait_for_refreshes(cache)
+    assert cache.stats.refreshes == 2
+
+    clock.now += 60
+    switch.fail = False
+    switch.description = "v2"
+    result = client.get(VLANS)
+    assert (description(result), result.age) == ("v2", None)
+    assert switch.reads == 4
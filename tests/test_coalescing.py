@@ -0,0 +1,68 @@
+import asyncio
+import threading
+import time
+
+import httpx
+
+from aos8_api.ApiClient import AosApiClient
+from aos8_api.AsyncApiClient import AsyncAosApiClient
+
+ROWS = {"rows": {"1": {"vlanNumber": "1", "vlanDescription": "default"}}}
+
+
+def test_identical_gets_share_one_request_but_not_their_data():
+    reads = []
+    started = threading.Event()
+
+    def handler(request):
+        if request.url.path.startswith("/auth"):
+            return httpx.Response(200, json={}, headers={"set-cookie": "wv_sess=abc; Path=/"})
+        reads.append(request)
+        started.set()
+        time.sleep(0.2)
+        return httpx.Response(200, json={"result": {"diag": 200, "data": ROWS}})
+
+    client = AosApiClient("admin", "switch", "https://switch.lab", lazy=True)
+    client._http = httpx.Client(base_url=client.base_url, transport=httpx.MockTransport(handler))
+    results = []
+
+    def read():
+        results.append(client.get("/?domain=mib&urn=vlanTable"))
+
+    first = threading.Thread(target=read)
+    first.start()
+    started.wait()
+    second = threading.Thread(target=read)
+    second.start()
+    first.join()
+    second.join()
+
+    assert len(reads) == 1
+    assert results[0].data == results[1].data == ROWS
+    results[0].data["rows"]["1"]["vlanDescription"] = "changed"
+    assert results[1].data["rows"]["1"]["vlanDescription"] == "default"
+
+
+def test_identical_async_gets_share_one_request_but_not_their_data():
+    reads = []
+
+    async def handler(request):
+        if request.url.path.startswith("/auth"):
+            return httpx.Response(200, json={}, headers={"set-cookie": "wv_sess=abc; Path=/"})
+        reads.append(request)
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={"result": {"diag": 200, "data": ROWS}})
+
+    async def main():
+        client = AsyncAosApiClient("admin", "switch", "https://switch.lab", lazy=True)
+        client._http = httpx.AsyncClient(base_url=client.base_url, transport=httpx.MockTransport(handler))
+        async with client:
+            return await asyncio.gather(*(client.get("/?domain=mib&urn=vlanTable") for _ in range(3)))
+
+    results = asyncio.run(main())
+
+    assert len(reads) == 1
+    assert all(result.data == ROWS for result in results)
+    results[0].data["rows"]["1"]["vlanDescription"] = "changed"
+    assert [result.data["rows"]["1"]["vlanDescription"] for result in results[1:]] == ["default", "default"]
+    assert results[1].data is not results[2].data
@@ -0,0 +1,68 @@
+import pytest
+
+from aos8_api import concurrency
+from aos8_api.concurrency import AdaptiveConcurrency
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(concurrency, "time", fake)
+    return fake
+
+
+def request(limiter, clock, latency, path="/domain=mib/vlanTable", status=200):
+    with limiter.acquire(path) as sample:
+        clock.now += latency
+        sample.status = status
+
+
+def test_window_grows_only_while_fully_used(clock):
+    limiter = AdaptiveConcurrency(initial=1, max_limit=4)
+    request(limiter, clock, 0.05)
+    assert limiter.limit == 2
+    # One request at a time no longer fills the window.
+    for _ in range(5):
+        request(limiter, clock, 0.05)
+    assert limiter.limit == 2
+    with limiter.acquire() as first, limiter.acquire() as second:
+        clock.now += 0.05
+        first.status = second.status = 200
+    assert limiter.limit == 2.5
+
+
+def test_slow_response_shrinks_window(clock):
+    limiter = AdaptiveConcurrency(initial=8)
+    request(limiter, clock, 0.05)
+    request(limiter, clock, 0.5)
+    assert limiter.limit == 4
+
+
+def test_server_error_shrinks_window_once_per_burst(clock):
+    limiter = AdaptiveConcurrency(initial=8)
+    with limiter.acquire() as first, limiter.acquire() as second:
+        clock.now += 0.05
+        first.status = second.status = 503
+    assert limiter.limit == 4
+
+
+def test_cli_and_mib_requests_keep_separate_baselines(clock):
+    limiter = AdaptiveConcurrency(initial=8)
+    for _ in range(3):
+        request(limiter, clock, 0.05)
+        request(limiter, clock, 1.0, path="/cli/aos?cmd=show+interfaces")
+    assert limiter.limit == 8
+    assert limiter.baselines == pytest.approx({"mib": 0.05, "cli": 1.0})
+
+    request(limiter, clock, 3.0, path="/cli/aos?cmd=show+interfaces")
+    assert limiter.limit == 4
+    request(limiter, clock, 0.5)
+    assert limiter.limit == 2
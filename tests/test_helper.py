@@ -0,0 +1,40 @@
+from aos8_api.helper import parse_fixed_width_table, parse_output_json, split_interface_detail
+
+VLANS = """\
+ vlan    type   admin   oper    ip    mtu          name
+------+-------+-------+------+------+------+------------------
+1      std       Ena     Ena    Dis   1500    VLAN 1
+20     std       Ena     Dis          1500    my  vlan
+"""
+
+
+def test_columns_follow_the_separator():
+    rows = parse_output_json(VLANS)
+    assert rows[0] == {"vlan": "1", "type": "std", "admin": "Ena", "oper": "Ena", "ip": "Dis", "mtu": "1500", "name": "VLAN 1"}
+    assert rows[1]["ip"] == ""
+    assert rows[1]["name"] == "my  vlan"
+
+
+def test_overflowing_cell_is_not_cut_at_the_column_boundary():
+    table = (
+        "Name    Status  Port\n"
+        "------+-------+-----\n"
+        "uplink-to-core  up  1/1/1\n"
+        "lan     down    1/1/2\n"
+    )
+    headers, rows = parse_fixed_width_table(table)
+    assert headers == ["Name", "Status", "Port"]
+    assert rows == [["uplink-to-core", "up", "1/1/1"], ["lan", "down", "1/1/2"]]
+
+
+def test_multi_port_detail_output_is_split_per_port():
+    output = (
+        "Chassis/Slot/Port  : 1/1/1\n"
+        " Operational Status     : up,\n"
+        "Chassis/Slot/Port  : 1/1/2\n"
+        " Operational Status     : down,\n"
+    )
+    blocks = split_interface_detail(output)
+    assert list(blocks) == ["1/1/1", "1/1/2"]
+    assert blocks["1/1/2"] == "Chassis/Slot/Port  : 1/1/2\n Operational Status     : down,\n"
+    assert split_interface_detail("Slot/Port  : 1/5\n Type : Ethernet,\n") == {"1/5": "Slot/Port  : 1/5\n Type : Ethernet,\n"}
@@ -0,0 +1,107 @@
+import threading
+import time
+
+from aos8_api.endpoints.interface import InterfaceEndpoint
+from aos8_api.models import ApiResult
+
+
+class RecordingClient:
+    show_concurrency = 1
+
+    def __init__(self):
+        self.paths = []
+
+    def get(self, path, params=None, **kwargs):
+        self.paths.append(path)
+        return ApiResult(success=True, diag=200, output="")
+
+
+def test_slot_target_reaches_cli_unchanged_in_a_single_show():
+    client = RecordingClient()
+    result = InterfaceEndpoint(client).show_interface_counters("1/1")
+    assert result.success
+    assert client.paths == ["/cli/aos?cmd=show+interfaces+port+1/1+counters"]
+
+
+def test_port_range_counters_are_shown_once_per_port():
+    client = RecordingClient()
+    result = InterfaceEndpoint(client).show_interface_counters("1/1/1-2")
+    assert len(result.output) == 2
+    assert client.paths == [
+        "/cli/aos?cmd=show+interfaces+port+1/1/1+counters",
+        "/cli/aos?cmd=show+interfaces+port+1/1/2+counters",
+    ]
+
+
+def test_port_list_is_split_per_range():
+    client = RecordingClient()
+    InterfaceEndpoint(client).set_interface("1/1/1-2,1/2/5", "admin-state", "enable")
+    assert client.paths[:2] == [
+        "/cli/aos?cmd=interfaces+port+1/1/1-2+admin-state+enable",
+        "/cli/aos?cmd=interfaces+port+1/2/5+admin-state+enable",
+    ]
+
+
+def detail(port):
+    return f"Chassis/Slot/Port  : {port}\n Operational Status     : up,\n"
+
+
+class ShowClient:
+    """Answers "show interfaces port <range>" with one detail block per port, minus `hidden` ports."""
+
+    def __init__(self, show_concurrency=1, hidden=(), delays=None):
+        self.show_concurrency = show_concurrency
+        self.hidden = set(hidden)
+        self.delays = delays or {}
+        self.paths = []
+        self.answered = []
+        self._lock = threading.Lock()
+
+    def get(self, path, params=None, **kwargs):
+        with self._lock:
+            self.paths.append(path)
+        cmd = path.split("cmd=", 1)[1]
+        if not cmd.startswith("show+interfaces+port+"):
+            return ApiResult(success=True, diag=200, output="")
+        token = cmd.rsplit("+", 1)[1]
+        time.sleep(self.delays.get(token, 0))
+        prefix, _, last = token.rpartition("/")
+        first, _, end = last.partition("-")
+        ports = [f"{prefix}/{n}" for n in range(int(first), int(end or first) + 1)]
+        output = "".join(detail(port) for port in ports if len(ports) == 1 or port not in self.hidden)
+        with self._lock:
+            self.answered.append(token)
+        return ApiResult(success=True, diag=200, output=output)
+
+
+def test_port_ranges_are_shown_with_one_command_each():
+    client = ShowClient()
+    result = InterfaceEndpoint(client).set_interface("1/1/1-3,1/1/5", "admin-state", "enable")
+    assert client.paths[2:] == [
+        "/cli/aos?cmd=show+interfaces+port+1/1/1-3",
+        "/cli/aos?cmd=show+interfaces+port+1/1/5",
+    ]
+    assert [port["Chassis/Slot/Port"] for port in result.output] == ["1/1/1", "1/1/2", "1/1/3", "1/1/5"]
+
+
+def test_port_missing_from_a_range_output_is_shown_on_its_own():
+    client = ShowClient(hidden={"1/1/2"})
+    result = InterfaceEndpoint(client).set_interface("1/1/1-3", "admin-state", "enable")
+    assert client.paths[1:] == [
+        "/cli/aos?cmd=show+interfaces+port+1/1/1-3",
+        "/cli/aos?cmd=show+interfaces+port+1/1/2",
+    ]
+    assert [port["Chassis/Slot/Port"] for port in result.output] == ["1/1/1", "1/1/2", "1/1/3"]
+
+
+def test_concurrent_show_results_keep_port_order():
+    # The first range answers last, so responses arrive out of order.
+    client = ShowClient(show_concurrency=4, delays={"1/1/1-2": 0.2, "1/2/5": 0.1})
+    result = InterfaceEndpoint(client).set_interface("1/3/7,1/1/1-2,1/2/5", "admin-state", "enable")
+    assert sorted(client.paths[3:]) == [
+        "/cli/aos?cmd=show+interfaces+port+1/1/1-2",
+        "/cli/aos?cmd=show+interfaces+port+1/2/5",
+        "/cli/aos?cmd=show+interfaces+port+1/3/7",
+    ]
+    assert client.answered == ["1/3/7", "1/2/5", "1/1/1-2"]
+    assert [port["Chassis/Slot/Port"] for port in result.output] == ["1/1/1", "1/1/2", "1/2/5", "1/3/7"]
@@ -0,0 +1,30 @@
+from aos8_api.endpoints.ip import IPInterfaceEndpoint
+from aos8_api.ifindex import IpInterfaceIndex
+from aos8_api.models import ApiResult
+
+
+class FailingTableClient:
+    refresh = "none"
+
+    def post(self, path, data=None, **kwargs):
+        return ApiResult(success=True, diag=200)
+
+    def get(self, path, params=None, **kwargs):
+        return ApiResult(success=False, diag=503, error="Service unavailable")
+
+
+def test_create_returns_failed_result_when_index_cannot_be_read():
+    result = IPInterfaceEndpoint(FailingTableClient()).create_IP_Interface("int-10", "10.0.10.1", "255.255.255.0", vlan_id=10)
+    assert isinstance(result, ApiResult)
+    assert not result.success
+    assert result.diag == 503
+
+
+def test_index_tracks_names_read_back_and_removed():
+    index = IpInterfaceIndex()
+    index.load([("1", {"ifIndex": 13600001, "alaIpInterfaceName": "int-10"})])
+    index.update(ApiResult(success=True, diag=200, data={"rows": {"2": {"ifIndex": "13600002", "alaIpInterfaceName": "int-20"}}}))
+    assert (index.ifindex("int-10"), index.ifindex("int-20")) == ("13600001", "13600002")
+    index.remove("int-10")
+    assert index.ifindex("int-10") is None
+    assert not index.expired()
@@ -0,0 +1,83 @@
+import logging
+import time
+
+from aos8_api.keepwarm import KeepWarm, _KeepWarmSchedule
+from aos8_api.models import ApiResult
+from aos8_api.session import SessionTracker
+
+
+class FakeSystem:
+    def __init__(self, outcome):
+        self.outcome = outcome
+        self.pings = 0
+
+    def keepAlive(self):
+        self.pings += 1
+        if isinstance(self.outcome, Exception):
+            raise self.outcome
+        return self.outcome
+
+
+class FakeClient:
+    base_url = "https://switch.lab"
+
+    def __init__(self, outcome=None):
+        self._session = SessionTracker(self.base_url, "admin")
+        self.system = FakeSystem(outcome or ApiResult(success=True, diag=200))
+
+
+def test_lifetime_keeps_the_smallest_bounded_idle_time():
+    session = SessionTracker("https://switch.lab", "admin")
+    session.last_used = time.time() - 3 * 3600
+    session.expired()
+    assert session.lifetime == SessionTracker.DEFAULT_LIFETIME
+
+    session.last_used = time.time() - 100
+    session.expired()
+    assert 99 <= session.lifetime <= 101
+
+    session.last_used = time.time() - 200
+    session.expired()
+    assert session.lifetime <= 101
+
+    session.last_used = time.time() - 1
+    session.expired()
+    assert session.lifetime == SessionTracker.MIN_LIFETIME
+
+
+def test_ping_interval_is_capped_at_default_timeout():
+    client = FakeClient()
+    schedule = _KeepWarmSchedule([client], default_timeout=240, margin=0.8, jitter=0, retry_interval=10)
+    assert schedule._due(client) is None
+
+    client._session.last_used = 1000.0
+    client._session.lifetime = 5 * 3600
+    assert schedule._due(client) == 1000.0 + 240 * 0.8
+
+    client._session.lifetime = 100
+    assert schedule._due(client) == 1000.0 + 100 * 0.8
+
+
+def test_failed_pings_are_retried_after_interval_and_logged(caplog):
+    client = FakeClient(ApiResult(success=False, diag=401, error="Unauthorized"))
+    client._session.last_used = time.time() - 3600
+    schedule = _KeepWarmSchedule([client], default_timeout=240, margin=0.8, jitter=0, retry_interval=10)
+    now = time.time()
+    assert schedule._due_clients(now) == [client]
+    assert schedule._due_clients(now + 1) == []
+    assert schedule._due_clients(now + 10) == [client]
+
+    caplog.set_level(logging.WARNING, logger="aos8_api.keepwarm")
+    with KeepWarm([client], retry_interval=60):
+        deadline = time.time() + 2
+        while client.system.pings == 0 and time.time() < deadline:
+            time.sleep(0.01)
+    assert client.system.pings == 1
+    assert "Keep-alive ping to https://switch.lab failed (401)" in caplog.text
+
+
+def test_raising_ping_is_logged(caplog):
+    client = FakeClient(ConnectionError("unreachable"))
+    caplog.set_level(logging.WARNING, logger="aos8_api.keepwarm")
+    KeepWarm._log_ping(client, ConnectionError("unreachable"))
+    assert "unreachable" in caplog.text
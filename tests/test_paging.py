@@ -0,0 +1,53 @@
+import pytest
+
+from aos8_api.models import ApiResult
+from aos8_api.paging import CURSOR_PARAM, FALLBACK_LIMIT, PagingError, iter_mib_rows
+
+
+class PagedClient:
+    """Serves a MIB table in pages, optionally ignoring the paging cursor."""
+
+    def __init__(self, rows, honor_cursor=True):
+        self.rows = rows
+        self.honor_cursor = honor_cursor
+        self.requests = []
+
+    def get(self, path, params=None, **kwargs):
+        self.requests.append(dict(params))
+        indexes = sorted(self.rows, key=int)
+        cursor = params.get(CURSOR_PARAM)
+        if cursor is not None and self.honor_cursor:
+            indexes = [index for index in indexes if int(index) > int(cursor)]
+        page = {index: self.rows[index] for index in indexes[:int(params["limit"])]}
+        return ApiResult(success=True, diag=200, data={"rows": page})
+
+
+PARAMS = {"domain": "mib", "urn": "vlanTable", "mibObject0": "vlanNumber"}
+
+
+def test_pages_through_whole_table():
+    rows = {str(i): {"vlanNumber": str(i)} for i in range(1, 8)}
+    client = PagedClient(rows)
+    assert [index for index, _ in iter_mib_rows(client, PARAMS, page_size=3)] == list(rows)
+    assert len(client.requests) == 3
+
+
+def test_ignored_cursor_falls_back_to_a_single_read():
+    rows = {str(i): {"vlanNumber": str(i)} for i in range(1, 8)}
+    client = PagedClient(rows, honor_cursor=False)
+    with pytest.warns(RuntimeWarning, match=CURSOR_PARAM):
+        indexes = [index for index, _ in iter_mib_rows(client, PARAMS, page_size=3)]
+    assert indexes == list(rows)
+    assert len(client.requests) == 3
+    assert client.requests[-1]["limit"] == str(FALLBACK_LIMIT)
+    assert CURSOR_PARAM not in client.requests[-1]
+
+
+def test_failed_page_raises():
+    class FailingClient:
+        def get(self, path, params=None, **kwargs):
+            return ApiResult(success=False, diag=500, error="boom")
+
+    with pytest.raises(PagingError) as excinfo:
+        list(iter_mib_rows(FailingClient(), PARAMS))
+    assert excinfo.value.result.diag == 500
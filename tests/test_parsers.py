@@ -0,0 +1,114 @@
+"""
+Reference outputs of the CLI parsers on small samples of AOS8 show commands.
+
+The expected values were produced by the parsers before they were rewritten
+for speed, and pin their behaviour.
+"""
+from aos8_api.helper import (
+    parse_interface_accounting,
+    parse_interface_counters,
+    parse_interface_counters_errors,
+    parse_interface_detail,
+    parse_interface_status,
+    parse_output_json,
+    parse_violation_output_to_json,
+)
+
+INTERFACES_STATUS = """\
+ Chas/       Admin   Auto    Detected Speed (Mbps)   Configured Speed (Mbps)   Trap  EEE
+ Slot/Port   Status  Nego    Speed Duplex Pause FEC  Speed Duplex Pause FEC    Link
+-----------+--------+------+------+------+------+----+------+------+------+----+-----+----
+ 1/1/1       en      en      1000    Full    -       DIS     Auto    Auto    -       DIS    dis    dis
+ 1/1/2       dis     en         -       -    -       DIS     Auto    Auto    -       DIS    dis    dis
+"""
+
+INTERFACE_DETAIL = """\
+Chassis/Slot/Port  : 1/1/1
+ Operational Status     : up,
+ Type                   : Ethernet,
+ MAC address            : 2c:fa:a2:00:00:01,
+ BandWidth (Megabits)   :     1000,            Duplex           : Full,
+ Long Frame Size(Bytes) : 9216,                Runt Size(Bytes) : 64,
+ Rx              :
+  Bytes Received  :                  1000, Unicast Frames :                    10,
+  Broadcast Frames:                     0, M-cast Frames  :                     2,
+ Tx              :
+  Bytes Xmitted   :                  2000, Unicast Frames :                    20,
+"""
+
+COUNTERS = """\
+1/1/1,
+  InOctets      =        1000, OutOctets      =        2000,
+  InUcastPkts   =          10, OutUcastPkts   =          20,
+  InMcastPkts   =           0, OutMcastPkts   =           3,
+"""
+
+COUNTERS_ERRORS = """\
+1/1/1,
+  IfInErrors    =        4, Undersize      =        0,
+  Oversize      =        1, IfInErrorRate  =   1.5e-3,
+"""
+
+VIOLATIONS = """\
+Port      Source    Action          Reason          WTR   Time        Max/Remain
+--------+---------+---------------+---------------+-----+-----------+----------
+1/1/3     AG         admin down          lps shutdown    0     300         10/1
+"""
+
+VLANS = """\
+ vlan    type   admin   oper    ip    mtu          name
+------+-------+-------+------+------+------+------------------
+ 1       std    Ena     Ena     Dis   1500    VLAN 1
+ 20      std    Ena     Dis     Dis   1500    servers
+"""
+
+
+def test_interface_status():
+    assert parse_interface_status(INTERFACES_STATUS) == [
+        {"port": "1/1/1", "admin_status": "en", "auto_nego": "en", "det_speed": "1000", "det_duplex": "Full",
+         "det_pause": "-", "det_fec": "DIS", "cfg_speed": "Auto", "cfg_duplex": "Auto", "cfg_pause": "-",
+         "cfg_fec": "DIS", "link_trap": "dis", "eee": "dis"},
+        {"port": "1/1/2", "admin_status": "dis", "auto_nego": "en", "det_speed": "-", "det_duplex": "-",
+         "det_pause": "-", "det_fec": "DIS", "cfg_speed": "Auto", "cfg_duplex": "Auto", "cfg_pause": "-",
+         "cfg_fec": "DIS", "link_trap": "dis", "eee": "dis"},
+    ]
+
+
+def test_interface_detail():
+    assert parse_interface_detail(INTERFACE_DETAIL) == {
+        "Chassis/Slot/Port": "1/1/1",
+        "Operational Status": "up",
+        "Type": "Ethernet",
+        "MAC address": "2c:fa:a2:00:00:01",
+        "BandWidth (Megabits) / Duplex": "Full",
+        "Long Frame Size(Bytes) / Runt Size(Bytes)": "64",
+        "Rx": {"Bytes Received / Unicast Frames": "10", "Broadcast Frames / M-cast Frames": "2"},
+        "Tx": {"Bytes Xmitted / Unicast Frames": "20"},
+    }
+
+
+def test_interface_counters_and_accounting():
+    expected = {"InOctets": 1000, "OutOctets": 2000, "InUcastPkts": 10, "OutUcastPkts": 20,
+                "InMcastPkts": 0, "OutMcastPkts": 3}
+    assert parse_interface_counters(COUNTERS) == expected
+    assert parse_interface_accounting(COUNTERS) == expected
+
+
+def test_interface_counters_errors():
+    assert parse_interface_counters_errors(COUNTERS_ERRORS) == {
+        "IfInErrors": 4, "Undersize": 0, "Oversize": 1, "IfInErrorRate": 0.0015,
+    }
+
+
+def test_violations():
+    assert parse_violation_output_to_json(VIOLATIONS) == [
+        {"port": "1/1/3", "source": "AG", "action": "admin down", "reason": "lps shutdown",
+         "wait_to_restore": 0, "recovery_time": 300, "max_violations": 10, "remaining_violations": 1},
+    ]
+
+
+def test_output_table():
+    assert parse_output_json(VLANS) == [
+        {"vlan": "1", "type": "std", "admin": "Ena", "oper": "Ena", "ip": "Dis", "mtu": "1500", "name": "VLAN 1"},
+        {"vlan": "20", "type": "std", "admin": "Ena", "oper": "Dis", "ip": "Dis", "mtu": "1500", "name": "servers"},
+    ]
@@ -0,0 +1,43 @@
+import httpx
+import pytest
+
+from aos8_api.ApiClient import AosApiClient
+from aos8_api.resilience import RetryPolicy
+
+
+def test_configuration_cli_commands_are_not_retried():
+    policy = RetryPolicy()
+    assert not policy.should_retry("GET", 1, None, "/cli/aos?cmd=vlan+10+admin-state+disable")
+    assert not policy.should_retry("GET", 1, 503, "/cli/aos", {"cmd": "write memory"})
+    assert policy.should_retry("GET", 1, None, "/cli/aos?cmd=show+vlan")
+    assert policy.should_retry("GET", 1, None, "/?domain=mib&urn=vlanTable")
+    assert RetryPolicy(cli_commands=True).should_retry("GET", 1, None, "/cli/aos?cmd=write+memory")
+
+
+def timing_out_client(attempts):
+    def handler(request):
+        if request.url.path.startswith("/auth"):
+            return httpx.Response(200, json={}, headers={"set-cookie": "wv_sess=abc; Path=/"})
+        attempts.append(request.url.params["cmd"])
+        raise httpx.ReadTimeout("timed out", request=request)
+
+    client = AosApiClient("admin", "switch", "https://switch.lab", lazy=True,
+                          retry_policy=RetryPolicy(backoff=0))
+    client._http = httpx.Client(base_url=client.base_url, transport=httpx.MockTransport(handler))
+    return client
+
+
+def test_timed_out_cli_command_is_sent_once():
+    attempts = []
+    client = timing_out_client(attempts)
+    with pytest.raises(httpx.ReadTimeout):
+        client.get("/cli/aos?cmd=interfaces+port+1/1/1+admin-state+disable")
+    assert attempts == ["interfaces port 1/1/1 admin-state disable"]
+
+
+def test_timed_out_show_command_is_retried():
+    attempts = []
+    client = timing_out_client(attempts)
+    with pytest.raises(httpx.ReadTimeout):
+        client.get("/cli/aos?cmd=show+interfaces+port+1/1/1")
+    assert len(attempts) == 3
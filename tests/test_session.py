@@ -0,0 +1,90 @@
+import time
+
+import httpx
+import pytest
+
+from aos8_api.ApiClient import AosApiClient
+from aos8_api.session import FileSessionStore, SessionStore, SessionTracker
+
+
+def test_incomplete_store_fails_on_creation():
+    class LoadOnlyStore(SessionStore):
+        def load(self, base_url, username):
+            return None
+
+    with pytest.raises(TypeError):
+        LoadOnlyStore()
+
+
+def test_file_store_round_trip(tmp_path):
+    store = FileSessionStore(str(tmp_path / "sessions.json"))
+    store.save("https://switch.lab", "admin", {"cookie": "abc"})
+    assert store.load("https://switch.lab", "admin") == {"cookie": "abc"}
+    store.delete("https://switch.lab", "admin")
+    assert store.load("https://switch.lab", "admin") is None
+
+
+class MemoryStore(SessionStore):
+    def __init__(self):
+        self.records = {}
+
+    def load(self, base_url, username):
+        return self.records.get((base_url, username))
+
+    def save(self, base_url, username, record):
+        self.records[(base_url, username)] = dict(record)
+
+    def delete(self, base_url, username):
+        self.records.pop((base_url, username), None)
+
+
+def switch_with_expired_cookie(logins):
+    def handler(request):
+        if request.url.path.startswith("/auth"):
+            logins.append(request)
+            return httpx.Response(200, json={}, headers={"set-cookie": "wv_sess=fresh; Path=/"})
+        if request.headers.get("cookie") != "wv_sess=fresh":
+            return httpx.Response(401, json={})
+        return httpx.Response(200, json={"result": {"diag": 200, "data": {"rows": {}}}})
+
+    return httpx.MockTransport(handler)
+
+
+def test_restored_cookie_rejected_with_401_falls_back_to_login():
+    store = MemoryStore()
+    now = time.time()
+    store.save("https://switch.lab", "admin", {"cookie": "stale", "domain": "", "path": "/",
+                                               "login_time": now - 60, "last_used": now - 10, "lifetime": None})
+    logins = []
+    client = AosApiClient("admin", "switch", "https://switch.lab", session_store=store, lazy=True)
+    client._http = httpx.Client(base_url=client.base_url, transport=switch_with_expired_cookie(logins))
+
+    result = client.get("/?domain=mib&urn=vlanTable")
+
+    assert result.success
+    assert len(logins) == 1
+    assert store.load("https://switch.lab", "admin")["cookie"] == "fresh"
+
+
+def test_stale_cookie_is_not_restored():
+    store = MemoryStore()
+    store.save("https://switch.lab", "admin", {"cookie": "old", "last_used": time.time() - 3600, "lifetime": 36000})
+    tracker = SessionTracker("https://switch.lab", "admin", store)
+    assert not tracker.restore(httpx.Cookies())
+    assert tracker.lifetime == SessionTracker.DEFAULT_LIFETIME
+
+
+def test_last_use_is_saved_on_a_throttled_schedule():
+    store = MemoryStore()
+    cookies = httpx.Cookies()
+    cookies.set("wv_sess", "abc")
+    tracker = SessionTracker("https://switch.lab", "admin", store)
+    tracker.logged_in(cookies)
+    first = store.load("https://switch.lab", "admin")["last_used"]
+
+    tracker.used(cookies)
+    assert store.load("https://switch.lab", "admin")["last_used"] == first
+
+    tracker._saved_at -= SessionTracker.SAVE_INTERVAL
+    tracker.used(cookies)
+    assert store.load("https://switch.lab", "admin")["last_used"] == tracker.last_used > first
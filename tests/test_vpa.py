@@ -0,0 +1,44 @@
+from aos8_api.endpoints.vpa import VlanPortAssociation
+from aos8_api.models import ApiResult
+
+
+class FailingTableClient:
+    def get(self, path, params=None, **kwargs):
+        return ApiResult(success=False, diag=503, error="Service unavailable")
+
+
+def test_unreadable_port_table_reports_port_not_found():
+    results = VlanPortAssociation(FailingTableClient()).create_many([("1/1/22", "10")])
+    assert len(results) == 1
+    assert not results[0].success
+
+
+class SecondPageFailsClient:
+    """Serves one full page of alaMvrpPortConfigTable, then fails."""
+
+    def __init__(self, ports):
+        self.ports = ports
+        self.reads = 0
+        self.posts = []
+
+    def get(self, path, params=None, **kwargs):
+        self.reads += 1
+        if self.reads > 1:
+            return ApiResult(success=False, diag=503, error="Service unavailable")
+        rows = {str(n): {"alaMvrpPortConfigIfIndex": ifindex, "slotPort_ifindex_0": port.replace("/", "\\/")}
+                for n, (port, ifindex) in enumerate(self.ports)}
+        return ApiResult(success=True, diag=200, data={"rows": rows})
+
+    def post(self, path, data=None, **kwargs):
+        self.posts.append(data)
+        return ApiResult(success=True, diag=200, data={})
+
+
+def test_failed_later_page_uses_rows_already_read():
+    ports = [(f"1/1/{port}", str(1000 + port)) for port in range(1, 501)]
+    client = SecondPageFailsClient(ports)
+    results = VlanPortAssociation(client).create_many([("1/1/22", "10"), ("1/1/600", "10")])
+    assert [result.success for result in results] == [True, True]
+    # The first page confirmed the local encoding, so even unlisted ports resolve.
+    assert [post["mibObject1"] for post in client.posts] == ["vpaIfIndex:|1022", "vpaIfIndex:|1600"]
+    assert client.reads == 2